@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:59
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_alter_user_role'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['company_name'], name='user_company_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.contrib import admin
+from .models import ContentDailyStats, ViewerSketch
+
+
+@admin.register(ViewerSketch)
+class ViewerSketchAdmin(admin.ModelAdmin):
+    list_display = ('target_type', 'target_id', 'day', 'unique_viewers')
+    list_filter = ('target_type', 'day')
+    search_fields = ('target_id',)
+    exclude = ('registers',)
+
+    @admin.display(description='Unique viewers (est.)')
+    def unique_viewers(self, obj):
+        from .hll import HyperLogLog
+        return HyperLogLog(obj.registers).count()
+
+
+@admin.register(ContentDailyStats)
+class ContentDailyStatsAdmin(admin.ModelAdmin):
+    list_display = ('content', 'producer', 'day', 'views', 'offers_received', 'offers_accepted', 'lois')
+    list_filter = ('day',)
+    search_fields = ('content__title', 'producer__username', 'producer__company_name')
+    raw_id_fields = ('content', 'producer')
@@ -0,0 +1,84 @@
+"""
+HyperLogLog cardinality sketch (pure Python)
+
+A sketch is 2**PRECISION one-byte registers (4 KB), estimating distinct
+counts with ~1.6% standard error. Sketches merge by taking the register-wise
+maximum, so daily sketches combine into weekly/monthly figures without
+re-reading raw views.
+"""
+import hashlib
+import math
+
+PRECISION = 12
+REGISTER_COUNT = 1 << PRECISION
+_REMAINDER_BITS = 64 - PRECISION
+_ALPHA = 0.7213 / (1 + 1.079 / REGISTER_COUNT)
+
+
+def hash_value(value):
+    """64-bit hash of a string value"""
+    digest = hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+
+def register_update(value):
+    """
+    Map a value to its (register index, rank) pair.
+    The rank is the position of the first 1-bit after the index bits.
+    """
+    hashed = hash_value(value)
+    index = hashed >> _REMAINDER_BITS
+    remainder = hashed & ((1 << _REMAINDER_BITS) - 1)
+    rank = _REMAINDER_BITS - remainder.bit_length() + 1
+    return index, rank
+
+
+class HyperLogLog:
+    """Mutable HyperLogLog sketch backed by a bytearray of registers"""
+
+    def __init__(self, registers=None):
+        if registers is None:
+            self.registers = bytearray(REGISTER_COUNT)
+        else:
+            if len(registers) != REGISTER_COUNT:
+                raise ValueError(f'Expected {REGISTER_COUNT} registers, got {len(registers)}')
+            self.registers = bytearray(registers)
+
+    def add(self, value):
+        """Add a value; returns True if the sketch changed"""
+        index, rank = register_update(value)
+        if self.registers[index] >= rank:
+            return False
+        self.registers[index] = rank
+        return True
+
+    def merge(self, other):
+        """Merge another sketch (or raw registers) into this one in place"""
+        registers = other.registers if isinstance(other, HyperLogLog) else other
+        self.registers = bytearray(map(max, self.registers, registers))
+        return self
+
+    @classmethod
+    def union(cls, sketches):
+        """New sketch estimating the distinct count across all sketches"""
+        result = cls()
+        for sketch in sketches:
+            result.merge(sketch)
+        return result
+
+    def count(self):
+        """Estimated number of distinct values added"""
+        total = 0.0
+        zeros = 0
+        for register in self.registers:
+            total += 2.0 ** -register
+            if register == 0:
+                zeros += 1
+        estimate = _ALPHA * REGISTER_COUNT * REGISTER_COUNT / total
+        # Small-range correction (linear counting)
+        if estimate <= 2.5 * REGISTER_COUNT and zeros:
+            estimate = REGISTER_COUNT * math.log(REGISTER_COUNT / zeros)
+        return int(round(estimate))
+
+    def to_bytes(self):
+        return bytes(self.registers)
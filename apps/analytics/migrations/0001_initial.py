@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ViewerSketch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('target_type', models.CharField(choices=[('content', 'Content'), ('booth', 'Booth')], max_length=10, verbose_name='Target type')),
+                ('target_id', models.PositiveBigIntegerField(verbose_name='Target ID')),
+                ('day', models.DateField(verbose_name='Day')),
+                ('registers', models.BinaryField(help_text='4096 one-byte registers', verbose_name='HyperLogLog registers')),
+            ],
+            options={
+                'verbose_name': 'Viewer sketch',
+                'verbose_name_plural': 'Viewer sketches',
+                'ordering': ['-day'],
+                'constraints': [models.UniqueConstraint(fields=('target_type', 'target_id', 'day'), name='unique_viewer_sketch_per_day')],
+            },
+        ),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:08
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_daily_stats(apps, schema_editor):
+    """
+    Build rollups from existing offers and LOIs. Views counted before daily
+    tracking existed are attributed to the content's creation day.
+    """
+    from collections import defaultdict
+    from django.db.models import Count
+    from django.db.models.functions import TruncDate
+
+    Content = apps.get_model('contents', 'Content')
+    Offer = apps.get_model('offers', 'Offer')
+    LOI = apps.get_model('loi', 'LOI')
+    ContentDailyStats = apps.get_model('analytics', 'ContentDailyStats')
+
+    rows = defaultdict(lambda: defaultdict(int))
+    producers = {}
+
+    contents = Content.objects.annotate(day=TruncDate('created_at')).values(
+        'id', 'producer_id', 'day', 'view_count'
+    )
+    for content in contents:
+        producers[content['id']] = content['producer_id']
+        if content['view_count']:
+            rows[(content['id'], content['day'])]['views'] += content['view_count']
+
+    sources = [
+        ('offers_received', Offer.objects.annotate(day=TruncDate('created_at')), 'content_id'),
+        (
+            'offers_accepted',
+            Offer.objects.filter(status='accepted', responded_at__isnull=False).annotate(
+                day=TruncDate('responded_at')
+            ),
+            'content_id',
+        ),
+        ('lois', LOI.objects.annotate(day=TruncDate('created_at')), 'offer__content_id'),
+    ]
+    for field, queryset, content_field in sources:
+        counts = queryset.values(content_field, 'day').annotate(total=Count('id')).order_by()
+        for row in counts:
+            rows[(row[content_field], row['day'])][field] += row['total']
+
+    ContentDailyStats.objects.bulk_create([
+        ContentDailyStats(
+            producer_id=producers[content_id],
+            content_id=content_id,
+            day=day,
+            **counters
+        )
+        for (content_id, day), counters in rows.items()
+        if content_id in producers
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0001_initial'),
+        ('contents', '0007_exchange_rates_price_usd'),
+        ('loi', '0001_initial'),
+        ('offers', '0004_restore_unique_pending_offer_constraint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Day')),
+                ('views', models.PositiveIntegerField(default=0, verbose_name='Views')),
+                ('offers_received', models.PositiveIntegerField(default=0, verbose_name='Offers received')),
+                ('offers_accepted', models.PositiveIntegerField(default=0, verbose_name='Offers accepted')),
+                ('lois', models.PositiveIntegerField(default=0, verbose_name='LOIs')),
+                ('content', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='contents.content', verbose_name='Content')),
+                ('producer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='content_daily_stats', to=settings.AUTH_USER_MODEL, verbose_name='Producer')),
+            ],
+            options={
+                'verbose_name': 'Content daily stats',
+                'verbose_name_plural': 'Content daily stats',
+                'ordering': ['-day'],
+                'indexes': [models.Index(fields=['producer', 'day'], name='analytics_c_produce_27c372_idx')],
+                'constraints': [models.UniqueConstraint(fields=('content', 'day'), name='unique_content_daily_stats')],
+            },
+        ),
+        migrations.RunPython(backfill_daily_stats, migrations.RunPython.noop),
+    ]
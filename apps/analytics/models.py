@@ -0,0 +1,108 @@
+"""
+Analytics models: per-day unique viewer sketches and content stats rollups
+"""
+from django.conf import settings
+from django.db import models
+
+from .hll import REGISTER_COUNT
+
+
+class ViewerSketch(models.Model):
+    """
+    HyperLogLog sketch of distinct viewers of one content or booth on one day.
+    One fixed-size row (4 KB of registers) per item per day, regardless of
+    how many views it received.
+    """
+
+    TARGET_CONTENT = 'content'
+    TARGET_BOOTH = 'booth'
+    TARGET_CHOICES = [
+        (TARGET_CONTENT, 'Content'),
+        (TARGET_BOOTH, 'Booth'),
+    ]
+
+    target_type = models.CharField(
+        max_length=10,
+        choices=TARGET_CHOICES,
+        verbose_name='Target type'
+    )
+    target_id = models.PositiveBigIntegerField(
+        verbose_name='Target ID'
+    )
+    day = models.DateField(
+        verbose_name='Day'
+    )
+    registers = models.BinaryField(
+        verbose_name='HyperLogLog registers',
+        help_text=f'{REGISTER_COUNT} one-byte registers'
+    )
+
+    class Meta:
+        verbose_name = 'Viewer sketch'
+        verbose_name_plural = 'Viewer sketches'
+        ordering = ['-day']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['target_type', 'target_id', 'day'],
+                name='unique_viewer_sketch_per_day'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.target_type} #{self.target_id} on {self.day}"
+
+
+class ContentDailyStats(models.Model):
+    """
+    Per-content, per-day activity counters, incremented as events happen
+    (view flushes, offers, LOIs) so producer stats are a single range query.
+    """
+
+    producer = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='content_daily_stats',
+        verbose_name='Producer'
+    )
+    content = models.ForeignKey(
+        'contents.Content',
+        on_delete=models.CASCADE,
+        related_name='daily_stats',
+        verbose_name='Content'
+    )
+    day = models.DateField(
+        verbose_name='Day'
+    )
+    views = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Views'
+    )
+    offers_received = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Offers received'
+    )
+    offers_accepted = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Offers accepted'
+    )
+    lois = models.PositiveIntegerField(
+        default=0,
+        verbose_name='LOIs'
+    )
+
+    class Meta:
+        verbose_name = 'Content daily stats'
+        verbose_name_plural = 'Content daily stats'
+        ordering = ['-day']
+        indexes = [
+            models.Index(fields=['producer', 'day']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['content', 'day'],
+                name='unique_content_daily_stats'
+            ),
+        ]
+
+    def __str__(self):
+        return f"Stats for content #{self.content_id} on {self.day}"
@@ -0,0 +1,113 @@
+"""
+Incrementally maintained per-content daily stats (ContentDailyStats)
+
+- increment_daily_stats(field, deltas): add counts to today's rows (one upsert)
+- stats_totals(queryset): lifetime totals
+- stats_timeseries(queryset, start, end, interval): zero-filled series
+"""
+from datetime import timedelta
+
+from django.db import connection
+from django.db.models import F, Sum
+from django.db.models.functions import TruncMonth, TruncWeek
+from django.utils import timezone
+
+from apps.contents.models import Content
+from .models import ContentDailyStats
+
+STATS_FIELDS = ('views', 'offers_received', 'offers_accepted', 'lois')
+
+INTERVAL_DAY = 'day'
+INTERVAL_WEEK = 'week'
+INTERVAL_MONTH = 'month'
+INTERVALS = (INTERVAL_DAY, INTERVAL_WEEK, INTERVAL_MONTH)
+
+
+def increment_daily_stats(field, deltas, day=None):
+    """
+    Add deltas ({content_id: n}) to `field` of each content's row for `day`
+    (default today), creating rows as needed, in a single statement:
+    INSERT ... SELECT ... FROM (VALUES ...) ON CONFLICT (content_id, day) DO UPDATE
+    """
+    if field not in STATS_FIELDS:
+        raise ValueError(f'Unknown stats field: {field}')
+    if not deltas:
+        return
+
+    qn = connection.ops.quote_name
+    table = qn(ContentDailyStats._meta.db_table)
+    content_table = qn(Content._meta.db_table)
+    columns = ', '.join(qn(name) for name in STATS_FIELDS)
+    selected = ', '.join('v.delta' if name == field else '0' for name in STATS_FIELDS)
+    rows = sorted(deltas.items())
+    values = ', '.join(['(%s, %s)'] * len(rows))
+
+    sql = f"""
+        INSERT INTO {table} (producer_id, content_id, day, {columns})
+        SELECT c.producer_id, c.id, %s, {selected}
+        FROM (VALUES {values}) AS v(id, delta)
+        JOIN {content_table} c ON c.id = v.id
+        ON CONFLICT (content_id, day) DO UPDATE
+        SET {qn(field)} = {table}.{qn(field)} + EXCLUDED.{qn(field)}
+    """
+    params = [day or timezone.localdate()] + [value for row in rows for value in row]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+
+
+def _sums():
+    return {name: Sum(name, default=0) for name in STATS_FIELDS}
+
+
+def stats_totals(queryset):
+    """Lifetime totals over a ContentDailyStats queryset"""
+    return queryset.aggregate(**_sums())
+
+
+def _period_start(day, interval):
+    if interval == INTERVAL_WEEK:
+        return day - timedelta(days=day.weekday())
+    if interval == INTERVAL_MONTH:
+        return day.replace(day=1)
+    return day
+
+
+def _next_period(day, interval):
+    if interval == INTERVAL_WEEK:
+        return day + timedelta(days=7)
+    if interval == INTERVAL_MONTH:
+        return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return day + timedelta(days=1)
+
+
+def stats_timeseries(queryset, start, end, interval=INTERVAL_DAY):
+    """
+    Time series of summed counters between start and end (inclusive),
+    grouped by day, week (starting Monday) or month. Periods without
+    activity are included with zero counts.
+
+    Returns:
+        list: [{'period': date, 'views': n, 'offers_received': n, ...}]
+    """
+    queryset = queryset.filter(day__range=(start, end))
+    if interval == INTERVAL_WEEK:
+        queryset = queryset.annotate(period=TruncWeek('day'))
+    elif interval == INTERVAL_MONTH:
+        queryset = queryset.annotate(period=TruncMonth('day'))
+    else:
+        queryset = queryset.annotate(period=F('day'))
+    rows = {
+        row['period']: row
+        for row in queryset.values('period').annotate(**_sums()).order_by('period')
+    }
+
+    series = []
+    period = _period_start(start, interval)
+    while period <= end:
+        row = rows.get(period, {})
+        series.append({
+            'period': period,
+            **{name: row.get(name, 0) for name in STATS_FIELDS},
+        })
+        period = _next_period(period, interval)
+    return series
@@ -0,0 +1,152 @@
+"""
+Unique viewer tracking with per-day HyperLogLog sketches
+
+- record_unique_view(instance, request): add the viewer to today's sketch
+- unique_viewer_summary(target_type, target_ids): today / 7-day / 30-day estimates
+
+A view only touches the database when it raises a register of the
+sketch. The latest registers are cached, so repeat viewers (and most new
+ones, once the sketch fills up) cost a single cache read.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+
+from .hll import HyperLogLog, REGISTER_COUNT, register_update
+from .models import ViewerSketch
+
+SKETCH_CACHE_TIMEOUT = 60 * 60 * 26
+
+TARGET_TYPES = {
+    'contents.Content': ViewerSketch.TARGET_CONTENT,
+    'booths.Booth': ViewerSketch.TARGET_BOOTH,
+}
+
+# Windows reported by unique_viewer_summary: name -> number of days
+SUMMARY_WINDOWS = {
+    'today': 1,
+    'last_7_days': 7,
+    'last_30_days': 30,
+}
+
+
+def client_ip(request):
+    """
+    Client address as seen by the outermost trusted proxy.
+
+    Each of the TRUSTED_PROXY_COUNT proxies in front of the app appends the
+    address it received the request from to X-Forwarded-For, so the client
+    is that many hops from the right. Entries further left are sent by the
+    client and cannot be trusted. Without trusted proxies (or when the header
+    is shorter than expected) REMOTE_ADDR is used.
+    """
+    trusted = getattr(settings, 'TRUSTED_PROXY_COUNT', 0)
+    if trusted > 0:
+        hops = [
+            hop.strip()
+            for hop in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',')
+            if hop.strip()
+        ]
+        if len(hops) >= trusted:
+            return hops[-trusted]
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def viewer_key(request):
+    """
+    Identify the viewer: user id when logged in, otherwise a fingerprint of
+    client IP and user agent. Only a hash of the key is stored.
+    """
+    if request.user.is_authenticated:
+        return f'user:{request.user.pk}'
+    ip = client_ip(request)
+    user_agent = request.META.get('HTTP_USER_AGENT', '')
+    return f'anon:{ip}|{user_agent}'
+
+
+def _sketch_cache_key(target_type, target_id, day):
+    return f'hll:{target_type}:{target_id}:{day.isoformat()}'
+
+
+def _raise_register(target_type, target_id, day, index, rank):
+    """
+    Upsert today's sketch row, raising one register to `rank` in place.
+    Returns the row's registers after the update.
+    """
+    initial = bytearray(REGISTER_COUNT)
+    initial[index] = rank
+    table = connection.ops.quote_name(ViewerSketch._meta.db_table)
+    sql = f"""
+        INSERT INTO {table} (target_type, target_id, day, registers)
+        VALUES (%s, %s, %s, %s)
+        ON CONFLICT (target_type, target_id, day) DO UPDATE
+        SET registers = set_byte({table}.registers, %s, %s)
+        WHERE get_byte({table}.registers, %s) < %s
+        RETURNING registers
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [
+            target_type, target_id, day, bytes(initial),
+            index, rank, index, rank,
+        ])
+        row = cursor.fetchone()
+    if row is not None:
+        return bytes(row[0])
+    # Register was already at least `rank` (raised by another process)
+    return bytes(ViewerSketch.objects.values_list('registers', flat=True).get(
+        target_type=target_type, target_id=target_id, day=day
+    ))
+
+
+def record_unique_view(instance, request):
+    """Add the requesting viewer to today's sketch for a Content or Booth"""
+    target_type = TARGET_TYPES[type(instance)._meta.label]
+    day = timezone.localdate()
+    index, rank = register_update(viewer_key(request))
+
+    cache_key = _sketch_cache_key(target_type, instance.pk, day)
+    registers = cache.get(cache_key)
+    if registers is not None and registers[index] >= rank:
+        return
+
+    registers = _raise_register(target_type, instance.pk, day, index, rank)
+    cache.set(cache_key, registers, SKETCH_CACHE_TIMEOUT)
+
+
+def unique_viewers(target_type, target_ids, start, end):
+    """Estimated distinct viewers across targets between two dates (inclusive)"""
+    registers = ViewerSketch.objects.filter(
+        target_type=target_type,
+        target_id__in=target_ids,
+        day__range=(start, end),
+    ).values_list('registers', flat=True)
+    return HyperLogLog.union(registers).count()
+
+
+def unique_viewer_summary(target_type, target_ids):
+    """
+    Estimated distinct viewers across targets for each SUMMARY_WINDOWS window.
+    Sketches for the longest window are fetched once and merged per window.
+
+    Returns:
+        dict: {'today': n, 'last_7_days': n, 'last_30_days': n}
+    """
+    today = timezone.localdate()
+    start = today - timedelta(days=max(SUMMARY_WINDOWS.values()) - 1)
+    rows = ViewerSketch.objects.filter(
+        target_type=target_type,
+        target_id__in=target_ids,
+        day__range=(start, today),
+    ).values_list('day', 'registers')
+
+    sketches = {name: HyperLogLog() for name in SUMMARY_WINDOWS}
+    for day, registers in rows:
+        age = (today - day).days
+        for name, days in SUMMARY_WINDOWS.items():
+            if age < days:
+                sketches[name].merge(registers)
+
+    return {name: sketch.count() for name, sketch in sketches.items()}
@@ -0,0 +1,43 @@
+"""
+Signal handlers keeping ContentDailyStats in sync with views, offers and LOIs
+"""
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.contents.models import Content
+from apps.core.constants import OFFER_STATUS_ACCEPTED
+from apps.core.view_counter import views_flushed
+from apps.loi.models import LOI
+from apps.offers.models import Offer
+from .rollups import increment_daily_stats
+
+
+@receiver(views_flushed, sender=Content)
+def count_content_views(sender, deltas, **kwargs):
+    """Add flushed content views to today's rollup rows"""
+    increment_daily_stats('views', deltas)
+
+
+@receiver(post_save, sender=Offer)
+def count_offer_activity(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """
+    Count new offers, and acceptances (Offer.accept saves with update_fields
+    including 'status', so other saves of an accepted offer are not recounted)
+    """
+    if raw:
+        return
+    if created:
+        increment_daily_stats('offers_received', {instance.content_id: 1})
+    elif (
+        instance.status == OFFER_STATUS_ACCEPTED
+        and update_fields is not None
+        and 'status' in update_fields
+    ):
+        increment_daily_stats('offers_accepted', {instance.content_id: 1})
+
+
+@receiver(post_save, sender=LOI)
+def count_loi(sender, instance, created, raw=False, **kwargs):
+    """Count LOIs issued per content"""
+    if created and not raw:
+        increment_daily_stats('lois', {instance.offer.content_id: 1})
@@ -0,0 +1,225 @@
+"""
+Tests for the HyperLogLog sketch and the daily stats rollup
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+from importlib import import_module
+
+from django.apps import apps as django_apps
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from apps.accounts.models import User
+from apps.contents.models import Content
+from apps.core.constants import OFFER_STATUS_ACCEPTED
+from apps.loi.models import LOI
+from apps.offers.models import Offer
+from .hll import HyperLogLog, REGISTER_COUNT
+from .models import ContentDailyStats
+from .rollups import (
+    INTERVAL_DAY, INTERVAL_MONTH, INTERVAL_WEEK, increment_daily_stats, stats_timeseries,
+)
+from .services import viewer_key
+
+
+class HyperLogLogTestCase(SimpleTestCase):
+    """Test cardinality estimates and merging (no database required)"""
+
+    def test_small_counts_are_near_exact(self):
+        """Test linear counting keeps small cardinalities accurate"""
+        sketch = HyperLogLog()
+        for i in range(50):
+            sketch.add(f'user:{i}')
+            sketch.add(f'user:{i}')  # repeat views are not counted twice
+
+        self.assertEqual(sketch.count(), 50)
+
+    def test_large_count_within_error_bound(self):
+        """Test the estimate stays within a few standard errors"""
+        sketch = HyperLogLog()
+        for i in range(20000):
+            sketch.add(f'anon:10.0.{i}')
+
+        self.assertAlmostEqual(sketch.count(), 20000, delta=20000 * 0.05)
+
+    def test_merge_counts_the_union(self):
+        """Test merged daily sketches count overlapping viewers once"""
+        monday, tuesday = HyperLogLog(), HyperLogLog()
+        for i in range(1000):
+            monday.add(f'user:{i}')
+        for i in range(500, 1500):
+            tuesday.add(f'user:{i}')
+
+        week = HyperLogLog.union([monday, tuesday.to_bytes()])
+
+        self.assertAlmostEqual(week.count(), 1500, delta=1500 * 0.05)
+        self.assertEqual(len(week.to_bytes()), REGISTER_COUNT)
+
+    def test_add_reports_register_changes(self):
+        """Test add() is False for values already reflected in the sketch"""
+        sketch = HyperLogLog()
+        self.assertTrue(sketch.add('user:1'))
+        self.assertFalse(sketch.add('user:1'))
+
+
+
+class ViewerKeyTestCase(SimpleTestCase):
+    """Test anonymous viewers are identified by an address the client cannot forge"""
+
+    def _key(self, forwarded_for=None, remote_addr='10.0.0.1'):
+        extra = {'REMOTE_ADDR': remote_addr, 'HTTP_USER_AGENT': 'agent'}
+        if forwarded_for is not None:
+            extra['HTTP_X_FORWARDED_FOR'] = forwarded_for
+        request = RequestFactory().get('/', **extra)
+        request.user = AnonymousUser()
+        return viewer_key(request)
+
+    @override_settings(TRUSTED_PROXY_COUNT=0)
+    def test_forwarded_for_is_ignored_without_trusted_proxies(self):
+        """Test REMOTE_ADDR is used when no proxy is trusted"""
+        self.assertEqual(self._key('1.1.1.1'), 'anon:10.0.0.1|agent')
+
+    @override_settings(TRUSTED_PROXY_COUNT=1)
+    def test_rotating_spoofed_hops_does_not_change_the_key(self):
+        """Test only the hop appended by the trusted proxy is used"""
+        self.assertEqual(self._key('1.1.1.1, 203.0.113.7'), 'anon:203.0.113.7|agent')
+        self.assertEqual(self._key('2.2.2.2, 203.0.113.7'), 'anon:203.0.113.7|agent')
+
+    @override_settings(TRUSTED_PROXY_COUNT=2)
+    def test_client_is_counted_from_the_right(self):
+        """Test with two proxies the client is the second hop from the right"""
+        self.assertEqual(
+            self._key('1.1.1.1, 203.0.113.7, 10.1.0.2'), 'anon:203.0.113.7|agent'
+        )
+        # Fewer hops than proxies: the request did not come through them
+        self.assertEqual(self._key('203.0.113.7'), 'anon:10.0.0.1|agent')
+
+def create_user(username, role):
+    return User.objects.create_user(
+        username=username,
+        email=f'{username}@example.com',
+        password='password123',
+        role=role,
+        company_name=username.title(),
+    )
+
+
+def create_content(producer, title='Content', **kwargs):
+    return Content.objects.create(
+        producer=producer,
+        title=title,
+        description=f'{title} description',
+        genre_tags=['drama'],
+        price=Decimal('100.00'),
+        duration_seconds=60,
+        status='public',
+        **kwargs
+    )
+
+
+class DailyStatsRollupTestCase(TestCase):
+    """Test the rollup upsert and zero-filled time series"""
+
+    def setUp(self):
+        self.producer = create_user('studio', User.Role.CREATOR)
+        self.first = create_content(self.producer, 'First')
+        self.second = create_content(self.producer, 'Second')
+
+    def _row(self, content, day):
+        return ContentDailyStats.objects.get(content=content, day=day)
+
+    def test_increment_creates_and_adds_to_rows(self):
+        """Test the upsert creates missing rows and adds to existing ones"""
+        day = date(2025, 3, 10)
+
+        increment_daily_stats('views', {self.first.pk: 3}, day=day)
+        increment_daily_stats('views', {self.first.pk: 2, self.second.pk: 1}, day=day)
+        increment_daily_stats('lois', {self.first.pk: 1}, day=day)
+
+        first = self._row(self.first, day)
+        self.assertEqual((first.views, first.lois, first.offers_received), (5, 1, 0))
+        self.assertEqual(first.producer_id, self.producer.pk)
+        self.assertEqual(self._row(self.second, day).views, 1)
+        self.assertEqual(ContentDailyStats.objects.filter(day=day).count(), 2)
+
+    def test_increment_rejects_unknown_field(self):
+        """Test only rollup counters can be incremented"""
+        with self.assertRaises(ValueError):
+            increment_daily_stats('producer_id', {self.first.pk: 1})
+
+    def test_daily_series_is_zero_filled(self):
+        """Test days without activity are reported with zero counts"""
+        increment_daily_stats('views', {self.first.pk: 4, self.second.pk: 1}, day=date(2025, 3, 10))
+        increment_daily_stats('views', {self.first.pk: 2}, day=date(2025, 3, 12))
+
+        series = stats_timeseries(
+            ContentDailyStats.objects.all(), date(2025, 3, 9), date(2025, 3, 12), INTERVAL_DAY
+        )
+
+        self.assertEqual(
+            [(row['period'], row['views']) for row in series],
+            [(date(2025, 3, 9), 0), (date(2025, 3, 10), 5), (date(2025, 3, 11), 0), (date(2025, 3, 12), 2)]
+        )
+
+    def test_weekly_and_monthly_grouping(self):
+        """Test weeks start on Monday and months on the 1st"""
+        increment_daily_stats('views', {self.first.pk: 1}, day=date(2025, 3, 2))   # Sunday
+        increment_daily_stats('views', {self.first.pk: 2}, day=date(2025, 3, 3))   # Monday
+        increment_daily_stats('views', {self.first.pk: 4}, day=date(2025, 4, 30))
+        queryset = ContentDailyStats.objects.all()
+
+        weeks = stats_timeseries(queryset, date(2025, 3, 1), date(2025, 3, 16), INTERVAL_WEEK)
+        months = stats_timeseries(queryset, date(2025, 2, 15), date(2025, 4, 30), INTERVAL_MONTH)
+
+        self.assertEqual(
+            [(row['period'], row['views']) for row in weeks],
+            [(date(2025, 2, 24), 1), (date(2025, 3, 3), 2), (date(2025, 3, 10), 0)]
+        )
+        self.assertEqual(
+            [(row['period'], row['views']) for row in months],
+            [(date(2025, 2, 1), 0), (date(2025, 3, 1), 3), (date(2025, 4, 1), 4)]
+        )
+
+
+class DailyStatsBackfillTestCase(TestCase):
+    """Test the 0002 migration rebuilds rollups from existing rows"""
+
+    def test_backfill_from_views_offers_and_lois(self):
+        """Test views land on the creation day and offers/LOIs on their own days"""
+        producer = create_user('studio', User.Role.CREATOR)
+        buyers = [create_user(f'buyer{i}', User.Role.BUYER) for i in range(2)]
+        content = create_content(producer, view_count=7)
+        created_day = timezone.localdate() - timedelta(days=10)
+        Content.objects.filter(pk=content.pk).update(
+            created_at=timezone.now() - timedelta(days=10)
+        )
+
+        accepted = Offer.objects.create(
+            content=content, buyer=buyers[0], offered_price=Decimal('90.00')
+        )
+        Offer.objects.create(content=content, buyer=buyers[1], offered_price=Decimal('80.00'))
+        responded_at = timezone.now() - timedelta(days=1)
+        Offer.objects.filter(pk=accepted.pk).update(
+            status=OFFER_STATUS_ACCEPTED, responded_at=responded_at
+        )
+        accepted.refresh_from_db()
+        LOI.create_from_offer(accepted)
+
+        ContentDailyStats.objects.all().delete()
+        migration = import_module('apps.analytics.migrations.0002_content_daily_stats')
+        migration.backfill_daily_stats(django_apps, None)
+
+        rows = {
+            row.day: (row.views, row.offers_received, row.offers_accepted, row.lois)
+            for row in ContentDailyStats.objects.filter(content=content)
+        }
+        today = timezone.localdate()
+        self.assertEqual(rows, {
+            created_day: (7, 0, 0, 0),
+            today - timedelta(days=1): (0, 0, 1, 0),
+            today: (0, 2, 0, 1),
+        })
+        self.assertTrue(
+            ContentDailyStats.objects.filter(content=content, producer=producer).exists()
+        )
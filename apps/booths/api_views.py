@@ -1,15 +1,19 @@
 """
 API views for public booth profiles
 """
+from django.db.models import Count, Max
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
 from rest_framework import status
-from django.db.models import F
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 
+from apps.analytics.services import record_unique_view
+from apps.core.conditional import ConditionalGet
+from apps.core.fieldsets import FIELDSET_PARAMETERS, FieldsetError, parse_fieldset
 from apps.core.response import success_response, error_response, paginated_response
 from apps.core.constants import CONTENT_STATUS_PUBLIC
-from apps.contents.serializers import ContentPublicSerializer
+from apps.contents.serializers import ContentPublicSerializer, ContentPublicValuesSerializer
+from .detail_cache import get_booth_detail
 from .models import Booth
 from .serializers import BoothPublicSerializer
 
@@ -20,29 +24,50 @@ class BoothDetailView(APIView):
     permission_classes = [AllowAny]
 
     @extend_schema(
+        parameters=FIELDSET_PARAMETERS,
         responses={
             200: BoothPublicSerializer,
+            304: OpenApiResponse(description='Not modified (If-None-Match)'),
+            400: OpenApiResponse(description='Unknown fields'),
             404: OpenApiResponse(description='Booth not found')
         }
     )
     def get(self, request, slug):
         """Get booth profile by slug"""
         try:
-            booth = Booth.objects.select_related('producer').get(slug=slug)
-        except Booth.DoesNotExist:
-            return error_response(
-                message="Booth not found",
-                status_code=status.HTTP_404_NOT_FOUND
-            )
+            fields = parse_fieldset(request, BoothPublicSerializer)
+        except FieldsetError as e:
+            return error_response(message=str(e), status_code=status.HTTP_400_BAD_REQUEST)
+
+        # Serialized payload and validators from the object cache (no queries when hot)
+        entry = get_booth_detail(slug)
+        if entry is None:
+            return self.not_found()
 
-        # Increment view count (atomic)
-        Booth.objects.filter(pk=booth.pk).update(view_count=F('view_count') + 1)
-        booth.refresh_from_db(fields=['view_count'])
+        conditional = ConditionalGet(request, *entry['validators'])
 
-        serializer = BoothPublicSerializer(booth)
-        return success_response(
-            data=serializer.data,
+        # Record view (buffered) and unique viewer, also when answering 304
+        booth = Booth(pk=entry['id'], slug=slug, view_count=entry['data']['view_count'])
+        booth.increment_view_count()
+        record_unique_view(booth, request)
+
+        not_modified = conditional.not_modified()
+        if not_modified is not None:
+            return not_modified
+
+        data = dict(entry['data'], view_count=booth.view_count)
+        if fields is not None:
+            data = {name: data[name] for name in fields}
+        return conditional.finalize(success_response(
+            data=data,
             message="Booth profile retrieved successfully"
+        ))
+
+    @staticmethod
+    def not_found():
+        return error_response(
+            message="Booth not found",
+            status_code=status.HTTP_404_NOT_FOUND
         )
 
 
@@ -52,13 +77,21 @@ class BoothContentsView(APIView):
     permission_classes = [AllowAny]
 
     @extend_schema(
+        parameters=FIELDSET_PARAMETERS,
         responses={
             200: ContentPublicSerializer(many=True),
+            304: OpenApiResponse(description='Not modified (If-None-Match)'),
+            400: OpenApiResponse(description='Unknown fields'),
             404: OpenApiResponse(description='Booth not found')
         }
     )
     def get(self, request, slug):
         """Get all public contents from booth"""
+        try:
+            fields = parse_fieldset(request, ContentPublicSerializer)
+        except FieldsetError as e:
+            return error_response(message=str(e), status_code=status.HTTP_400_BAD_REQUEST)
+
         try:
             booth = Booth.objects.select_related('producer').get(slug=slug)
         except Booth.DoesNotExist:
@@ -72,9 +105,17 @@ class BoothContentsView(APIView):
             status=CONTENT_STATUS_PUBLIC
         ).order_by('-created_at')
 
-        return paginated_response(
+        # Validators from one aggregate: answer 304 before fetching the page
+        validators = queryset.order_by().aggregate(latest=Max('updated_at'), count=Count('id'))
+        conditional = ConditionalGet(request, booth.producer.updated_at, *validators.values())
+        not_modified = conditional.not_modified()
+        if not_modified:
+            return not_modified
+
+        return conditional.finalize(paginated_response(
             queryset,
-            ContentPublicSerializer,
+            ContentPublicValuesSerializer,
             request,
-            message=f"Contents from {booth.slug} retrieved successfully"
-        )
+            message=f"Contents from {booth.slug} retrieved successfully",
+            fields=fields
+        ))
@@ -0,0 +1,63 @@
+"""
+Cached BoothPublicSerializer payloads (see apps.core.object_cache)
+
+Entries depend on the booth, its producer and the producer's contents
+(content_count); the stamps are bumped from post_save handlers.
+
+Unknown slugs are remembered in a negative cache under the booth stamp,
+which is bumped when a booth with that slug is created.
+"""
+from apps.contents.detail_cache import producer_contents_stamp, producer_stamp
+from apps.core.object_cache import ObjectCache, read_stamps
+from .models import Booth
+from .serializers import BoothPublicSerializer
+
+booth_detail_cache = ObjectCache('booth-detail')
+missing_booth_cache = ObjectCache(
+    'booth-missing', timeout_setting='NEGATIVE_CACHE_TIMEOUT', default_timeout=60
+)
+
+
+def booth_stamp(slug):
+    return f'booth:{slug}'
+
+
+def get_booth(slug, tokens=None):
+    """Booth (with producer) by slug, or None (remembered in the negative cache)"""
+    if missing_booth_cache.get(slug) is not None:
+        return None
+
+    if tokens is None:
+        tokens = read_stamps([booth_stamp(slug)])
+    booth = Booth.objects.select_related('producer').filter(slug=slug).first()
+    if booth is None:
+        missing_booth_cache.set(slug, True, tokens)
+    return booth
+
+
+def get_booth_detail(slug):
+    """
+    Detail entry for a booth, or None when it does not exist:
+    {'id': booth pk, 'data': serialized payload, 'validators': (...)}
+    """
+    entry = booth_detail_cache.get(slug)
+    if entry is not None:
+        return entry
+
+    tokens = read_stamps([booth_stamp(slug)])
+    booth = get_booth(slug, tokens)
+    if booth is None:
+        return None
+
+    tokens.update(read_stamps([
+        producer_stamp(booth.producer_id),
+        producer_contents_stamp(booth.producer_id),
+    ]))
+    data = dict(BoothPublicSerializer(booth).data)
+    entry = {
+        'id': booth.pk,
+        'data': data,
+        'validators': (booth.updated_at, booth.producer.updated_at, data['content_count']),
+    }
+    booth_detail_cache.set(slug, entry, tokens)
+    return entry
@@ -62,6 +62,6 @@ class Booth(models.Model):
         return timezone.now() < self.boost_expires_at
 
     def increment_view_count(self):
-        """Increment view count atomically"""
-        from django.db.models import F
-        Booth.objects.filter(pk=self.pk).update(view_count=F('view_count') + 1)
+        """Record a view (buffered; see apps.core.view_counter)"""
+        from apps.core.view_counter import record_view
+        record_view(self)
@@ -2,10 +2,11 @@
 Serializers for Booth model
 """
 from rest_framework import serializers
+from apps.core.fieldsets import SparseFieldsetMixin
 from .models import Booth
 
 
-class BoothPublicSerializer(serializers.ModelSerializer):
+class BoothPublicSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Public serializer for booth profile"""
 
     producer_name = serializers.CharField(source='producer.company_name', read_only=True)
@@ -1,10 +1,15 @@
 """
-Signal handlers for Booth auto-creation
+Signal handlers for Booth auto-creation and cache invalidation
 """
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.conf import settings
+from apps.contents.detail_cache import producer_stamp
+from apps.core.object_cache import bump_stamps
+from apps.core.page_cache import invalidate_page_cache
 from apps.core.utils import generate_unique_slug
+from .detail_cache import booth_stamp
+from .models import Booth
 
 
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
@@ -14,8 +19,6 @@ def create_booth_for_producer(sender, instance, created, **kwargs):
     Business Rule: Producer signup → Booth auto-creation
     """
     if created and instance.role == 'creator':
-        from apps.booths.models import Booth
-
         # Generate unique slug from company name or username
         base_slug = instance.company_name or instance.username
         unique_slug = generate_unique_slug(Booth, base_slug, slug_field='slug')
@@ -29,3 +32,39 @@ def create_booth_for_producer(sender, instance, created, **kwargs):
         # Update user's booth_slug field
         instance.booth_slug = unique_slug
         instance.save(update_fields=['booth_slug'])
+
+
+@receiver(pre_save, sender=Booth)
+def remember_previous_slug(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Snapshot the stored slug so a rename also expires entries cached under it"""
+    instance._previous_slug = None
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and 'slug' not in update_fields:
+        return
+    instance._previous_slug = Booth.objects.filter(pk=instance.pk).values_list('slug', flat=True).first()
+
+
+@receiver(post_save, sender=Booth)
+@receiver(post_delete, sender=Booth)
+def invalidate_booth_caches(sender, instance, raw=False, **kwargs):
+    """Booth pages and cached booth payloads (under the new and any previous slug)"""
+    if raw:
+        return
+    invalidate_page_cache()
+    stamps = {booth_stamp(instance.slug), producer_stamp(instance.producer_id)}
+    previous_slug = getattr(instance, '_previous_slug', None)
+    if previous_slug:
+        stamps.add(booth_stamp(previous_slug))
+    bump_stamps(*stamps)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_producer_caches(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """Producer profile fields are shown on booth, browse and detail responses (logins are ignored)"""
+    if raw or created or instance.role != 'creator':
+        return
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    invalidate_page_cache()
+    bump_stamps(producer_stamp(instance.pk))
@@ -0,0 +1,56 @@
+"""
+Tests for booth cache invalidation
+"""
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.accounts.models import User
+from apps.core.object_cache import read_stamps
+from .detail_cache import booth_stamp
+from .models import Booth
+
+
+class BoothSlugChangeTestCase(TestCase):
+    """Test renaming a booth expires payloads cached under the old slug"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        producer = User.objects.create_user(
+            username='studio',
+            email='studio@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            company_name='Studio',
+        )
+        self.booth = Booth.objects.get(producer=producer)
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_old_slug_is_not_served_after_rename(self):
+        """Test the cached detail of the old slug 404s once the booth is renamed"""
+        old_url = reverse('booths_api:booth_detail', args=[self.booth.slug])
+        self.assertEqual(self.client.get(old_url).status_code, 200)
+
+        self.booth.slug = 'renamed-studio'
+        self.booth.save()
+
+        self.assertEqual(self.client.get(old_url).status_code, 404)
+        new_url = reverse('booths_api:booth_detail', args=['renamed-studio'])
+        self.assertEqual(self.client.get(new_url).status_code, 200)
+
+    def test_rename_bumps_old_and_new_slug_stamps(self):
+        """Test entries keyed by either slug (incl. negative cache hits) are expired"""
+        old_slug = self.booth.slug
+        stamps = [booth_stamp(old_slug), booth_stamp('renamed-studio')]
+        before = read_stamps(stamps)
+
+        self.booth.slug = 'renamed-studio'
+        self.booth.save(update_fields=['slug', 'updated_at'])
+
+        after = read_stamps(stamps)
+        for stamp in stamps:
+            self.assertNotEqual(after[stamp], before[stamp])
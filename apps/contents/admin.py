@@ -2,18 +2,18 @@
 Admin configuration for Content model
 """
 from django.contrib import admin
-from .models import Content
+from .models import BuyerFeed, Content, ContentSimilarity, ExchangeRate, SavedSearch, SavedSearchMatch
 
 
 @admin.register(Content)
 class ContentAdmin(admin.ModelAdmin):
     list_display = (
         'title', 'producer', 'rating', 'status',
-        'price', 'currency', 'release_target', 'view_count', 'created_at'
+        'price', 'currency', 'price_usd', 'release_target', 'view_count', 'created_at'
     )
     list_filter = ('status', 'rating', 'currency', 'created_at')
     search_fields = ('title', 'description', 'producer__username', 'producer__company_name')
-    readonly_fields = ('view_count', 'created_at', 'updated_at', 'deleted_at')
+    readonly_fields = ('price_usd', 'view_count', 'created_at', 'updated_at', 'deleted_at')
     list_per_page = 50
 
     fieldsets = (
@@ -27,7 +27,7 @@ class ContentAdmin(admin.ModelAdmin):
             )
         }),
         ('Pricing', {
-            'fields': ('price', 'currency')
+            'fields': ('price', 'currency', 'price_usd')
         }),
         ('Status & Visibility', {
             'fields': ('status',)
@@ -40,3 +40,37 @@ class ContentAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         """Include soft-deleted items in admin"""
         return Content.objects.all()
+
+
+@admin.register(ExchangeRate)
+class ExchangeRateAdmin(admin.ModelAdmin):
+    list_display = ('currency', 'usd_rate', 'updated_at')
+    readonly_fields = ('updated_at',)
+
+
+@admin.register(ContentSimilarity)
+class ContentSimilarityAdmin(admin.ModelAdmin):
+    list_display = ('content', 'rank', 'similar', 'score')
+    raw_id_fields = ('content', 'similar')
+
+
+@admin.register(BuyerFeed)
+class BuyerFeedAdmin(admin.ModelAdmin):
+    list_display = ('buyer', 'updated_at')
+    raw_id_fields = ('buyer',)
+    readonly_fields = ('entries', 'updated_at')
+
+
+@admin.register(SavedSearch)
+class SavedSearchAdmin(admin.ModelAdmin):
+    list_display = ('__str__', 'buyer', 'search', 'genre_mode', 'currency', 'created_at')
+    list_filter = ('genre_mode', 'currency')
+    search_fields = ('name', 'search', 'buyer__username')
+    raw_id_fields = ('buyer',)
+
+
+@admin.register(SavedSearchMatch)
+class SavedSearchMatchAdmin(admin.ModelAdmin):
+    list_display = ('saved_search', 'content', 'created_at', 'notified_at')
+    list_filter = ('notified_at',)
+    raw_id_fields = ('saved_search', 'content')
@@ -2,12 +2,29 @@
 API URL routing for content endpoints
 """
 from django.urls import path
-from .api_views import ContentListView, ContentDetailView
+from .api_views import (
+    ContentListView,
+    ContentDetailView,
+    ContentFeedView,
+    ContentSimilarView,
+    ContentSuggestView,
+    ContentFacetsView,
+    SavedSearchListCreateView,
+    SavedSearchDetailView,
+    SavedSearchMatchesView
+)
 
 app_name = 'contents_api'
 
 urlpatterns = [
     # Public content browsing
     path('', ContentListView.as_view(), name='content_list'),
+    path('feed/', ContentFeedView.as_view(), name='content_feed'),
+    path('suggest/', ContentSuggestView.as_view(), name='content_suggest'),
+    path('facets/', ContentFacetsView.as_view(), name='content_facets'),
+    path('saved-searches/', SavedSearchListCreateView.as_view(), name='saved_search_list_create'),
+    path('saved-searches/<int:pk>/', SavedSearchDetailView.as_view(), name='saved_search_detail'),
+    path('saved-searches/<int:pk>/matches/', SavedSearchMatchesView.as_view(), name='saved_search_matches'),
     path('<int:pk>/', ContentDetailView.as_view(), name='content_detail'),
+    path('<int:pk>/similar/', ContentSimilarView.as_view(), name='content_similar'),
 ]
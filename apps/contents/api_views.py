@@ -1,16 +1,48 @@
 """
 API views for public content browsing
 """
+from django.db.models import Count, F, Max, Sum
 from rest_framework import generics, status
 from rest_framework.views import APIView
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import AllowAny
-from django.db.models import Q
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
 
+from apps.analytics.services import record_unique_view
+from apps.core.conditional import ConditionalGet
+from apps.core.fieldsets import FIELDSET_PARAMETERS, FieldsetError, parse_fieldset
 from apps.core.response import success_response, error_response, paginated_response
 from apps.core.constants import CONTENT_STATUS_PUBLIC
-from .models import Content
-from .serializers import ContentPublicSerializer, ContentDetailSerializer
+from apps.core.permissions import IsBuyer, IsOnboarded
+from .models import Content, SavedSearch
+from .serializers import (
+    ContentPublicSerializer,
+    ContentPublicValuesSerializer,
+    ContentDetailSerializer,
+    SavedSearchSerializer
+)
+from .detail_cache import get_content_detail
+from .facets import get_facets
+from .feed import get_feed_ids
+from .filters import parse_content_filters, apply_content_filters, price_ordering, FilterError
+from .similarity import SIMILAR_TOP_K, similar_contents
+from .trending import TRENDING_ORDERING
+from .search import (
+    suggest,
+    SUGGEST_MIN_LENGTH,
+    SUGGEST_DEFAULT_LIMIT,
+    SUGGEST_MAX_LIMIT
+)
+
+# Filter parameters shared by the list and facets endpoints
+CONTENT_FILTER_PARAMETERS = [
+    OpenApiParameter('search', str, description='Full-text search in title, producer and description'),
+    OpenApiParameter('genre', str, description='Filter by genre tags (repeat or comma-separate)'),
+    OpenApiParameter('genre_mode', str, description='any: match at least one genre, all: match every genre (default)'),
+    OpenApiParameter('min_price', float, description='Minimum price (in USD unless currency is given)'),
+    OpenApiParameter('max_price', float, description='Maximum price (in USD unless currency is given)'),
+    OpenApiParameter('currency', str, description='Currency code (USD, KRW, etc)'),
+]
 
 
 @extend_schema(tags=['Content - Public'])
@@ -20,77 +52,103 @@ class ContentListView(generics.ListAPIView):
     serializer_class = ContentPublicSerializer
 
     @extend_schema(
-        parameters=[
-            OpenApiParameter('search', str, description='Search in title and description'),
-            OpenApiParameter('genre', str, description='Filter by genre tag'),
-            OpenApiParameter('min_price', float, description='Minimum price'),
-            OpenApiParameter('max_price', float, description='Maximum price'),
-            OpenApiParameter('currency', str, description='Currency code (USD, KRW, etc)'),
-            OpenApiParameter('ordering', str, description='Sort by: -created_at, price, -price, view_count'),
-        ],
-        responses={200: ContentPublicSerializer(many=True)}
+        parameters=CONTENT_FILTER_PARAMETERS + [
+            OpenApiParameter(
+                'ordering', str,
+                description='Sort by: -created_at, price, -price, view_count, trending, relevance (default when searching)'
+            ),
+            OpenApiParameter('cursor', str, description='Keyset pagination cursor (empty for first page)'),
+        ] + FIELDSET_PARAMETERS,
+        responses={
+            200: ContentPublicSerializer(many=True),
+            304: OpenApiResponse(description='Not modified (If-None-Match)')
+        }
     )
     def get(self, request, *args, **kwargs):
         """List all public contents with filtering and sorting"""
-        queryset = self.get_queryset()
-
-        # Search
-        search = request.query_params.get('search')
-        if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) | Q(description__icontains=search)
-            )
+        try:
+            filters = parse_content_filters(request.query_params)
+            fields = parse_fieldset(request, ContentPublicSerializer)
+        except (FilterError, FieldsetError) as e:
+            return error_response(message=str(e), status_code=status.HTTP_400_BAD_REQUEST)
 
-        # Genre filter
-        genre = request.query_params.get('genre')
-        if genre:
-            queryset = queryset.filter(genre_tags__contains=[genre])
-
-        # Price range filter
-        min_price = request.query_params.get('min_price')
-        max_price = request.query_params.get('max_price')
-
-        if min_price is not None and max_price is not None:
-            try:
-                min_price = float(min_price)
-                max_price = float(max_price)
-                if min_price > max_price:
-                    return error_response(
-                        message="min_price cannot be greater than max_price",
-                        status_code=status.HTTP_400_BAD_REQUEST
-                    )
-            except ValueError:
-                return error_response(
-                    message="Invalid price range values",
-                    status_code=status.HTTP_400_BAD_REQUEST
-                )
-
-        if min_price is not None:
-            queryset = queryset.filter(price__gte=min_price)
-        if max_price is not None:
-            queryset = queryset.filter(price__lte=max_price)
-
-        # Currency filter
-        currency = request.query_params.get('currency')
-        if currency:
-            queryset = queryset.filter(currency=currency.upper())
+        # Search (full-text, ranked by relevance), genres, price range, currency
+        queryset = apply_content_filters(self.get_queryset(), filters)
+        search = filters['search']
 
         # Ordering
-        ordering = request.query_params.get('ordering', '-created_at')
+        ordering = request.query_params.get('ordering', 'relevance' if search else '-created_at')
         allowed_orderings = ['-created_at', 'created_at', 'price', '-price', 'view_count', '-view_count']
-        if ordering in allowed_orderings:
-            queryset = queryset.order_by(ordering)
+        if ordering == 'relevance' and search:
+            queryset = queryset.order_by('-relevance', '-created_at')
+        elif ordering == 'trending':
+            queryset = queryset.order_by(*TRENDING_ORDERING)
+        elif ordering in allowed_orderings:
+            queryset = queryset.order_by(price_ordering(ordering, filters['currency']))
 
-        return paginated_response(
+        # Validators from one aggregate: answer 304 before fetching the page.
+        # Bulk UPDATEs (view counters, trending refresh, exchange-rate resync)
+        # leave updated_at alone, so the columns they write are summed too.
+        aggregates = {
+            'latest': Max('updated_at'),
+            'producer_latest': Max('producer__updated_at'),
+            'count': Count('id'),
+            'views': Sum('view_count'),
+        }
+        if ordering == 'trending':
+            aggregates['trending'] = Sum('trending_score')
+        if not filters['currency']:
+            # USD prices drive price ordering and min/max_price bounds
+            aggregates['price_usd'] = Sum('price_usd')
+        validators = queryset.order_by().aggregate(**aggregates)
+        conditional = ConditionalGet(request, *validators.values())
+        not_modified = conditional.not_modified()
+        if not_modified:
+            return not_modified
+
+        return conditional.finalize(paginated_response(
             queryset,
-            ContentPublicSerializer,
+            ContentPublicValuesSerializer,
             request,
-            message="Contents retrieved successfully"
-        )
+            message="Contents retrieved successfully",
+            fields=fields
+        ))
 
     def get_queryset(self):
         """Only return public, non-deleted contents"""
-        return Content.objects.filter(status=CONTENT_STATUS_PUBLIC).select_related('producer')
+        return Content.objects.filter(
+            status=CONTENT_STATUS_PUBLIC
+        ).select_related('producer').defer('search_vector')
+
+
+@extend_schema(tags=['Content - Public'])
+class ContentFacetsView(APIView):
+    """Facet counts (genre, currency, rating, price range) for the browse sidebar"""
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        parameters=CONTENT_FILTER_PARAMETERS,
+        responses={
+            200: OpenApiResponse(description='Facet counts for the current filter set'),
+            400: OpenApiResponse(description='Invalid filter values')
+        }
+    )
+    def get(self, request):
+        """Return all facet counts for the current filters in one grouped query"""
+        try:
+            filters = parse_content_filters(request.query_params)
+        except FilterError as e:
+            return error_response(message=str(e), status_code=status.HTTP_400_BAD_REQUEST)
+
+        queryset = apply_content_filters(
+            Content.objects.filter(status=CONTENT_STATUS_PUBLIC),
+            filters
+        )
+
+        return success_response(
+            data=get_facets(queryset, filters),
+            message="Facets retrieved successfully"
+        )
 
 
 @extend_schema(tags=['Content - Public'])
@@ -99,29 +157,256 @@ class ContentDetailView(APIView):
     permission_classes = [AllowAny]
 
     @extend_schema(
+        parameters=FIELDSET_PARAMETERS,
         responses={
             200: ContentDetailSerializer,
+            304: OpenApiResponse(description='Not modified (If-None-Match / If-Modified-Since)'),
+            400: OpenApiResponse(description='Unknown fields'),
             404: OpenApiResponse(description='Content not found')
         }
     )
     def get(self, request, pk):
         """Get content detail and increment view count"""
         try:
-            content = Content.objects.select_related('producer').get(
-                pk=pk,
-                status=CONTENT_STATUS_PUBLIC
+            fields = parse_fieldset(request, ContentDetailSerializer)
+        except FieldsetError as e:
+            return error_response(message=str(e), status_code=status.HTTP_400_BAD_REQUEST)
+
+        # Serialized payload and validators from the object cache (no queries when hot)
+        entry = get_content_detail(pk)
+        if entry is None:
+            return self.not_found()
+
+        validators = entry['validators']
+        conditional = ConditionalGet(request, *validators, last_modified=max(validators))
+
+        # Record view (buffered) and unique viewer, also when answering 304
+        content = Content(pk=pk, view_count=entry['data']['view_count'])
+        content.increment_view_count()
+        record_unique_view(content, request)
+
+        not_modified = conditional.not_modified()
+        if not_modified is not None:
+            return not_modified
+
+        data = dict(entry['data'], view_count=content.view_count)
+        if fields is not None:
+            data = {name: data[name] for name in fields}
+        return conditional.finalize(success_response(
+            data=data,
+            message="Content retrieved successfully"
+        ))
+
+    @staticmethod
+    def not_found():
+        return error_response(
+            message="Content not found or not available",
+            status_code=status.HTTP_404_NOT_FOUND
+        )
+
+
+@extend_schema(tags=['Content - Public'])
+class ContentSuggestView(APIView):
+    """Typo-tolerant typeahead for content titles and producer names"""
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('q', str, required=True, description='Partial title or producer name'),
+            OpenApiParameter('limit', int, description=f'Max results per group (default {SUGGEST_DEFAULT_LIMIT})'),
+        ],
+        responses={
+            200: OpenApiResponse(description='Title and producer suggestions'),
+            400: OpenApiResponse(description='Query too short')
+        }
+    )
+    def get(self, request):
+        """Return top-N title and producer matches for the query"""
+        query = request.query_params.get('q', '').strip()
+        if len(query) < SUGGEST_MIN_LENGTH:
+            return error_response(
+                message=f"Query must be at least {SUGGEST_MIN_LENGTH} characters",
+                status_code=status.HTTP_400_BAD_REQUEST
             )
-        except Content.DoesNotExist:
+
+        try:
+            limit = int(request.query_params.get('limit', SUGGEST_DEFAULT_LIMIT))
+        except ValueError:
+            limit = SUGGEST_DEFAULT_LIMIT
+        limit = max(1, min(limit, SUGGEST_MAX_LIMIT))
+
+        return success_response(
+            data=suggest(query, limit=limit),
+            message="Suggestions retrieved successfully"
+        )
+
+
+@extend_schema(tags=['Content - Public'])
+class ContentSimilarView(APIView):
+    """Precomputed similar contents for a public content"""
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('limit', int, description=f'Max results (default {SIMILAR_TOP_K})'),
+        ],
+        responses={
+            200: ContentPublicSerializer(many=True),
+            404: OpenApiResponse(description='Content not found')
+        }
+    )
+    def get(self, request, pk):
+        """List contents similar to this one, most similar first"""
+        try:
+            limit = int(request.query_params.get('limit', SIMILAR_TOP_K))
+        except ValueError:
+            limit = SIMILAR_TOP_K
+        limit = max(1, min(limit, SIMILAR_TOP_K))
+
+        # Neighbors are kept for drafts and deleted contents until the next
+        # rebuild; only public contents expose them
+        if not Content.objects.filter(pk=pk, status=CONTENT_STATUS_PUBLIC).exists():
             return error_response(
                 message="Content not found or not available",
                 status_code=status.HTTP_404_NOT_FOUND
             )
 
-        # Increment view count (atomic)
-        content.increment_view_count()
+        contents = similar_contents(pk, limit=limit)
+        serializer = ContentPublicSerializer(contents, many=True)
+        return success_response(
+            data=serializer.data,
+            message="Similar contents retrieved successfully"
+        )
+
+
+@extend_schema(tags=['Content - Public'])
+class ContentFeedView(APIView):
+    """Personalized feed for buyers (genre preferences, recency, trending)"""
+    permission_classes = [IsBuyer, IsOnboarded]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('page', int, description='Page number'),
+        ],
+        responses={200: ContentPublicSerializer(many=True)}
+    )
+    def get(self, request):
+        """List the buyer's precomputed feed, best match first"""
+        paginator = PageNumberPagination()
+        page_ids = paginator.paginate_queryset(get_feed_ids(request.user), request, view=self)
+
+        contents = Content.objects.filter(
+            pk__in=page_ids,
+            status=CONTENT_STATUS_PUBLIC
+        ).select_related('producer').defer('search_vector').in_bulk()
+        serializer = ContentPublicSerializer(
+            [contents[pk] for pk in page_ids if pk in contents],
+            many=True
+        )
 
-        serializer = ContentDetailSerializer(content)
         return success_response(
             data=serializer.data,
-            message="Content retrieved successfully"
+            message="Feed retrieved successfully",
+            pagination={
+                'count': paginator.page.paginator.count,
+                'next': paginator.get_next_link(),
+                'previous': paginator.get_previous_link(),
+                'page_size': paginator.page_size,
+                'current_page': paginator.page.number,
+                'total_pages': paginator.page.paginator.num_pages,
+            }
+        )
+
+
+@extend_schema(tags=['Content - Saved Searches'])
+class SavedSearchListCreateView(APIView):
+    """Buyer's saved searches list and create"""
+    permission_classes = [IsBuyer, IsOnboarded]
+
+    @extend_schema(responses={200: SavedSearchSerializer(many=True)})
+    def get(self, request):
+        """List saved searches of current buyer"""
+        queryset = SavedSearch.objects.filter(buyer=request.user).order_by('-created_at')
+        return paginated_response(
+            queryset,
+            SavedSearchSerializer,
+            request,
+            message="Saved searches retrieved successfully"
+        )
+
+    @extend_schema(
+        request=SavedSearchSerializer,
+        responses={201: SavedSearchSerializer, 400: OpenApiResponse(description='Validation error')}
+    )
+    def post(self, request):
+        """Save a search; new matching contents are notified instead of polled"""
+        serializer = SavedSearchSerializer(data=request.data)
+
+        if serializer.is_valid():
+            saved_search = serializer.save(buyer=request.user)
+            return success_response(
+                data=SavedSearchSerializer(saved_search).data,
+                message="Saved search created successfully",
+                status_code=status.HTTP_201_CREATED
+            )
+
+        return error_response(
+            message="Saved search creation failed",
+            errors=serializer.errors,
+            status_code=status.HTTP_400_BAD_REQUEST
+        )
+
+
+@extend_schema(tags=['Content - Saved Searches'])
+class SavedSearchDetailView(APIView):
+    """Buyer's saved search detail and delete"""
+    permission_classes = [IsBuyer, IsOnboarded]
+
+    @extend_schema(responses={200: SavedSearchSerializer, 404: OpenApiResponse(description='Not found')})
+    def get(self, request, pk):
+        """Get saved search detail"""
+        try:
+            saved_search = SavedSearch.objects.get(pk=pk, buyer=request.user)
+        except SavedSearch.DoesNotExist:
+            return error_response(message="Saved search not found", status_code=status.HTTP_404_NOT_FOUND)
+
+        return success_response(
+            data=SavedSearchSerializer(saved_search).data,
+            message="Saved search retrieved successfully"
+        )
+
+    @extend_schema(responses={200: OpenApiResponse(description='Deleted'), 404: OpenApiResponse(description='Not found')})
+    def delete(self, request, pk):
+        """Delete saved search"""
+        deleted, _ = SavedSearch.objects.filter(pk=pk, buyer=request.user).delete()
+        if not deleted:
+            return error_response(message="Saved search not found", status_code=status.HTTP_404_NOT_FOUND)
+
+        return success_response(message="Saved search deleted successfully")
+
+
+@extend_schema(tags=['Content - Saved Searches'])
+class SavedSearchMatchesView(APIView):
+    """Contents matched by a saved search since it was created"""
+    permission_classes = [IsBuyer, IsOnboarded]
+
+    @extend_schema(responses={200: ContentPublicSerializer(many=True), 404: OpenApiResponse(description='Not found')})
+    def get(self, request, pk):
+        """List matched public contents, newest match first"""
+        if not SavedSearch.objects.filter(pk=pk, buyer=request.user).exists():
+            return error_response(message="Saved search not found", status_code=status.HTTP_404_NOT_FOUND)
+
+        # Ordering key is an annotation so keyset cursors can read it off each row
+        queryset = Content.objects.filter(
+            saved_search_matches__saved_search_id=pk,
+            status=CONTENT_STATUS_PUBLIC
+        ).annotate(
+            matched_at=F('saved_search_matches__created_at')
+        ).select_related('producer').defer('search_vector').order_by('-matched_at', '-id')
+
+        return paginated_response(
+            queryset,
+            ContentPublicSerializer,
+            request,
+            message="Matched contents retrieved successfully"
         )
@@ -5,3 +5,6 @@ class ContentsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.contents'
     verbose_name = '콘텐츠 관리'
+
+    def ready(self):
+        import apps.contents.signals  # noqa
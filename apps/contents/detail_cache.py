@@ -0,0 +1,80 @@
+"""
+Cached ContentDetailSerializer payloads (see apps.core.object_cache)
+
+Entries depend on the content and its producer; both stamps are bumped
+from post_save handlers (contents.signals, booths.signals).
+
+Ids that are missing or not public are remembered in a negative cache
+(NEGATIVE_CACHE_TIMEOUT) under the same content stamp, so repeated 404s
+skip the database until the content is saved (e.g. published).
+"""
+from apps.core.constants import CONTENT_STATUS_PUBLIC
+from apps.core.object_cache import ObjectCache, read_stamps
+from .models import Content
+from .serializers import ContentDetailSerializer
+
+content_detail_cache = ObjectCache('content-detail')
+missing_content_cache = ObjectCache(
+    'content-missing', timeout_setting='NEGATIVE_CACHE_TIMEOUT', default_timeout=60
+)
+
+
+def content_stamp(content_id):
+    return f'content:{content_id}'
+
+
+def producer_stamp(user_id):
+    return f'user:{user_id}'
+
+
+def producer_contents_stamp(user_id):
+    """Bumped when any content of the producer changes (e.g. booth content counts)"""
+    return f'producer-contents:{user_id}'
+
+
+def get_public_content(pk, queryset=None, tokens=None):
+    """
+    Public content by pk, or None (remembered in the negative cache).
+
+    Args:
+        queryset: base queryset (select_related etc.), Content.objects by default
+        tokens: stamps already read by the caller before querying
+    """
+    if missing_content_cache.get(pk) is not None:
+        return None
+
+    if tokens is None:
+        tokens = read_stamps([content_stamp(pk)])
+    if queryset is None:
+        queryset = Content.objects.all()
+    content = queryset.filter(pk=pk, status=CONTENT_STATUS_PUBLIC).first()
+    if content is None:
+        missing_content_cache.set(pk, True, tokens)
+    return content
+
+
+def get_content_detail(pk):
+    """
+    Detail entry for a public content, or None when it does not exist:
+    {'data': serialized payload, 'validators': (updated_at, producer updated_at)}
+    """
+    entry = content_detail_cache.get(pk)
+    if entry is not None:
+        return entry
+
+    tokens = read_stamps([content_stamp(pk)])
+    content = get_public_content(
+        pk, Content.objects.select_related('producer').defer('search_vector'), tokens
+    )
+    if content is None:
+        return None
+
+    # The producer id comes from the row, so its stamp is read afterwards;
+    # a producer edit racing this read is bounded by OBJECT_CACHE_TIMEOUT
+    tokens.update(read_stamps([producer_stamp(content.producer_id)]))
+    entry = {
+        'data': dict(ContentDetailSerializer(content).data),
+        'validators': (content.updated_at, content.producer.updated_at),
+    }
+    content_detail_cache.set(pk, entry, tokens)
+    return entry
@@ -0,0 +1,82 @@
+"""
+Facet counts for the browse sidebar, computed in one grouped query
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+from .filters import filters_cache_key
+
+FACETS_CACHE_TIMEOUT = getattr(settings, 'CONTENT_FACETS_CACHE_TIMEOUT', 60)
+
+# Upper bounds of the USD price buckets; the last bucket is open-ended
+PRICE_FACET_THRESHOLDS = [100, 500, 1000, 5000]
+
+
+def _price_bucket_labels():
+    """Bucket number (as returned by width_bucket) -> {key, min, max}"""
+    bounds = [0] + PRICE_FACET_THRESHOLDS + [None]
+    buckets = {}
+    for number, (low, high) in enumerate(zip(bounds, bounds[1:])):
+        key = f'{low}-{high}' if high is not None else f'{low}+'
+        buckets[number] = {'key': key, 'min': low, 'max': high}
+    return buckets
+
+
+def compute_facets(queryset):
+    """
+    Count genre, currency, rating and price-bucket facets for a filtered
+    Content queryset in a single round trip. The filtered rows are scanned
+    once (CTE) and grouped four ways; genres are unnested from the array.
+    Price buckets use the USD-normalized price so currencies are comparable.
+
+    Returns:
+        dict: {total, genres, currencies, ratings, price_ranges}
+    """
+    inner = queryset.order_by().values('genre_tags', 'currency', 'rating', 'price_usd')
+    inner_sql, inner_params = inner.query.sql_with_params()
+
+    sql = f"""
+        WITH filtered AS ({inner_sql})
+        SELECT 'genre', tag, COUNT(*) FROM filtered CROSS JOIN LATERAL unnest(genre_tags) AS tag GROUP BY tag
+        UNION ALL
+        SELECT 'currency', currency, COUNT(*) FROM filtered GROUP BY currency
+        UNION ALL
+        SELECT 'rating', rating, COUNT(*) FROM filtered GROUP BY rating
+        UNION ALL
+        SELECT 'price', width_bucket(price_usd, %s::numeric[])::text, COUNT(*) FROM filtered
+        WHERE price_usd IS NOT NULL GROUP BY 2
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, (*inner_params, PRICE_FACET_THRESHOLDS))
+        rows = cursor.fetchall()
+
+    facets = {'genres': {}, 'currencies': {}, 'ratings': {}}
+    bucket_counts = {}
+    for facet, value, count in rows:
+        if facet == 'genre':
+            facets['genres'][value] = count
+        elif facet == 'currency':
+            facets['currencies'][value] = count
+        elif facet == 'rating':
+            facets['ratings'][value] = count
+        else:
+            bucket_counts[int(value)] = count
+
+    facets['genres'] = dict(sorted(facets['genres'].items(), key=lambda item: (-item[1], item[0])))
+    facets['total'] = sum(facets['currencies'].values())
+    facets['price_ranges'] = [
+        {**bucket, 'count': bucket_counts.get(number, 0)}
+        for number, bucket in _price_bucket_labels().items()
+    ]
+    return facets
+
+
+def get_facets(queryset, filters):
+    """Facet counts for queryset, cached for a short TTL keyed by the normalized filters"""
+    cache_key = filters_cache_key('contents:facets', filters)
+    facets = cache.get(cache_key)
+    if facets is None:
+        facets = compute_facets(queryset)
+        cache.set(cache_key, facets, FACETS_CACHE_TIMEOUT)
+    return facets
@@ -0,0 +1,136 @@
+"""
+Personalized buyer feed
+
+Each buyer's feed is a precomputed, bounded candidate list (BuyerFeed):
+public contents matching the buyer's onboarding genres plus the top
+trending items. Entries store the time-independent part of the score
+(genre overlap + trending) and the publish timestamp; recency decay is
+applied when the feed is read, so one keyed read plus an in-memory sort
+serves the feed.
+
+Feeds are built lazily on first read, patched in place when content is
+published (add_to_buyer_feeds) and fully rebuilt by
+`manage.py refresh_buyer_feeds` to pick up trending changes.
+"""
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from apps.core.constants import CONTENT_STATUS_PUBLIC
+from .models import BuyerFeed, Content
+
+# Candidates kept per buyer
+FEED_SIZE = getattr(settings, 'BUYER_FEED_SIZE', 200)
+
+GENRE_WEIGHT = 1.0
+TRENDING_WEIGHT = 0.5
+RECENCY_WEIGHT = 0.5
+# Trending score at which the trending component reaches half its weight
+TRENDING_SCALE = 50.0
+RECENCY_HALF_LIFE_DAYS = 7
+
+FEED_FIELDS = ('id', 'genre_tags', 'trending_score', 'created_at')
+
+
+def base_score(genres, content_genres, trending_score):
+    """Time-independent score: share of the buyer's genres covered + trending"""
+    overlap = len(set(genres).intersection(content_genres or [])) / len(genres) if genres else 0.0
+    trending = max(trending_score, 0.0)
+    return GENRE_WEIGHT * overlap + TRENDING_WEIGHT * trending / (trending + TRENDING_SCALE)
+
+
+def feed_score(entry, now):
+    """Full score of a stored entry at time `now` (adds recency decay)"""
+    _, score, created_ts = entry
+    age_days = max(now - created_ts, 0) / 86400
+    return score + RECENCY_WEIGHT * 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+
+
+def _entry(genres, row):
+    return [
+        row['id'],
+        round(base_score(genres, row['genre_tags'], row['trending_score']), 6),
+        int(row['created_at'].timestamp()),
+    ]
+
+
+def _rank(entries, now=None):
+    now = now or time.time()
+    return sorted(entries, key=lambda entry: (-feed_score(entry, now), -entry[0]))[:FEED_SIZE]
+
+
+def build_feed_entries(buyer):
+    """Score genre matches and top trending contents for a buyer"""
+    genres = list(buyer.genre_tags or [])
+    public = Content.objects.filter(status=CONTENT_STATUS_PUBLIC).order_by()
+
+    rows = {}
+    if genres:
+        matches = public.filter(genre_tags__overlap=genres).order_by('-created_at')
+        for row in matches.values(*FEED_FIELDS)[:FEED_SIZE * 2]:
+            rows[row['id']] = row
+    for row in public.order_by('-trending_score', '-id').values(*FEED_FIELDS)[:FEED_SIZE]:
+        rows.setdefault(row['id'], row)
+
+    return _rank([_entry(genres, row) for row in rows.values()])
+
+
+def rebuild_feed(buyer):
+    """Recompute and store a buyer's feed"""
+    feed, _ = BuyerFeed.objects.update_or_create(
+        buyer=buyer,
+        defaults={'entries': build_feed_entries(buyer)}
+    )
+    return feed
+
+
+def get_feed_ids(buyer):
+    """Ranked content ids for a buyer (builds the feed on first use)"""
+    feed = BuyerFeed.objects.filter(buyer=buyer).only('entries').first()
+    if feed is None:
+        feed = rebuild_feed(buyer)
+    return [entry[0] for entry in _rank(feed.entries)]
+
+
+def add_to_buyer_feeds(content):
+    """
+    Insert a newly published content into existing feeds of buyers who
+    follow any of its genres, keeping each feed ranked and bounded.
+    """
+    if not content.genre_tags:
+        return 0
+
+    row = {field: getattr(content, field) for field in FEED_FIELDS}
+    buyer_ids = get_user_model().objects.filter(
+        role='buyer',
+        genre_tags__has_any_keys=list(content.genre_tags),
+        content_feed__isnull=False,
+    ).values('pk')
+
+    now = time.time()
+    with transaction.atomic():
+        feeds = BuyerFeed.objects.select_for_update().filter(
+            buyer_id__in=buyer_ids
+        ).select_related('buyer')
+        changed = []
+        for feed in feeds:
+            entries = [entry for entry in feed.entries if entry[0] != content.pk]
+            entries.append(_entry(list(feed.buyer.genre_tags or []), row))
+            feed.entries = _rank(entries, now)
+            feed.updated_at = timezone.now()
+            changed.append(feed)
+        BuyerFeed.objects.bulk_update(changed, ['entries', 'updated_at'], batch_size=500)
+    return len(changed)
+
+
+def refresh_buyer_feeds():
+    """Rebuild every existing buyer feed (picks up trending changes)"""
+    refreshed = 0
+    for feed in BuyerFeed.objects.select_related('buyer').iterator():
+        feed.entries = build_feed_entries(feed.buyer)
+        feed.save(update_fields=['entries', 'updated_at'])
+        refreshed += 1
+    return refreshed
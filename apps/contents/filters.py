@@ -0,0 +1,146 @@
+"""
+Shared filter helpers for content browsing (API and template views)
+"""
+import hashlib
+import json
+from decimal import Decimal, InvalidOperation
+
+from .search import search_contents
+
+GENRE_MODE_ANY = 'any'
+GENRE_MODE_ALL = 'all'
+GENRE_MODES = (GENRE_MODE_ANY, GENRE_MODE_ALL)
+
+# Query parameter names used by the public API (ContentListView)
+API_FILTER_PARAMS = {
+    'search': 'search',
+    'min_price': 'min_price',
+    'max_price': 'max_price',
+}
+
+# Query parameter names used by the browse page (browse_view)
+BROWSE_FILTER_PARAMS = {
+    'search': 'q',
+    'min_price': 'price_min',
+    'max_price': 'price_max',
+}
+
+
+class FilterError(ValueError):
+    """Raised for invalid filter parameters (strict parsing only)"""
+
+
+def parse_genres(values):
+    """
+    Normalize genre query values into a de-duplicated list.
+    Accepts repeated params (?genre=a&genre=b) and comma-separated values (?genre=a,b).
+    """
+    genres = []
+    for value in values:
+        for genre in value.split(','):
+            genre = genre.strip()
+            if genre and genre not in genres:
+                genres.append(genre)
+    return genres
+
+
+def filter_by_genres(queryset, genres, mode=GENRE_MODE_ALL):
+    """
+    Filter contents by genre tags with a single GIN-indexed predicate:
+    - any: genre_tags && ARRAY[...] (at least one genre matches)
+    - all: genre_tags @> ARRAY[...] (every genre matches)
+    """
+    if not genres:
+        return queryset
+    if mode == GENRE_MODE_ANY:
+        return queryset.filter(genre_tags__overlap=genres)
+    return queryset.filter(genre_tags__contains=genres)
+
+
+def _parse_price(value, strict):
+    if value in (None, ''):
+        return None
+    try:
+        price = Decimal(value)
+    except (InvalidOperation, ValueError):
+        price = None
+    if price is None or not price.is_finite():
+        if strict:
+            raise FilterError("Invalid price range values")
+        return None
+    return price
+
+
+def parse_content_filters(params, names=API_FILTER_PARAMS, strict=True):
+    """
+    Parse query params into a normalized filter dict:
+    {search, genres, genre_mode, min_price, max_price, currency}
+
+    Args:
+        params: request.query_params / request.GET
+        names: mapping of filter name -> query parameter name
+        strict: raise FilterError on invalid values instead of ignoring them
+    """
+    genre_mode = params.get('genre_mode', GENRE_MODE_ALL)
+    if genre_mode not in GENRE_MODES:
+        if strict:
+            raise FilterError("genre_mode must be 'any' or 'all'")
+        genre_mode = GENRE_MODE_ALL
+
+    min_price = _parse_price(params.get(names['min_price']), strict)
+    max_price = _parse_price(params.get(names['max_price']), strict)
+    if min_price is not None and max_price is not None and min_price > max_price:
+        if strict:
+            raise FilterError("min_price cannot be greater than max_price")
+        min_price = max_price = None
+
+    currency = params.get('currency', '').strip().upper()
+
+    return {
+        'search': params.get(names['search'], '').strip(),
+        'genres': parse_genres(params.getlist('genre')),
+        'genre_mode': genre_mode,
+        'min_price': min_price,
+        'max_price': max_price,
+        'currency': currency or None,
+    }
+
+
+def apply_content_filters(queryset, filters):
+    """Apply a parsed filter dict (see parse_content_filters) to a Content queryset"""
+    if filters['search']:
+        queryset = search_contents(queryset, filters['search'])
+
+    queryset = filter_by_genres(queryset, filters['genres'], filters['genre_mode'])
+
+    # Within a single currency compare raw prices; across currencies the
+    # bounds are USD amounts compared against the indexed price_usd column
+    price_field = 'price' if filters['currency'] else 'price_usd'
+    if filters['min_price'] is not None:
+        queryset = queryset.filter(**{f'{price_field}__gte': filters['min_price']})
+    if filters['max_price'] is not None:
+        queryset = queryset.filter(**{f'{price_field}__lte': filters['max_price']})
+
+    if filters['currency']:
+        queryset = queryset.filter(currency=filters['currency'])
+
+    return queryset
+
+
+def price_ordering(ordering, currency=None):
+    """
+    Map price orderings to price_usd unless results are limited to one
+    currency, so mixed-currency lists sort by comparable amounts.
+    """
+    if currency or ordering.lstrip('-') != 'price':
+        return ordering
+    return ordering.replace('price', 'price_usd')
+
+
+def filters_cache_key(prefix, filters):
+    """Stable cache key for a normalized filter dict"""
+    normalized = dict(filters)
+    normalized['search'] = ' '.join(filters['search'].lower().split())
+    normalized['genres'] = sorted(filters['genres'])
+    payload = json.dumps(normalized, sort_keys=True, default=str)
+    return f"{prefix}:{hashlib.md5(payload.encode('utf-8')).hexdigest()}"
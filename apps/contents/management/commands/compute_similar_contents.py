@@ -0,0 +1,22 @@
+"""
+Precompute top-K similar contents for every public content (run nightly)
+"""
+from django.core.management.base import BaseCommand
+
+from apps.contents.similarity import SIMILAR_TOP_K, rebuild_similar_contents
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the similar-contents neighbor table'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top-k',
+            type=int,
+            default=SIMILAR_TOP_K,
+            help=f'Neighbors stored per content (default: {SIMILAR_TOP_K})'
+        )
+
+    def handle(self, *args, **options):
+        stored = rebuild_similar_contents(top_k=options['top_k'])
+        self.stdout.write(self.style.SUCCESS(f'Stored {stored} similar-content links'))
@@ -0,0 +1,74 @@
+"""
+Load USD exchange rates from a local JSON file and resync Content.price_usd
+"""
+import json
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.core.constants import CURRENCY_CHOICES
+from apps.contents.models import ExchangeRate
+
+DEFAULT_RATES_FILE = Path(__file__).resolve().parents[2] / 'fixtures' / 'exchange_rates.json'
+
+
+class Command(BaseCommand):
+    help = 'Load exchange rates from a JSON file ({"KRW": "0.00072", ...} or a Django fixture)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            nargs='?',
+            default=str(DEFAULT_RATES_FILE),
+            help='Path to the rates file (defaults to the bundled fixture)'
+        )
+
+    def handle(self, *args, **options):
+        rates = self.read_rates(options['path'])
+        supported = {code for code, _ in CURRENCY_CHOICES}
+
+        with transaction.atomic():
+            for currency, usd_rate in rates.items():
+                if currency not in supported:
+                    raise CommandError(f'Unsupported currency: {currency}')
+                rate, _ = ExchangeRate.objects.get_or_create(
+                    currency=currency, defaults={'usd_rate': usd_rate}
+                )
+                rate.usd_rate = usd_rate
+                # post_save resyncs price_usd for this currency
+                rate.save()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Loaded {len(rates)} exchange rates: ' + ', '.join(sorted(rates))
+        ))
+
+    def read_rates(self, path):
+        """Parse a rates file into {currency: Decimal}"""
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Could not read rates file {path}: {e}')
+
+        if isinstance(data, list):
+            # Django fixture format
+            data = {
+                item['fields']['currency']: item['fields']['usd_rate']
+                for item in data
+                if item.get('model') == 'contents.exchangerate'
+            }
+        if not isinstance(data, dict) or not data:
+            raise CommandError('Rates file must contain a currency -> rate mapping')
+
+        rates = {}
+        for currency, value in data.items():
+            try:
+                rate = Decimal(str(value))
+            except InvalidOperation:
+                raise CommandError(f'Invalid rate for {currency}: {value}')
+            if not rate.is_finite() or rate <= 0:
+                raise CommandError(f'Invalid rate for {currency}: {value}')
+            rates[currency.upper()] = rate
+        return rates
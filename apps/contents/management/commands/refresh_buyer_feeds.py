@@ -0,0 +1,14 @@
+"""
+Rebuild precomputed buyer feeds (run after refresh_trending_scores)
+"""
+from django.core.management.base import BaseCommand
+
+from apps.contents.feed import refresh_buyer_feeds
+
+
+class Command(BaseCommand):
+    help = 'Rebuild every existing buyer feed'
+
+    def handle(self, *args, **options):
+        refreshed = refresh_buyer_feeds()
+        self.stdout.write(self.style.SUCCESS(f'Refreshed {refreshed} buyer feeds'))
@@ -0,0 +1,17 @@
+"""
+Recompute Content.trending_score (run periodically, e.g. every 15 minutes)
+"""
+from django.core.management.base import BaseCommand
+
+from apps.core.view_counter import flush_view_counts
+from apps.contents.trending import refresh_trending_scores
+
+
+class Command(BaseCommand):
+    help = 'Recompute time-decayed trending scores for public contents'
+
+    def handle(self, *args, **options):
+        # Include buffered views in the rollup before scoring
+        flush_view_counts()
+        updated = refresh_trending_scores()
+        self.stdout.write(self.style.SUCCESS(f'Updated trending scores for {updated} contents'))
@@ -0,0 +1,25 @@
+"""
+Email buyers about new contents matching their saved searches (run periodically)
+"""
+from django.core.management.base import BaseCommand
+
+from apps.contents.saved_searches import mark_notified, pending_matches_by_buyer
+from apps.notifications.emails import send_saved_search_alert
+
+
+class Command(BaseCommand):
+    help = 'Send queued saved-search match notifications'
+
+    def handle(self, *args, **options):
+        sent = failed = 0
+        for buyer, matches in pending_matches_by_buyer().items():
+            try:
+                send_saved_search_alert(buyer, matches)
+            except Exception as e:
+                failed += 1
+                self.stderr.write(f'Failed to notify {buyer.username}: {e}')
+                continue
+            mark_notified(matches)
+            sent += 1
+
+        self.stdout.write(self.style.SUCCESS(f'Sent {sent} saved-search alerts ({failed} failed)'))
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:58
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+def populate_search_vectors(apps, schema_editor):
+    """
+    Backfill search vectors for existing contents.
+    Mirrors apps.contents.search.search_vector_expression.
+    """
+    from django.contrib.postgres.search import SearchVector
+    from django.db.models import OuterRef, Subquery
+
+    Content = apps.get_model('contents', 'Content')
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+
+    company_name = Subquery(
+        User.objects.filter(pk=OuterRef('producer_id')).values('company_name')[:1]
+    )
+    Content.objects.update(
+        search_vector=(
+            SearchVector('title', weight='A', config='english')
+            + SearchVector(company_name, weight='B', config='english')
+            + SearchVector('description', weight='C', config='english')
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0003_content_teaser_video'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='content',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Search vector'),
+        ),
+        migrations.AddIndex(
+            model_name='content',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='content_search_vector_gin'),
+        ),
+        migrations.RunPython(populate_search_vectors, migrations.RunPython.noop),
+    ]
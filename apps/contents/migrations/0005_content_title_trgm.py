@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:59
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0004_content_search_vector'),
+        ('accounts', '0005_user_company_name_trgm'),  # enables pg_trgm
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='content',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='content_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:01
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0005_content_title_trgm'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='content',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['genre_tags'], name='content_genre_tags_gin'),
+        ),
+    ]
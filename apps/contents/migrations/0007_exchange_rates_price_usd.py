@@ -0,0 +1,66 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:03
+
+from django.conf import settings
+from django.db import migrations, models
+
+# Initial USD rates (reference values; refresh with `manage.py load_exchange_rates`)
+INITIAL_USD_RATES = {
+    'USD': '1',
+    'KRW': '0.00072',
+    'EUR': '1.08',
+    'JPY': '0.0067',
+}
+
+
+def seed_rates_and_backfill(apps, schema_editor):
+    """Seed exchange rates and compute price_usd for existing contents"""
+    from decimal import Decimal
+    from django.db.models import DecimalField, ExpressionWrapper, F
+    from django.db.models.functions import Round
+
+    ExchangeRate = apps.get_model('contents', 'ExchangeRate')
+    Content = apps.get_model('contents', 'Content')
+
+    for currency, rate in INITIAL_USD_RATES.items():
+        ExchangeRate.objects.update_or_create(currency=currency, defaults={'usd_rate': Decimal(rate)})
+        Content.objects.filter(currency=currency).update(
+            price_usd=Round(
+                ExpressionWrapper(F('price') * Decimal(rate), output_field=DecimalField()),
+                2
+            )
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0006_content_genre_tags_gin'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExchangeRate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('currency', models.CharField(choices=[('USD', 'US Dollar'), ('KRW', 'Korean Won'), ('EUR', 'Euro'), ('JPY', 'Japanese Yen')], max_length=3, unique=True, verbose_name='Currency')),
+                ('usd_rate', models.DecimalField(decimal_places=8, help_text='USD value of one unit of this currency', max_digits=18, verbose_name='USD rate')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated at')),
+            ],
+            options={
+                'verbose_name': 'Exchange rate',
+                'verbose_name_plural': 'Exchange rates',
+                'ordering': ['currency'],
+            },
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='price_usd',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, help_text='Price normalized to USD for cross-currency filtering and sorting', max_digits=16, null=True, verbose_name='Price (USD)'),
+        ),
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['status', 'price_usd'], name='contents_co_status_44113d_idx'),
+        ),
+        migrations.RunPython(seed_rates_and_backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0007_exchange_rates_price_usd'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='content',
+            name='trending_score',
+            field=models.FloatField(default=0, editable=False, help_text='Time-decayed popularity, recomputed by refresh_trending_scores', verbose_name='Trending score'),
+        ),
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['status', '-trending_score', '-id'], name='content_trending_idx'),
+        ),
+    ]
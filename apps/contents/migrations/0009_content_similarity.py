@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0008_content_trending_score'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentSimilarity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField(verbose_name='Rank')),
+                ('score', models.FloatField(verbose_name='Similarity score')),
+                ('content', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similar_links', to='contents.content', verbose_name='Content')),
+                ('similar', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contents.content', verbose_name='Similar content')),
+            ],
+            options={
+                'verbose_name': 'Content similarity',
+                'verbose_name_plural': 'Content similarities',
+                'ordering': ['content', 'rank'],
+                'constraints': [models.UniqueConstraint(fields=('content', 'rank'), name='unique_content_similarity_rank')],
+            },
+        ),
+    ]
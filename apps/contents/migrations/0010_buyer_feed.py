@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:11
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0009_content_similarity'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BuyerFeed',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entries', models.JSONField(default=list, verbose_name='Feed entries')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated at')),
+                ('buyer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='content_feed', to=settings.AUTH_USER_MODEL, verbose_name='Buyer')),
+            ],
+            options={
+                'verbose_name': 'Buyer feed',
+                'verbose_name_plural': 'Buyer feeds',
+            },
+        ),
+    ]
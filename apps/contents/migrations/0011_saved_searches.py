@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:12
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0010_buyer_feed'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SavedSearch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(blank=True, max_length=100, verbose_name='Name')),
+                ('search', models.CharField(blank=True, max_length=200, verbose_name='Search text')),
+                ('genres', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=50), blank=True, default=list, size=None, verbose_name='Genres')),
+                ('genre_mode', models.CharField(choices=[('any', 'Any genre'), ('all', 'All genres')], default='all', max_length=3, verbose_name='Genre mode')),
+                ('min_price', models.DecimalField(blank=True, decimal_places=2, help_text='In USD unless currency is set', max_digits=12, null=True, verbose_name='Minimum price')),
+                ('max_price', models.DecimalField(blank=True, decimal_places=2, help_text='In USD unless currency is set', max_digits=12, null=True, verbose_name='Maximum price')),
+                ('currency', models.CharField(blank=True, choices=[('USD', 'US Dollar'), ('KRW', 'Korean Won'), ('EUR', 'Euro'), ('JPY', 'Japanese Yen')], max_length=3, verbose_name='Currency')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('buyer', models.ForeignKey(limit_choices_to={'role': 'buyer'}, on_delete=django.db.models.deletion.CASCADE, related_name='saved_searches', to=settings.AUTH_USER_MODEL, verbose_name='Buyer')),
+            ],
+            options={
+                'verbose_name': 'Saved search',
+                'verbose_name_plural': 'Saved searches',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SavedSearchMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('notified_at', models.DateTimeField(blank=True, null=True, verbose_name='Notified at')),
+                ('content', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='saved_search_matches', to='contents.content', verbose_name='Content')),
+                ('saved_search', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='matches', to='contents.savedsearch', verbose_name='Saved search')),
+            ],
+            options={
+                'verbose_name': 'Saved search match',
+                'verbose_name_plural': 'Saved search matches',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='savedsearch',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['genres'], name='saved_search_genres_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='savedsearch',
+            index=models.Index(fields=['currency'], name='contents_sa_currenc_7b6c25_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='savedsearchmatch',
+            index=models.Index(condition=models.Q(('notified_at__isnull', True)), fields=['created_at'], name='saved_search_match_pending'),
+        ),
+        migrations.AddConstraint(
+            model_name='savedsearchmatch',
+            constraint=models.UniqueConstraint(fields=('saved_search', 'content'), name='unique_saved_search_match'),
+        ),
+    ]
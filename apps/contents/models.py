@@ -1,9 +1,13 @@
 """
 Content model for short-form content items
 """
+from decimal import Decimal
+
 from django.db import models
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from apps.core.utils import SoftDeleteManager
 from apps.core.constants import (
     CONTENT_STATUS_DRAFT,
@@ -80,6 +84,15 @@ class Content(models.Model):
         default=CURRENCY_USD,
         verbose_name='Currency'
     )
+    price_usd = models.DecimalField(
+        max_digits=16,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='Price (USD)',
+        help_text='Price normalized to USD for cross-currency filtering and sorting'
+    )
 
     # Content details
     duration_seconds = models.PositiveIntegerField(
@@ -119,6 +132,19 @@ class Content(models.Model):
         default=0,
         verbose_name='View count'
     )
+    trending_score = models.FloatField(
+        default=0,
+        editable=False,
+        verbose_name='Trending score',
+        help_text='Time-decayed popularity, recomputed by refresh_trending_scores'
+    )
+
+    # Full-text search (maintained by signals, see apps.contents.search)
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        verbose_name='Search vector'
+    )
 
     # Timestamps
     created_at = models.DateTimeField(
@@ -147,11 +173,25 @@ class Content(models.Model):
         indexes = [
             models.Index(fields=['status', '-created_at']),
             models.Index(fields=['producer', 'status']),
+            models.Index(fields=['status', 'price_usd']),
+            models.Index(fields=['status', '-trending_score', '-id'], name='content_trending_idx'),
+            GinIndex(fields=['search_vector'], name='content_search_vector_gin'),
+            GinIndex(fields=['title'], name='content_title_trgm', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['genre_tags'], name='content_genre_tags_gin'),
         ]
 
     def __str__(self):
         return f"{self.title} by {self.producer.username}"
 
+    def save(self, *args, **kwargs):
+        """Keep price_usd in sync with price/currency"""
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or {'price', 'currency'}.intersection(update_fields):
+            self.price_usd = ExchangeRate.to_usd(self.price, self.currency)
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'price_usd'}
+        super().save(*args, **kwargs)
+
     @property
     def is_public(self):
         """Check if content is publicly visible"""
@@ -167,10 +207,266 @@ class Content(models.Model):
         from django.utils import timezone
         self.status = CONTENT_STATUS_DELETED
         self.deleted_at = timezone.now()
-        self.save(update_fields=['status', 'deleted_at'])
+        self.save(update_fields=['status', 'deleted_at', 'updated_at'])
 
     def increment_view_count(self):
-        """Increment view count (atomic operation)"""
-        from django.db.models import F
-        Content.objects.filter(pk=self.pk).update(view_count=F('view_count') + 1)
-        self.refresh_from_db(fields=['view_count'])
+        """Record a view (buffered; see apps.core.view_counter)"""
+        from apps.core.view_counter import record_view
+        record_view(self)
+
+
+class ExchangeRate(models.Model):
+    """USD conversion rate per currency, used to maintain Content.price_usd"""
+
+    currency = models.CharField(
+        max_length=3,
+        choices=CURRENCY_CHOICES,
+        unique=True,
+        verbose_name='Currency'
+    )
+    usd_rate = models.DecimalField(
+        max_digits=18,
+        decimal_places=8,
+        verbose_name='USD rate',
+        help_text='USD value of one unit of this currency'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Updated at'
+    )
+
+    class Meta:
+        verbose_name = 'Exchange rate'
+        verbose_name_plural = 'Exchange rates'
+        ordering = ['currency']
+
+    def __str__(self):
+        return f"1 {self.currency} = {self.usd_rate} USD"
+
+    @classmethod
+    def get_usd_rate(cls, currency):
+        """Return the USD rate for currency, or None if no rate is loaded"""
+        if currency == CURRENCY_USD:
+            return Decimal('1')
+        return cls.objects.filter(currency=currency).values_list('usd_rate', flat=True).first()
+
+    @classmethod
+    def to_usd(cls, amount, currency):
+        """Convert amount to USD (2 decimal places); None if the rate is unknown"""
+        if amount is None:
+            return None
+        rate = cls.get_usd_rate(currency)
+        if rate is None:
+            return None
+        return (Decimal(str(amount)) * rate).quantize(Decimal('0.01'))
+
+    def sync_content_prices(self):
+        """Recompute price_usd for every content priced in this currency (single UPDATE)"""
+        from django.db.models import DecimalField, ExpressionWrapper, F
+        from django.db.models.functions import Round
+
+        return Content.objects.filter(currency=self.currency).update(
+            price_usd=Round(
+                ExpressionWrapper(F('price') * self.usd_rate, output_field=DecimalField()),
+                2
+            )
+        )
+
+
+class ContentSimilarity(models.Model):
+    """Precomputed top-K similar contents per public content (see apps.contents.similarity)"""
+
+    content = models.ForeignKey(
+        Content,
+        on_delete=models.CASCADE,
+        related_name='similar_links',
+        verbose_name='Content'
+    )
+    similar = models.ForeignKey(
+        Content,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='Similar content'
+    )
+    rank = models.PositiveSmallIntegerField(
+        verbose_name='Rank'
+    )
+    score = models.FloatField(
+        verbose_name='Similarity score'
+    )
+
+    class Meta:
+        verbose_name = 'Content similarity'
+        verbose_name_plural = 'Content similarities'
+        ordering = ['content', 'rank']
+        constraints = [
+            models.UniqueConstraint(fields=['content', 'rank'], name='unique_content_similarity_rank'),
+        ]
+
+    def __str__(self):
+        return f"#{self.content_id} ~ #{self.similar_id} ({self.score:.2f})"
+
+
+class BuyerFeed(models.Model):
+    """
+    Precomputed feed candidates for a buyer (see apps.contents.feed).
+    entries: [[content_id, base_score, created_timestamp], ...]
+    """
+
+    buyer = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='content_feed',
+        verbose_name='Buyer'
+    )
+    entries = models.JSONField(
+        default=list,
+        verbose_name='Feed entries'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Updated at'
+    )
+
+    class Meta:
+        verbose_name = 'Buyer feed'
+        verbose_name_plural = 'Buyer feeds'
+
+    def __str__(self):
+        return f"Feed for {self.buyer.username} ({len(self.entries)} items)"
+
+
+class SavedSearch(models.Model):
+    """
+    Buyer's saved browse filters (same semantics as ContentListView).
+    New public contents are matched against saved searches on publish
+    (see apps.contents.saved_searches).
+    """
+
+    GENRE_MODE_CHOICES = [
+        ('any', 'Any genre'),
+        ('all', 'All genres'),
+    ]
+
+    buyer = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='saved_searches',
+        limit_choices_to={'role': 'buyer'},
+        verbose_name='Buyer'
+    )
+    name = models.CharField(
+        max_length=100,
+        blank=True,
+        verbose_name='Name'
+    )
+    search = models.CharField(
+        max_length=200,
+        blank=True,
+        verbose_name='Search text'
+    )
+    genres = ArrayField(
+        models.CharField(max_length=50),
+        default=list,
+        blank=True,
+        verbose_name='Genres'
+    )
+    genre_mode = models.CharField(
+        max_length=3,
+        choices=GENRE_MODE_CHOICES,
+        default='all',
+        verbose_name='Genre mode'
+    )
+    min_price = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        verbose_name='Minimum price',
+        help_text='In USD unless currency is set'
+    )
+    max_price = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        verbose_name='Maximum price',
+        help_text='In USD unless currency is set'
+    )
+    currency = models.CharField(
+        max_length=3,
+        choices=CURRENCY_CHOICES,
+        blank=True,
+        verbose_name='Currency'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Created at'
+    )
+
+    class Meta:
+        verbose_name = 'Saved search'
+        verbose_name_plural = 'Saved searches'
+        ordering = ['-created_at']
+        indexes = [
+            GinIndex(fields=['genres'], name='saved_search_genres_gin'),
+            models.Index(fields=['currency']),
+        ]
+
+    def __str__(self):
+        return self.name or f"Saved search #{self.pk} by {self.buyer.username}"
+
+    def as_filters(self):
+        """Filter dict in the format of apps.contents.filters.parse_content_filters"""
+        return {
+            'search': self.search,
+            'genres': list(self.genres),
+            'genre_mode': self.genre_mode,
+            'min_price': self.min_price,
+            'max_price': self.max_price,
+            'currency': self.currency or None,
+        }
+
+
+class SavedSearchMatch(models.Model):
+    """Queue of newly published contents matching a saved search, pending notification"""
+
+    saved_search = models.ForeignKey(
+        SavedSearch,
+        on_delete=models.CASCADE,
+        related_name='matches',
+        verbose_name='Saved search'
+    )
+    content = models.ForeignKey(
+        Content,
+        on_delete=models.CASCADE,
+        related_name='saved_search_matches',
+        verbose_name='Content'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Created at'
+    )
+    notified_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Notified at'
+    )
+
+    class Meta:
+        verbose_name = 'Saved search match'
+        verbose_name_plural = 'Saved search matches'
+        ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(fields=['saved_search', 'content'], name='unique_saved_search_match'),
+        ]
+        indexes = [
+            models.Index(
+                fields=['created_at'],
+                name='saved_search_match_pending',
+                condition=models.Q(notified_at__isnull=True)
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.saved_search} -> {self.content.title}"
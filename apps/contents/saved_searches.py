@@ -0,0 +1,80 @@
+"""
+Reverse matching of newly published contents against saved searches
+
+Instead of buyers re-running their filters, each publish event selects the
+saved searches the new content satisfies. Genre, currency and price
+conditions are evaluated in one query (GIN index on genres, btree on
+currency); only the remaining searches with a text term are checked
+against the content's search vector. Matches are queued in
+SavedSearchMatch and delivered by `manage.py send_saved_search_alerts`.
+"""
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Content, SavedSearch, SavedSearchMatch
+from .search import search_contents
+
+
+def _price_condition(price):
+    """Saved-search bounds accepting `price` (bounds are null when unset)"""
+    if price is None:
+        return Q(min_price__isnull=True, max_price__isnull=True)
+    return (
+        (Q(min_price__isnull=True) | Q(min_price__lte=price))
+        & (Q(max_price__isnull=True) | Q(max_price__gte=price))
+    )
+
+
+def candidate_searches(content):
+    """Saved searches whose genre, currency and price filters accept content"""
+    genres = list(content.genre_tags or [])
+    genre_condition = Q(genres=[]) | (
+        Q(genres__overlap=genres)
+        & (Q(genre_mode='any') | Q(genres__contained_by=genres))
+    )
+    # Same price semantics as apply_content_filters: raw price within the
+    # selected currency, USD-normalized price otherwise
+    price_condition = (
+        (Q(currency='') & _price_condition(content.price_usd))
+        | (Q(currency=content.currency) & _price_condition(content.price))
+    )
+    return SavedSearch.objects.filter(genre_condition & price_condition)
+
+
+def match_saved_searches(content):
+    """
+    Queue a match for every saved search the content satisfies.
+
+    Returns:
+        int: number of matched saved searches
+    """
+    candidates = list(candidate_searches(content).only('id', 'search'))
+
+    matched = [search.pk for search in candidates if not search.search]
+    texts = {search.search for search in candidates if search.search}
+    single = Content.objects.filter(pk=content.pk)
+    matching_texts = {text for text in texts if search_contents(single, text).exists()}
+    matched += [search.pk for search in candidates if search.search in matching_texts]
+
+    SavedSearchMatch.objects.bulk_create(
+        [SavedSearchMatch(saved_search_id=pk, content=content) for pk in matched],
+        ignore_conflicts=True
+    )
+    return len(matched)
+
+
+def pending_matches_by_buyer():
+    """Unnotified matches grouped as {buyer: [match, ...]}"""
+    grouped = {}
+    matches = SavedSearchMatch.objects.filter(
+        notified_at__isnull=True
+    ).select_related('saved_search__buyer', 'content').order_by('created_at')
+    for match in matches:
+        grouped.setdefault(match.saved_search.buyer, []).append(match)
+    return grouped
+
+
+def mark_notified(matches):
+    SavedSearchMatch.objects.filter(
+        pk__in=[match.pk for match in matches]
+    ).update(notified_at=timezone.now())
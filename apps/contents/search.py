@@ -0,0 +1,136 @@
+"""
+PostgreSQL search helpers for content browsing
+- Full-text search over a stored, GIN-indexed tsvector
+- Typo-tolerant trigram matching (pg_trgm) on titles and producer names
+"""
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramSimilarity,
+    TrigramWordSimilarity,
+)
+from django.core.cache import cache
+from django.db.models import F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from apps.core.constants import CONTENT_STATUS_PUBLIC
+from .models import Content
+
+# Text search configuration used for both the stored vector and queries.
+# Changing it requires rebuilding existing vectors (see refresh_search_vectors).
+SEARCH_CONFIG = getattr(settings, 'CONTENT_SEARCH_CONFIG', 'english')
+
+# Content fields that feed the search vector
+SEARCH_SOURCE_FIELDS = {'title', 'description'}
+
+# Autocomplete settings
+SUGGEST_MIN_LENGTH = 2
+SUGGEST_DEFAULT_LIMIT = 8
+SUGGEST_MAX_LIMIT = 20
+SUGGEST_CACHE_TIMEOUT = getattr(settings, 'CONTENT_SUGGEST_CACHE_TIMEOUT', 300)
+
+
+def search_vector_expression():
+    """
+    Build the weighted tsvector expression for Content rows:
+    title (A) > producer company name (B) > description (C)
+    """
+    company_name = Subquery(
+        get_user_model().objects.filter(
+            pk=OuterRef('producer_id')
+        ).values('company_name')[:1]
+    )
+    return (
+        SearchVector('title', weight='A', config=SEARCH_CONFIG)
+        + SearchVector(company_name, weight='B', config=SEARCH_CONFIG)
+        + SearchVector('description', weight='C', config=SEARCH_CONFIG)
+    )
+
+
+def refresh_search_vectors(queryset):
+    """Recompute the stored search vector for every row in queryset (single UPDATE)"""
+    return queryset.update(search_vector=search_vector_expression())
+
+
+def search_contents(queryset, search_text):
+    """
+    Filter queryset by search text and annotate each row with `relevance`.
+
+    A row matches when any of these index-backed predicates hold:
+    - full-text match on the search vector (GIN)
+    - title is trigram-similar to the text (GIN gin_trgm_ops), for misspellings
+    - producer company name is trigram-similar to the text
+    Relevance combines ts_rank with the best trigram similarity.
+    """
+    query = SearchQuery(search_text, search_type='websearch', config=SEARCH_CONFIG)
+    similar_producers = get_user_model().objects.filter(
+        company_name__trigram_similar=search_text
+    ).values('pk')
+
+    return queryset.filter(
+        Q(search_vector=query)
+        | Q(title__trigram_similar=search_text)
+        | Q(producer_id__in=similar_producers)
+    ).annotate(
+        relevance=(
+            Coalesce(SearchRank(F('search_vector'), query), Value(0.0))
+            + Greatest(
+                TrigramSimilarity('title', search_text),
+                TrigramSimilarity('producer__company_name', search_text),
+            )
+        )
+    )
+
+
+def normalize_suggest_query(text):
+    """Lowercase and collapse whitespace so equivalent prefixes share a cache entry"""
+    return ' '.join(text.lower().split())
+
+
+def suggest(text, limit=SUGGEST_DEFAULT_LIMIT):
+    """
+    Typeahead suggestions for content titles and producer names.
+    Uses word-similarity matching, which also covers partial prefixes and
+    is served by the trigram GIN indexes. Results are cached per
+    normalized query so hot prefixes skip the database entirely.
+
+    Returns:
+        dict: {'titles': [{id, title}], 'producers': [{name, booth_slug}]}
+    """
+    text = normalize_suggest_query(text)
+    digest = hashlib.md5(text.encode('utf-8')).hexdigest()
+    cache_key = f'contents:suggest:{limit}:{digest}'
+
+    result = cache.get(cache_key)
+    if result is not None:
+        return result
+
+    titles = Content.objects.filter(
+        title__trigram_word_similar=text,
+        status=CONTENT_STATUS_PUBLIC,
+    ).annotate(
+        similarity=TrigramWordSimilarity(text, 'title')
+    ).order_by('-similarity', '-created_at').values('id', 'title')[:limit]
+
+    producers = get_user_model().objects.filter(
+        company_name__trigram_word_similar=text,
+        role='creator',
+        booth_slug__isnull=False,
+    ).annotate(
+        similarity=TrigramWordSimilarity(text, 'company_name')
+    ).order_by('-similarity', 'company_name').values('company_name', 'booth_slug')[:limit]
+
+    result = {
+        'titles': list(titles),
+        'producers': [
+            {'name': p['company_name'], 'booth_slug': p['booth_slug']}
+            for p in producers
+        ],
+    }
+    cache.set(cache_key, result, SUGGEST_CACHE_TIMEOUT)
+    return result
@@ -2,12 +2,14 @@
 Serializers for Content model
 """
 from rest_framework import serializers
-from .models import Content
+from .models import Content, SavedSearch
 from apps.accounts.serializers import UserSerializer
+from apps.core.fieldsets import SparseFieldsetMixin
+from apps.core.serializers import ValuesSerializer
 from apps.core.validators import validate_genre_tags
 
 
-class ContentPublicSerializer(serializers.ModelSerializer):
+class ContentPublicSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Public serializer for content browsing (read-only)"""
 
     producer_name = serializers.CharField(source='producer.company_name', read_only=True)
@@ -25,7 +27,12 @@ class ContentPublicSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class ContentDetailSerializer(serializers.ModelSerializer):
+class ContentPublicValuesSerializer(ValuesSerializer):
+    """Fast read-only list path with the same output as ContentPublicSerializer"""
+    serializer_class = ContentPublicSerializer
+
+
+class ContentDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Detailed content serializer with video URL (read-only for buyers)"""
 
     producer_name = serializers.CharField(source='producer.company_name', read_only=True)
@@ -106,3 +113,34 @@ class ContentCreateUpdateSerializer(serializers.ModelSerializer):
         if value <= 0:
             raise serializers.ValidationError("Duration must be greater than 0.")
         return value
+
+
+class SavedSearchSerializer(serializers.ModelSerializer):
+    """Serializer for a buyer's saved search"""
+
+    class Meta:
+        model = SavedSearch
+        fields = (
+            'id', 'name', 'search', 'genres', 'genre_mode',
+            'min_price', 'max_price', 'currency', 'created_at'
+        )
+        read_only_fields = ('id', 'created_at')
+
+    def validate_search(self, value):
+        return value.strip()
+
+    def validate_genres(self, value):
+        """De-duplicate genres, keeping order"""
+        return list(dict.fromkeys(genre.strip() for genre in value if genre.strip()))
+
+    def validate(self, attrs):
+        """Require at least one filter and a valid price range"""
+        min_price = attrs.get('min_price', getattr(self.instance, 'min_price', None))
+        max_price = attrs.get('max_price', getattr(self.instance, 'max_price', None))
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise serializers.ValidationError({'min_price': 'min_price cannot be greater than max_price'})
+
+        filters = ('search', 'genres', 'min_price', 'max_price', 'currency')
+        if not any(attrs.get(name, getattr(self.instance, name, None)) for name in filters):
+            raise serializers.ValidationError('At least one filter is required.')
+        return attrs
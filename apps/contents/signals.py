@@ -0,0 +1,124 @@
+"""
+Signal handlers for Content search vector, USD price, buyer feed and cache maintenance
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.conf import settings
+from apps.core.constants import CONTENT_STATUS_PUBLIC
+from apps.core.object_cache import bump_stamps
+from apps.core.page_cache import invalidate_page_cache
+from .detail_cache import content_stamp, producer_contents_stamp
+from .feed import add_to_buyer_feeds
+from .models import BuyerFeed, Content, ExchangeRate
+from .saved_searches import match_saved_searches
+from .search import SEARCH_SOURCE_FIELDS, refresh_search_vectors
+
+
+@receiver(post_save, sender=Content)
+def update_content_search_vector(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    Keep the stored tsvector in sync when searchable fields change.
+    Saves limited to other fields (e.g. status, view_count) are skipped.
+    """
+    if raw:
+        return
+    if update_fields is not None and not SEARCH_SOURCE_FIELDS.intersection(update_fields):
+        return
+
+    refresh_search_vectors(Content.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def update_producer_search_vectors(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """
+    Producer company name is part of the search vector; refresh the
+    producer's contents when it may have changed.
+    """
+    if raw or created or instance.role != 'creator':
+        return
+    if update_fields is not None and 'company_name' not in update_fields:
+        return
+
+    refresh_search_vectors(Content.objects.filter(producer=instance))
+
+
+@receiver(post_save, sender=ExchangeRate)
+def sync_prices_on_rate_change(sender, instance, **kwargs):
+    """
+    Recompute price_usd for contents in the updated currency.
+    Also runs for raw saves so `loaddata` of a rate fixture refreshes prices.
+    """
+    instance.sync_content_prices()
+
+
+PUBLISH_FIELDS = {'status', 'genre_tags'}
+
+
+@receiver(pre_save, sender=Content)
+def remember_published_state(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    Snapshot the stored status and genres of public content being re-saved,
+    so handle_content_published can tell a publish from a plain edit
+    """
+    instance._published_state = None
+    if raw or instance._state.adding or instance.status != CONTENT_STATUS_PUBLIC:
+        return
+    if update_fields is not None and not PUBLISH_FIELDS.intersection(update_fields):
+        return
+
+    instance._published_state = Content.objects.filter(pk=instance.pk).values_list(
+        'status', 'genre_tags'
+    ).first()
+
+
+@receiver(post_save, sender=Content)
+def handle_content_published(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """
+    Once the save commits, add content that just became public (or whose
+    genres changed while public) to matching buyers' feeds and queue
+    saved-search matches. Other saves of public content do not fan out.
+    """
+    if raw or instance.status != CONTENT_STATUS_PUBLIC:
+        return
+    if not created:
+        previous = getattr(instance, '_published_state', None)
+        if previous is None:
+            return
+        status, genre_tags = previous
+        if status == CONTENT_STATUS_PUBLIC and genre_tags == instance.genre_tags:
+            return
+
+    def on_publish():
+        add_to_buyer_feeds(instance)
+        match_saved_searches(instance)
+
+    transaction.on_commit(on_publish)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def reset_buyer_feed(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """Drop a buyer's feed when their genres may have changed; it is rebuilt on next read"""
+    if raw or created or instance.role != 'buyer':
+        return
+    if update_fields is not None and 'genre_tags' not in update_fields:
+        return
+
+    BuyerFeed.objects.filter(buyer=instance).delete()
+
+
+@receiver(post_save, sender=Content)
+@receiver(post_delete, sender=Content)
+@receiver(post_save, sender=ExchangeRate)
+def invalidate_content_pages(sender, raw=False, **kwargs):
+    """Browse and booth pages list contents (and USD price ranges)"""
+    if not raw:
+        invalidate_page_cache()
+
+
+@receiver(post_save, sender=Content)
+@receiver(post_delete, sender=Content)
+def expire_content_detail_cache(sender, instance, raw=False, **kwargs):
+    """Cached detail payloads of the content and its producer's booth"""
+    if not raw:
+        bump_stamps(content_stamp(instance.pk), producer_contents_stamp(instance.producer_id))
@@ -0,0 +1,143 @@
+"""
+Precomputed "similar contents" recommendations
+
+Each public content is reduced to a compact feature vector:
+- genres as an integer bitmask (overlap = popcount of AND / OR)
+- price as log10(price_usd), so bands compare by order of magnitude
+- rating as an ordinal
+- producer id
+
+Candidates are gathered through an inverted index on genre bits and
+producer, scored, and the top-K per content are written to
+ContentSimilarity by `manage.py compute_similar_contents`.
+"""
+import heapq
+import math
+from collections import defaultdict, namedtuple
+
+from django.conf import settings
+from django.db import transaction
+
+from apps.core.constants import CONTENT_STATUS_PUBLIC, GENRE_TAGS, RATING_CHOICES
+from .models import Content, ContentSimilarity
+
+SIMILAR_TOP_K = getattr(settings, 'CONTENT_SIMILAR_TOP_K', 12)
+
+# Pairs scoring below this are not stored
+MIN_SCORE = 0.2
+
+WEIGHTS = {
+    'genres': 0.6,
+    'price': 0.2,
+    'rating': 0.1,
+    'producer': 0.1,
+}
+
+# Price gap (orders of magnitude) at which the price similarity reaches 0
+MAX_PRICE_GAP = 2.0
+
+RATING_ORDER = {rating: index for index, (rating, _) in enumerate(RATING_CHOICES)}
+
+Features = namedtuple('Features', ['id', 'producer_id', 'genre_mask', 'genre_bits', 'log_price', 'rating'])
+
+
+def build_features(rows):
+    """Turn Content .values() rows into Features, assigning one bit per genre"""
+    genre_bits = {genre: bit for bit, genre in enumerate(GENRE_TAGS)}
+    features = []
+    for row in rows:
+        mask = 0
+        for genre in row['genre_tags'] or []:
+            if genre not in genre_bits:
+                genre_bits[genre] = len(genre_bits)
+            mask |= 1 << genre_bits[genre]
+        price = row['price_usd']
+        features.append(Features(
+            id=row['id'],
+            producer_id=row['producer_id'],
+            genre_mask=mask,
+            genre_bits=[bit for bit in range(mask.bit_length()) if mask >> bit & 1],
+            log_price=math.log10(price) if price and price > 0 else None,
+            rating=RATING_ORDER.get(row['rating']),
+        ))
+    return features
+
+
+def score(a, b):
+    """Weighted similarity of two feature vectors, in [0, 1]"""
+    total = 0.0
+    union = a.genre_mask | b.genre_mask
+    if union:
+        total += WEIGHTS['genres'] * (a.genre_mask & b.genre_mask).bit_count() / union.bit_count()
+    if a.log_price is not None and b.log_price is not None:
+        gap = min(abs(a.log_price - b.log_price), MAX_PRICE_GAP)
+        total += WEIGHTS['price'] * (1 - gap / MAX_PRICE_GAP)
+    if a.rating is not None and b.rating is not None:
+        total += WEIGHTS['rating'] * max(0.0, 1 - abs(a.rating - b.rating) / 2)
+    if a.producer_id == b.producer_id:
+        total += WEIGHTS['producer']
+    return total
+
+
+def compute_neighbors(features, top_k=SIMILAR_TOP_K):
+    """
+    Top-K most similar items per item. Only items sharing a genre or a
+    producer are compared, via inverted indexes.
+
+    Returns:
+        dict: {content_id: [(similar_id, score), ...]} best first
+    """
+    by_genre = defaultdict(list)
+    by_producer = defaultdict(list)
+    for index, item in enumerate(features):
+        for bit in item.genre_bits:
+            by_genre[bit].append(index)
+        by_producer[item.producer_id].append(index)
+
+    neighbors = {}
+    for index, item in enumerate(features):
+        candidates = set(by_producer[item.producer_id])
+        for bit in item.genre_bits:
+            candidates.update(by_genre[bit])
+        candidates.discard(index)
+
+        scored = (
+            (score(item, features[other]), -features[other].id)
+            for other in candidates
+        )
+        best = heapq.nlargest(top_k, (pair for pair in scored if pair[0] >= MIN_SCORE))
+        neighbors[item.id] = [(-negative_id, round(value, 4)) for value, negative_id in best]
+    return neighbors
+
+
+def rebuild_similar_contents(top_k=SIMILAR_TOP_K):
+    """
+    Recompute the neighbor table for all public contents and swap it in
+    within one transaction.
+
+    Returns:
+        int: number of stored neighbor rows
+    """
+    rows = Content.objects.filter(status=CONTENT_STATUS_PUBLIC).values(
+        'id', 'producer_id', 'genre_tags', 'price_usd', 'rating'
+    ).order_by()
+    neighbors = compute_neighbors(build_features(rows), top_k)
+
+    links = [
+        ContentSimilarity(content_id=content_id, similar_id=similar_id, rank=rank, score=value)
+        for content_id, similar in neighbors.items()
+        for rank, (similar_id, value) in enumerate(similar, start=1)
+    ]
+    with transaction.atomic():
+        ContentSimilarity.objects.all().delete()
+        ContentSimilarity.objects.bulk_create(links, batch_size=1000)
+    return len(links)
+
+
+def similar_contents(content_id, limit=SIMILAR_TOP_K):
+    """Precomputed neighbors of a content that are still public, best first (one query)"""
+    links = ContentSimilarity.objects.filter(
+        content_id=content_id,
+        similar__status=CONTENT_STATUS_PUBLIC,
+    ).select_related('similar__producer').defer('similar__search_vector').order_by('rank')[:limit]
+    return [link.similar for link in links]
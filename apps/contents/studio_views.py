@@ -1,12 +1,19 @@
 """
 Producer Studio API views for content management (CRUD)
 """
+from datetime import timedelta
+
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
-from django.db.models import Count
-from drf_spectacular.utils import extend_schema, OpenApiResponse
+from django.db.models import Count, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
 
+from apps.analytics.models import ContentDailyStats, ViewerSketch
+from apps.analytics.rollups import INTERVALS, INTERVAL_DAY, stats_timeseries, stats_totals
+from apps.analytics.services import unique_viewer_summary
 from apps.core.response import success_response, error_response, paginated_response
 from apps.core.permissions import IsProducer, IsOnboarded
 from apps.core.constants import CONTENT_STATUS_PUBLIC, CONTENT_STATUS_DELETED
@@ -191,6 +198,12 @@ class StudioContentStatsView(APIView):
     permission_classes = [IsProducer, IsOnboarded]
 
     @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                'content_id', int,
+                description='Limit unique viewer figures to one of your contents'
+            ),
+        ],
         responses={200: OpenApiResponse(description='Content statistics')}
     )
     def get(self, request):
@@ -199,15 +212,114 @@ class StudioContentStatsView(APIView):
             status=CONTENT_STATUS_DELETED
         )
 
-        stats = {
-            'total_contents': contents.count(),
-            'public_contents': contents.filter(status=CONTENT_STATUS_PUBLIC).count(),
-            'draft_contents': contents.filter(status='draft').count(),
-            'total_views': sum(c.view_count for c in contents),
-            'total_offers': sum(c.offer_set.count() for c in contents),
-        }
+        stats = contents.aggregate(
+            total_contents=Count('id'),
+            public_contents=Count('id', filter=Q(status=CONTENT_STATUS_PUBLIC)),
+            draft_contents=Count('id', filter=Q(status='draft')),
+        )
+
+        # Activity totals from the daily rollup (one indexed query)
+        totals = stats_totals(ContentDailyStats.objects.filter(
+            producer=request.user
+        ).exclude(content__status=CONTENT_STATUS_DELETED))
+        stats.update({
+            'total_views': totals['views'],
+            'total_offers': totals['offers_received'],
+            'accepted_offers': totals['offers_accepted'],
+            'total_lois': totals['lois'],
+        })
+
+        # Distinct viewers (HyperLogLog estimates) for today / 7 / 30 days
+        viewed_contents = contents
+        content_id = request.query_params.get('content_id')
+        if content_id:
+            if not content_id.isdigit() or not contents.filter(pk=content_id).exists():
+                return error_response(
+                    message="Content not found",
+                    status_code=status.HTTP_404_NOT_FOUND
+                )
+            viewed_contents = contents.filter(pk=content_id)
+        stats['unique_viewers'] = unique_viewer_summary(
+            ViewerSketch.TARGET_CONTENT, viewed_contents.values('pk')
+        )
+        booth = getattr(request.user, 'booth', None)
+        stats['booth_unique_viewers'] = unique_viewer_summary(
+            ViewerSketch.TARGET_BOOTH, [booth.pk]
+        ) if booth else None
 
         return success_response(
             data=stats,
             message="Statistics retrieved successfully"
         )
+
+
+@extend_schema(tags=['Studio - Content Management'])
+class StudioContentTimeseriesView(APIView):
+    """Producer's daily/weekly/monthly activity time series"""
+    permission_classes = [IsProducer, IsOnboarded]
+
+    # Longest range served in one request
+    max_days = 366
+    default_days = 30
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('start', str, description='Start date (YYYY-MM-DD, default: 30 days ago)'),
+            OpenApiParameter('end', str, description='End date (YYYY-MM-DD, default: today)'),
+            OpenApiParameter('interval', str, description='day (default), week or month'),
+            OpenApiParameter('content_id', int, description='Limit to one of your contents'),
+        ],
+        responses={200: OpenApiResponse(description='Activity time series')}
+    )
+    def get(self, request):
+        """Get views, offers and LOIs per period for current producer"""
+        interval = request.query_params.get('interval', INTERVAL_DAY)
+        if interval not in INTERVALS:
+            return error_response(
+                message="interval must be one of: " + ', '.join(INTERVALS),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            end = parse_date(request.query_params.get('end', '')) or timezone.localdate()
+            start = parse_date(request.query_params.get('start', '')) or (
+                end - timedelta(days=self.default_days - 1)
+            )
+        except ValueError:
+            start = end = None
+        if start is None or end is None or start > end:
+            return error_response(
+                message="Invalid date range",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        if (end - start).days >= self.max_days:
+            return error_response(
+                message=f"Date range cannot exceed {self.max_days} days",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Same scope as StudioContentStatsView: deleted contents are not counted
+        queryset = ContentDailyStats.objects.filter(
+            producer=request.user
+        ).exclude(content__status=CONTENT_STATUS_DELETED)
+        content_id = request.query_params.get('content_id')
+        if content_id:
+            contents = Content.objects.filter(producer=request.user).exclude(
+                status=CONTENT_STATUS_DELETED
+            )
+            if not content_id.isdigit() or not contents.filter(pk=content_id).exists():
+                return error_response(
+                    message="Content not found",
+                    status_code=status.HTTP_404_NOT_FOUND
+                )
+            queryset = queryset.filter(content_id=content_id)
+
+        return success_response(
+            data={
+                'interval': interval,
+                'start': start,
+                'end': end,
+                'series': stats_timeseries(queryset, start, end, interval),
+            },
+            message="Statistics retrieved successfully"
+        )
@@ -0,0 +1,769 @@
+"""
+Tests for content recommendation and caching helpers
+"""
+import time
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.accounts.models import User
+from apps.analytics.models import ContentDailyStats
+from apps.analytics.rollups import increment_daily_stats
+from apps.core.constants import CONTENT_STATUS_DRAFT, CONTENT_STATUS_PUBLIC
+from apps.core.object_cache import bump_stamps
+from .detail_cache import content_stamp, get_public_content, missing_content_cache
+from .feed import base_score, feed_score
+from .models import BuyerFeed, Content, ContentSimilarity, ExchangeRate, SavedSearch, SavedSearchMatch
+from .search import suggest
+from .similarity import build_features, compute_neighbors
+from .trending import (
+    ACCEPTED_OFFER_WEIGHT, HALF_LIFE_DAYS, RECENCY_WEIGHT, WINDOW_DAYS, refresh_trending_scores,
+)
+
+
+def _row(pk, genres, price, rating='all', producer=1):
+    return {
+        'id': pk,
+        'producer_id': producer,
+        'genre_tags': genres,
+        'price_usd': Decimal(price),
+        'rating': rating,
+    }
+
+
+def create_producer(username='studio'):
+    return User.objects.create_user(
+        username=username,
+        email=f'{username}@example.com',
+        password='password123',
+        role=User.Role.CREATOR,
+        company_name=username.title(),
+    )
+
+
+def create_content(producer, title='Content', status=CONTENT_STATUS_PUBLIC, **kwargs):
+    values = {
+        'producer': producer,
+        'title': title,
+        'description': f'{title} description',
+        'genre_tags': ['drama'],
+        'price': Decimal('100.00'),
+        'duration_seconds': 60,
+        'status': status,
+    }
+    values.update(kwargs)
+    return Content.objects.create(**values)
+
+
+class SimilarContentsTestCase(SimpleTestCase):
+    """Test neighbor scoring (no database required)"""
+
+    def test_neighbors_ranked_by_genre_overlap_and_price(self):
+        """Test closer genre and price matches rank higher"""
+        features = build_features([
+            _row(1, ['drama', 'romance'], '100', producer=1),
+            _row(2, ['drama', 'romance'], '120', producer=2),
+            _row(3, ['drama'], '5000', producer=3),
+            _row(4, ['action'], '100', producer=4),
+        ])
+
+        neighbors = compute_neighbors(features, top_k=5)
+
+        self.assertEqual([pk for pk, _ in neighbors[1]], [2, 3])
+        self.assertGreater(neighbors[1][0][1], neighbors[1][1][1])
+        # No shared genre or producer: never compared
+        self.assertEqual(neighbors[4], [])
+
+    def test_same_producer_is_a_candidate_without_shared_genres(self):
+        """Test contents from the same producer are compared even across genres"""
+        features = build_features([
+            _row(1, ['action'], '100', producer=7),
+            _row(2, ['comedy'], '100', producer=7),
+        ])
+
+        neighbors = compute_neighbors(features)
+
+        self.assertEqual([pk for pk, _ in neighbors[1]], [2])
+
+    def test_top_k_limits_neighbors(self):
+        """Test at most top_k neighbors are kept"""
+        features = build_features([
+            _row(pk, ['drama'], '100', producer=pk) for pk in range(1, 8)
+        ])
+
+        neighbors = compute_neighbors(features, top_k=3)
+
+        self.assertEqual(len(neighbors[1]), 3)
+
+
+class BuyerFeedScoreTestCase(SimpleTestCase):
+    """Test feed scoring (no database required)"""
+
+    def test_genre_overlap_dominates(self):
+        """Test covering more of the buyer's genres scores higher"""
+        genres = ['drama', 'romance']
+
+        self.assertGreater(
+            base_score(genres, ['drama', 'romance'], 0),
+            base_score(genres, ['drama'], 0)
+        )
+        self.assertEqual(base_score(genres, ['action'], 0), 0)
+
+    def test_recency_decays_at_read_time(self):
+        """Test stored entries lose recency weight as they age"""
+        now = time.time()
+        fresh = [1, 0.5, int(now)]
+        week_old = [2, 0.5, int(now - 7 * 86400)]
+
+        self.assertGreater(feed_score(fresh, now), feed_score(week_old, now))
+        self.assertAlmostEqual(feed_score(fresh, now) - feed_score(week_old, now), 0.25, places=2)
+
+
+class NegativeCacheTestCase(SimpleTestCase):
+    """Test repeated lookups of missing contents skip the database"""
+
+    def setUp(self):
+        cache.clear()
+        missing_content_cache.clear_local()
+        self.queryset = mock.Mock()
+        self.queryset.filter.return_value.first.return_value = None
+
+    def test_missing_id_is_queried_once(self):
+        """Test the second lookup of an unknown id is answered from the cache"""
+        self.assertIsNone(get_public_content(404, self.queryset))
+        self.assertIsNone(get_public_content(404, self.queryset))
+
+        self.assertEqual(self.queryset.filter.call_count, 1)
+
+    def test_saving_the_content_clears_the_entry(self):
+        """Test a bump of the content stamp (post_save, e.g. publish) forces a new lookup"""
+        get_public_content(404, self.queryset)
+        bump_stamps(content_stamp(404))
+        get_public_content(404, self.queryset)
+
+        self.assertEqual(self.queryset.filter.call_count, 2)
+
+
+class ContentListConditionalGetTestCase(TestCase):
+    """Test list ETags follow columns written by bulk UPDATEs"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse('contents_api:content_list')
+        producer = create_producer()
+        create_content(producer, 'First')
+        create_content(producer, 'Second')
+
+    def test_trending_refresh_changes_etag(self):
+        """Test a trending score refresh (no updated_at change) is not answered with 304"""
+        response = self.client.get(self.url, {'ordering': 'trending'})
+        etag = response['ETag']
+
+        self.assertGreater(refresh_trending_scores(), 0)
+        response = self.client.get(self.url, {'ordering': 'trending'}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_view_count_update_changes_etag(self):
+        """Test bulk view counter UPDATEs invalidate the list ETag"""
+        response = self.client.get(self.url, {'ordering': '-view_count'})
+        etag = response['ETag']
+
+        Content.objects.filter(title='First').update(view_count=5)
+        response = self.client.get(self.url, {'ordering': '-view_count'}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+
+
+class ContentListCursorTestCase(TestCase):
+    """Test cursor paging over contents without a USD price"""
+
+    def setUp(self):
+        cache.clear()
+        producer = create_producer()
+        for index, price in enumerate(['300.00', '200.00', '100.00']):
+            create_content(producer, f'Priced {index}', price=Decimal(price))
+        # Without a KRW rate these have no price_usd
+        ExchangeRate.objects.filter(currency='KRW').delete()
+        for index in range(2):
+            create_content(producer, f'Unpriced {index}', currency='KRW')
+
+    def test_pages_reach_rows_with_null_price(self):
+        """Test rows without price_usd are paged last instead of failing the cursor"""
+        url = reverse('contents_api:content_list')
+        titles = []
+        params = {'ordering': '-price', 'cursor': ''}
+        with self.settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'PAGE_SIZE': 2}):
+            while True:
+                response = APIClient().get(url, params)
+                self.assertEqual(response.status_code, 200)
+                titles += [row['title'] for row in response.data['data']]
+                next_link = response.data['pagination']['next']
+                if next_link is None:
+                    break
+                params['cursor'] = parse_qs(urlsplit(next_link).query)['cursor'][0]
+
+        self.assertEqual(
+            titles,
+            ['Priced 0', 'Priced 1', 'Priced 2', 'Unpriced 1', 'Unpriced 0']
+        )
+
+
+class TrendingScoreTestCase(TestCase):
+    """Test trending scores follow the decay of rollup activity"""
+
+    def setUp(self):
+        self.producer = create_producer()
+        self.today = timezone.localdate()
+
+    def _content(self, title, age_days=30, **kwargs):
+        content = create_content(self.producer, title, **kwargs)
+        # Backdate so the new-release boost is (almost) gone
+        Content.objects.filter(pk=content.pk).update(created_at=timezone.now() - timedelta(days=age_days))
+        return content
+
+    def _activity(self, content, days_ago=0, **counts):
+        ContentDailyStats.objects.create(
+            producer=self.producer,
+            content=content,
+            day=self.today - timedelta(days=days_ago),
+            **counts
+        )
+
+    def _scores(self):
+        refresh_trending_scores()
+        return dict(Content.objects.values_list('title', 'trending_score'))
+
+    def test_views_decay_with_age(self):
+        """Test recent views outweigh the same views a few days old, by the half-life"""
+        recent, old = self._content('Recent'), self._content('Old')
+        self._activity(recent, views=10)
+        self._activity(old, days_ago=HALF_LIFE_DAYS, views=10)
+
+        scores = self._scores()
+        boost = RECENCY_WEIGHT * 0.5 ** (30 / HALF_LIFE_DAYS)
+
+        self.assertAlmostEqual(scores['Recent'], 10 + boost, places=3)
+        self.assertAlmostEqual(scores['Old'], 5 + boost, places=3)
+
+    def test_accepted_offers_outweigh_views(self):
+        """Test one accepted offer counts for more than many views"""
+        accepted, viewed = self._content('Accepted'), self._content('Viewed')
+        self._activity(accepted, offers_accepted=1)
+        self._activity(viewed, views=ACCEPTED_OFFER_WEIGHT - 10)
+
+        scores = self._scores()
+
+        self.assertGreater(scores['Accepted'], scores['Viewed'])
+
+    def test_activity_outside_window_is_ignored(self):
+        """Test only the recency boost remains for stale activity"""
+        content = self._content('Stale', age_days=0)
+        self._activity(content, days_ago=WINDOW_DAYS, views=1000)
+
+        self.assertAlmostEqual(self._scores()['Stale'], RECENCY_WEIGHT, places=1)
+
+    def test_non_public_contents_are_reset(self):
+        """Test contents that left the public listing drop to 0"""
+        draft = self._content('Draft', status=CONTENT_STATUS_DRAFT)
+        Content.objects.filter(pk=draft.pk).update(trending_score=12.5)
+        self._activity(draft, views=10)
+
+        self.assertEqual(self._scores()['Draft'], 0)
+
+    def test_unchanged_scores_are_not_rewritten(self):
+        """Test a second refresh with the same inputs updates nothing"""
+        content = self._content('Stable', age_days=365)
+        self._activity(content, days_ago=1, views=3)
+
+        with mock.patch('apps.contents.trending.timezone.now', return_value=timezone.now()):
+            self.assertEqual(refresh_trending_scores(), 1)
+            self.assertEqual(refresh_trending_scores(), 0)
+
+
+class StudioTimeseriesTestCase(TestCase):
+    """Test the activity time series matches the stats endpoint's scope"""
+
+    def setUp(self):
+        self.producer = create_producer()
+        self.producer.is_onboarded = True
+        self.producer.save(update_fields=['is_onboarded'])
+        self.content = create_content(self.producer, 'Live')
+        self.deleted = create_content(self.producer, 'Removed')
+        self.deleted.soft_delete()
+        increment_daily_stats('views', {self.content.pk: 3, self.deleted.pk: 5})
+        self.client = APIClient()
+        self.client.force_authenticate(self.producer)
+        self.url = reverse('studio_contents:content_stats_timeseries')
+
+    def test_deleted_contents_are_not_counted(self):
+        """Test series totals agree with the stats endpoint"""
+        response = self.client.get(self.url)
+        stats = self.client.get(reverse('studio_contents:content_stats'))
+
+        self.assertEqual(response.status_code, 200)
+        total = sum(row['views'] for row in response.data['data']['series'])
+        self.assertEqual(total, 3)
+        self.assertEqual(stats.data['data']['total_views'], total)
+
+    def test_foreign_or_deleted_content_id_is_not_found(self):
+        """Test content_id must be one of the producer's live contents, like the stats view"""
+        other = create_content(create_producer('other'), 'Other')
+
+        for content_id in (other.pk, self.deleted.pk, 'abc'):
+            response = self.client.get(self.url, {'content_id': content_id})
+            self.assertEqual(response.status_code, 404)
+
+        response = self.client.get(self.url, {'content_id': self.content.pk})
+        self.assertEqual(response.status_code, 200)
+
+
+class SavedSearchMatchingTestCase(TestCase):
+    """Test which saved searches a content matches when it is published"""
+
+    def setUp(self):
+        self.producer = create_producer()
+        self.buyer = User.objects.create_user(
+            username='buyer', email='buyer@example.com', password='password123',
+            role=User.Role.BUYER, is_onboarded=True,
+        )
+        ExchangeRate.objects.update_or_create(currency='EUR', defaults={'usd_rate': Decimal('1.08')})
+
+    def _search(self, name, **kwargs):
+        return SavedSearch.objects.create(buyer=self.buyer, name=name, **kwargs)
+
+    def _publish(self, content):
+        content.status = CONTENT_STATUS_PUBLIC
+        with self.captureOnCommitCallbacks(execute=True):
+            content.save()
+
+    def _matched(self, content):
+        return set(SavedSearchMatch.objects.filter(content=content).values_list(
+            'saved_search__name', flat=True
+        ))
+
+    def _draft(self, **kwargs):
+        values = {
+            'title': 'Ocean Story',
+            'genre_tags': ['drama', 'thriller'],
+            'price': Decimal('100.00'),
+            'currency': 'EUR',
+            'status': CONTENT_STATUS_DRAFT,
+        }
+        values.update(kwargs)
+        return create_content(self.producer, **values)
+
+    def test_genre_modes(self):
+        """Test any = overlap, all = every saved genre on the content, none = everything"""
+        self._search('any', genres=['drama', 'romance'], genre_mode='any')
+        self._search('all-missing', genres=['drama', 'romance'], genre_mode='all')
+        self._search('all-present', genres=['drama', 'thriller'], genre_mode='all')
+        self._search('unrelated', genres=['comedy'], genre_mode='any')
+        self._search('no-genres')
+        content = self._draft()
+
+        self._publish(content)
+
+        self.assertEqual(self._matched(content), {'any', 'all-present', 'no-genres'})
+
+    def test_price_bounds_use_usd_unless_currency_is_set(self):
+        """Test bounds compare price_usd across currencies and raw price within one"""
+        self._search('usd-under-120', max_price=Decimal('120'))
+        self._search('usd-under-100', max_price=Decimal('100'))
+        self._search('usd-over-110', min_price=Decimal('110'))
+        self._search('eur-under-100', currency='EUR', max_price=Decimal('100'))
+        self._search('usd-only', currency='USD', max_price=Decimal('1000'))
+        content = self._draft()
+
+        self._publish(content)
+
+        # 100 EUR = 108 USD
+        self.assertEqual(self._matched(content), {'usd-under-120', 'eur-under-100'})
+
+    def test_text_terms_are_checked_per_search(self):
+        """Test only searches whose text matches the content are matched"""
+        self._search('ocean', search='ocean')
+        self._search('volcano', search='volcano')
+        self._search('ocean-comedy', search='ocean', genres=['comedy'], genre_mode='any')
+        content = self._draft()
+
+        self._publish(content)
+
+        self.assertEqual(self._matched(content), {'ocean'})
+
+    def test_matches_are_only_queued_on_publish(self):
+        """Test drafts and edits of public content do not queue matches"""
+        self._search('no-genres')
+        content = self._draft()
+        self.assertEqual(self._matched(content), set())
+
+        self._publish(content)
+        self.assertEqual(self._matched(content), {'no-genres'})
+
+        SavedSearchMatch.objects.all().delete()
+        content.title = 'Ocean Story (renamed)'
+        with self.captureOnCommitCallbacks(execute=True):
+            content.save()
+        self.assertEqual(self._matched(content), set())
+
+
+class ContentPriceNormalizationTestCase(TestCase):
+    """Test USD-normalized prices across mixed-currency contents"""
+
+    def setUp(self):
+        cache.clear()
+        self.producer = create_producer()
+        for currency, rate in (('EUR', '1.08'), ('KRW', '0.00072')):
+            ExchangeRate.objects.update_or_create(currency=currency, defaults={'usd_rate': Decimal(rate)})
+        self.usd = create_content(self.producer, 'Dollars', price=Decimal('100.00'), currency='USD')
+        self.eur = create_content(self.producer, 'Euros', price=Decimal('100.00'), currency='EUR')
+        self.krw = create_content(self.producer, 'Won', price=Decimal('100000.00'), currency='KRW')
+        self.url = reverse('contents_api:content_list')
+
+    def _titles(self, **params):
+        response = APIClient().get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return [row['title'] for row in response.data['data']]
+
+    def test_save_keeps_price_usd_in_sync(self):
+        """Test price_usd follows price/currency, including update_fields saves"""
+        self.assertEqual(self.usd.price_usd, Decimal('100.00'))
+        self.assertEqual(self.eur.price_usd, Decimal('108.00'))
+        self.assertEqual(self.krw.price_usd, Decimal('72.00'))
+
+        self.eur.price = Decimal('50.00')
+        self.eur.save(update_fields=['price'])
+        self.eur.refresh_from_db()
+
+        self.assertEqual(self.eur.price_usd, Decimal('54.00'))
+
+    def test_rate_change_resyncs_prices(self):
+        """Test saving a rate recomputes price_usd of contents in that currency only"""
+        rate = ExchangeRate.objects.get(currency='EUR')
+        rate.usd_rate = Decimal('1.20')
+        rate.save()
+
+        self.eur.refresh_from_db()
+        self.krw.refresh_from_db()
+        self.assertEqual(self.eur.price_usd, Decimal('120.00'))
+        self.assertEqual(self.krw.price_usd, Decimal('72.00'))
+
+    def test_bounds_without_currency_are_usd(self):
+        """Test price bounds compare USD amounts across currencies"""
+        self.assertEqual(self._titles(min_price='90', max_price='105'), ['Dollars'])
+        self.assertEqual(set(self._titles(max_price='80')), {'Won'})
+
+    def test_bounds_with_currency_use_raw_price(self):
+        """Test price bounds compare raw prices within the selected currency"""
+        self.assertEqual(self._titles(currency='KRW', min_price='50000'), ['Won'])
+        self.assertEqual(self._titles(currency='EUR', max_price='105'), ['Euros'])
+        self.assertEqual(self._titles(currency='EUR', max_price='99'), [])
+
+    def test_price_ordering_uses_usd_amounts(self):
+        """Test ordering=price sorts mixed currencies by their USD value"""
+        self.assertEqual(self._titles(ordering='price'), ['Won', 'Dollars', 'Euros'])
+        self.assertEqual(self._titles(ordering='-price'), ['Euros', 'Dollars', 'Won'])
+
+
+class ContentGenreFilterTestCase(TestCase):
+    """Test ?genre=...&genre_mode=any|all on the content list"""
+
+    def setUp(self):
+        cache.clear()
+        producer = create_producer()
+        create_content(producer, 'Drama', genre_tags=['drama'])
+        create_content(producer, 'Romantic drama', genre_tags=['drama', 'romance'])
+        create_content(producer, 'Comedy', genre_tags=['comedy'])
+        self.url = reverse('contents_api:content_list')
+
+    def _titles(self, params):
+        response = APIClient().get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return {row['title'] for row in response.data['data']}
+
+    def test_all_mode_requires_every_genre(self):
+        """Test genre_mode=all (the default) matches contents with every genre"""
+        self.assertEqual(
+            self._titles({'genre': 'drama,romance', 'genre_mode': 'all'}), {'Romantic drama'}
+        )
+        self.assertEqual(self._titles({'genre': 'drama,romance'}), {'Romantic drama'})
+
+    def test_any_mode_matches_one_genre(self):
+        """Test genre_mode=any matches contents with at least one genre"""
+        self.assertEqual(
+            self._titles({'genre': 'romance,comedy', 'genre_mode': 'any'}),
+            {'Romantic drama', 'Comedy'}
+        )
+
+    def test_repeated_genre_params(self):
+        """Test repeated ?genre= values combine like a comma-separated list"""
+        response = APIClient().get(self.url + '?genre=drama&genre=romance&genre_mode=all')
+
+        self.assertEqual({row['title'] for row in response.data['data']}, {'Romantic drama'})
+
+    def test_invalid_genre_mode_is_rejected(self):
+        """Test an unknown genre_mode returns 400"""
+        response = APIClient().get(self.url, {'genre': 'drama', 'genre_mode': 'some'})
+
+        self.assertEqual(response.status_code, 400)
+
+
+class ContentFacetsTestCase(TestCase):
+    """Test facet counts of the filtered public contents"""
+
+    def setUp(self):
+        cache.clear()
+        producer = create_producer()
+        ExchangeRate.objects.update_or_create(currency='EUR', defaults={'usd_rate': Decimal('1.08')})
+        # No JPY rate: the content has no price_usd and falls in no price range
+        ExchangeRate.objects.filter(currency='JPY').delete()
+        create_content(producer, 'Cheap', price=Decimal('50.00'), rating='all')
+        create_content(producer, 'Boundary', genre_tags=['drama', 'romance'], price=Decimal('100.00'), rating='12')
+        create_content(producer, 'Euro', price=Decimal('1000.00'), currency='EUR', rating='12')
+        create_content(producer, 'Yen', price=Decimal('5000.00'), currency='JPY', rating='19')
+        # Outside the filter
+        create_content(producer, 'Comedy', genre_tags=['comedy'], price=Decimal('6000.00'))
+        create_content(producer, 'Draft', status=CONTENT_STATUS_DRAFT)
+
+    def test_counts_under_genre_filter(self):
+        """Test genre, currency, rating and price range counts for ?genre=drama"""
+        response = APIClient().get(reverse('contents_api:content_facets'), {'genre': 'drama'})
+
+        self.assertEqual(response.status_code, 200)
+        facets = response.data['data']
+        self.assertEqual(facets['total'], 4)
+        self.assertEqual(facets['genres'], {'drama': 4, 'romance': 1})
+        self.assertEqual(facets['currencies'], {'USD': 2, 'EUR': 1, 'JPY': 1})
+        self.assertEqual(facets['ratings'], {'all': 1, '12': 2, '19': 1})
+        self.assertEqual(
+            [(bucket['key'], bucket['count']) for bucket in facets['price_ranges']],
+            [('0-100', 1), ('100-500', 1), ('500-1000', 0), ('1000-5000', 1), ('5000+', 0)]
+        )
+
+    def test_open_ended_bucket(self):
+        """Test prices above the last threshold land in the open-ended range"""
+        response = APIClient().get(reverse('contents_api:content_facets'), {'genre': 'comedy'})
+
+        price_ranges = response.data['data']['price_ranges']
+        self.assertEqual(price_ranges[-1], {'key': '5000+', 'min': 5000, 'max': None, 'count': 1})
+        self.assertEqual(sum(bucket['count'] for bucket in price_ranges), 1)
+
+
+def trigram_opclasses_available():
+    """pg_trgm index operator classes (search tests of the typo path need the real extension)"""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_opclass WHERE opcname = 'gin_trgm_ops'")
+        return cursor.fetchone() is not None
+
+
+class ContentSearchTestCase(TestCase):
+    """Test full-text and trigram search, and autocomplete"""
+
+    def setUp(self):
+        cache.clear()
+        self.producer = create_producer('harbor')
+        self.producer.company_name = 'Blue Harbor Pictures'
+        self.producer.save()
+        self.voyage = create_content(
+            self.producer, 'Ocean Voyage', description='A crew sails for months.'
+        )
+        self.nights = create_content(
+            create_producer('nights'), 'Quiet Nights',
+            description='A lighthouse keeper watches the ocean.'
+        )
+        self.url = reverse('contents_api:content_list')
+
+    def _require_trigram(self):
+        if not trigram_opclasses_available():
+            self.skipTest('pg_trgm operator classes are not installed')
+
+    def _titles(self, **params):
+        response = APIClient().get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return [row['title'] for row in response.data['data']]
+
+    def test_title_matches_rank_above_description_matches(self):
+        """Test relevance ordering puts title (weight A) hits before description (C) hits"""
+        self.assertEqual(self._titles(search='ocean'), ['Ocean Voyage', 'Quiet Nights'])
+        self.assertEqual(self._titles(search='ocean', ordering='relevance'), ['Ocean Voyage', 'Quiet Nights'])
+
+    def test_producer_name_matches(self):
+        """Test contents are found by their producer's company name"""
+        self.assertEqual(self._titles(search='harbor'), ['Ocean Voyage'])
+
+    def test_producer_rename_refreshes_search_vectors(self):
+        """Test renaming a company re-indexes the producer's contents"""
+        self.producer.company_name = 'Red Lantern Films'
+        self.producer.save(update_fields=['company_name'])
+
+        self.assertEqual(self._titles(search='lantern'), ['Ocean Voyage'])
+        self.assertEqual(self._titles(search='harbor'), [])
+
+    def test_title_edit_refreshes_search_vector(self):
+        """Test saving a new title re-indexes the content"""
+        self.nights.title = 'Lighthouse Nights'
+        self.nights.save(update_fields=['title', 'updated_at'])
+
+        self.assertIn('Lighthouse Nights', self._titles(search='lighthouse'))
+
+    def test_misspelled_title_matches_by_trigram(self):
+        """Test typos still find the title through trigram similarity"""
+        self._require_trigram()
+
+        self.assertEqual(self._titles(search='ocaen voyage'), ['Ocean Voyage'])
+
+    def test_suggest_requires_min_length(self):
+        """Test one-character queries are rejected"""
+        response = APIClient().get(reverse('contents_api:content_suggest'), {'q': 'o'})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_suggest_matches_titles_and_producers(self):
+        """Test prefixes match titles and producer names"""
+        self._require_trigram()
+
+        response = APIClient().get(reverse('contents_api:content_suggest'), {'q': 'ocea'})
+        self.assertEqual(
+            [item['title'] for item in response.data['data']['titles']], ['Ocean Voyage']
+        )
+
+        result = suggest('harbo')
+        self.assertEqual(
+            result['producers'],
+            [{'name': 'Blue Harbor Pictures', 'booth_slug': self.producer.booth_slug}]
+        )
+
+    def test_suggest_cache_is_keyed_by_normalized_query(self):
+        """Test case and spacing variants of a query share one cache entry"""
+        first = suggest('Ocean  Voy')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(suggest(' ocean voy '), first)
+        with self.assertNumQueries(2):
+            suggest('ocean voy', limit=3)
+
+
+class ContentFeedViewTestCase(TestCase):
+    """Test the buyer feed requires completed onboarding"""
+
+    def setUp(self):
+        create_content(create_producer(), 'Drama')
+        self.buyer = User.objects.create_user(
+            username='buyer', email='buyer@example.com', password='password123',
+            role=User.Role.BUYER, genre_tags=['drama'],
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.buyer)
+        self.url = reverse('contents_api:content_feed')
+
+    def test_buyer_without_onboarding_is_rejected(self):
+        """Test the standard onboarding rejection instead of a feed without genres"""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(BuyerFeed.objects.filter(buyer=self.buyer).exists())
+
+    def test_onboarded_buyer_gets_feed(self):
+        """Test onboarded buyers get their ranked feed"""
+        self.buyer.is_onboarded = True
+        self.buyer.save(update_fields=['is_onboarded'])
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row['title'] for row in response.data['data']], ['Drama'])
+
+
+class SavedSearchMatchesPaginationTestCase(TestCase):
+    """Test keyset pages of saved-search matches"""
+
+    def test_cursor_pages_follow_match_time(self):
+        """Test ?cursor= walks past the first page, newest match first"""
+        producer = create_producer()
+        contents = [create_content(producer, f'Content {i}') for i in range(25)]
+        buyer = User.objects.create_user(
+            username='buyer', email='buyer@example.com', password='password123',
+            role=User.Role.BUYER, is_onboarded=True,
+        )
+        saved_search = SavedSearch.objects.create(buyer=buyer, genres=['drama'])
+        SavedSearchMatch.objects.bulk_create([
+            SavedSearchMatch(saved_search=saved_search, content=content)
+            for content in contents
+        ])
+        # Match times in reverse creation order
+        base = timezone.now()
+        for i, content in enumerate(contents):
+            SavedSearchMatch.objects.filter(content=content).update(created_at=base - timedelta(minutes=i))
+
+        client = APIClient()
+        client.force_authenticate(buyer)
+        url = reverse('contents_api:saved_search_matches', args=[saved_search.pk])
+
+        first = client.get(url, {'cursor': ''}).json()
+        second = client.get(first['pagination']['next']).json()
+
+        ids = [item['id'] for item in first['data'] + second['data']]
+        self.assertEqual(ids, [content.pk for content in contents])
+        self.assertIsNone(second['pagination']['next'])
+
+
+class ContentSimilarViewTestCase(TestCase):
+    """Test similar contents are only served for public contents"""
+
+    def test_unpublished_content_hides_precomputed_neighbors(self):
+        """Test a draft with stored neighbors returns 404, not its neighbor list"""
+        producer = create_producer()
+        draft = create_content(producer, 'Draft', status=CONTENT_STATUS_DRAFT)
+        neighbor = create_content(producer, 'Neighbor')
+        ContentSimilarity.objects.create(content=draft, similar=neighbor, rank=1, score=0.9)
+
+        response = APIClient().get(reverse('contents_api:content_similar', args=[draft.pk]))
+
+        self.assertEqual(response.status_code, 404)
+
+
+class ContentPublishFanOutTestCase(TestCase):
+    """Test feeds and saved searches are only updated when content is published"""
+
+    def setUp(self):
+        self.producer = create_producer()
+
+    def _save(self, content, **kwargs):
+        with mock.patch('apps.contents.signals.add_to_buyer_feeds') as add_to_feeds, \
+                mock.patch('apps.contents.signals.match_saved_searches'):
+            with self.captureOnCommitCallbacks(execute=True):
+                content.save(**kwargs)
+        return add_to_feeds.call_count
+
+    def test_publishing_draft_fans_out(self):
+        """Test the draft -> public transition updates feeds"""
+        content = create_content(self.producer, status=CONTENT_STATUS_DRAFT)
+        content.status = CONTENT_STATUS_PUBLIC
+
+        self.assertEqual(self._save(content), 1)
+
+    def test_resaving_public_content_does_not_fan_out(self):
+        """Test full saves of already public content skip the fan-out"""
+        content = create_content(self.producer)
+        content.title = 'Renamed'
+
+        self.assertEqual(self._save(content), 0)
+        self.assertEqual(self._save(content, update_fields=['status', 'updated_at']), 0)
+
+    def test_genre_change_of_public_content_fans_out(self):
+        """Test new genres on public content reach the matching feeds"""
+        content = create_content(self.producer)
+        content.genre_tags = ['drama', 'romance']
+
+        self.assertEqual(self._save(content), 1)
@@ -0,0 +1,96 @@
+"""
+Trending score: time-decayed popularity stored in Content.trending_score
+
+score = sum over recent days of (views + offer weights) * 0.5 ** (age_days / HALF_LIFE)
+        + RECENCY_WEIGHT * 0.5 ** (days_since_created / HALF_LIFE)
+
+Activity comes from the daily rollup (apps.analytics ContentDailyStats).
+Scores are recomputed in bulk by `manage.py refresh_trending_scores`, so
+`ordering=trending` is a plain scan of the (status, -trending_score, -id) index.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import (
+    DateField, DateTimeField, DecimalField, DurationField, ExpressionWrapper, F, FloatField,
+    OuterRef, Subquery, Sum, Value,
+)
+from django.db.models.functions import Cast, Coalesce, Extract, Power
+from django.utils import timezone
+
+from apps.analytics.models import ContentDailyStats
+from apps.core.constants import CONTENT_STATUS_PUBLIC
+from .models import Content
+
+TRENDING_ORDERING = ('-trending_score', '-id')
+
+# Days for a view/offer (or a new release boost) to lose half its weight
+HALF_LIFE_DAYS = getattr(settings, 'TRENDING_HALF_LIFE_DAYS', 3)
+# Activity older than this is ignored (its weight is < 1% by then)
+WINDOW_DAYS = HALF_LIFE_DAYS * 7
+# Weight of one received / accepted offer relative to one view
+OFFER_WEIGHT = 20
+ACCEPTED_OFFER_WEIGHT = 50
+# Score of a brand-new content with no activity yet
+RECENCY_WEIGHT = 50
+
+
+def _age_days(start, end):
+    """Days from `start` to `end` (dates or datetimes) as a float expression"""
+    return Extract(
+        ExpressionWrapper(end - start, output_field=DurationField()), 'epoch'
+    ) / 86400.0
+
+
+def _decay(age_days):
+    return Power(0.5, age_days / float(HALF_LIFE_DAYS))
+
+
+def trending_score_expression(today=None, now=None):
+    """
+    Trending score of a Content row as an ORM expression: decayed activity
+    from the daily rollup (correlated Subquery) plus the recency boost,
+    rounded to 4 decimals so unchanged scores compare equal.
+    """
+    today = today or timezone.localdate()
+    now = now or timezone.now()
+
+    activity = ContentDailyStats.objects.filter(
+        content=OuterRef('pk'),
+        day__gt=today - timedelta(days=WINDOW_DAYS),
+    ).order_by().values('content').annotate(
+        score=Sum(
+            (F('views') + OFFER_WEIGHT * F('offers_received') + ACCEPTED_OFFER_WEIGHT * F('offers_accepted'))
+            * _decay(_age_days(F('day'), Value(today, output_field=DateField()))),
+            output_field=FloatField(),
+        )
+    ).values('score')
+
+    score = (
+        Coalesce(Subquery(activity, output_field=FloatField()), Value(0.0))
+        + RECENCY_WEIGHT * _decay(_age_days(F('created_at'), Value(now, output_field=DateTimeField())))
+    )
+    return Cast(
+        Cast(score, DecimalField(max_digits=20, decimal_places=4)),
+        FloatField(),
+    )
+
+
+def refresh_trending_scores():
+    """
+    Recompute trending_score for all public contents in one statement.
+    Rows whose score did not change are not rewritten.
+
+    Returns:
+        int: number of updated rows
+    """
+    score = trending_score_expression()
+    updated = Content.objects.filter(status=CONTENT_STATUS_PUBLIC).exclude(
+        trending_score=score
+    ).update(trending_score=score)
+
+    # Contents that left the public listing no longer need a score
+    updated += Content.objects.exclude(status=CONTENT_STATUS_PUBLIC).exclude(
+        trending_score=0
+    ).update(trending_score=0)
+    return updated
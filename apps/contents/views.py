@@ -1,16 +1,29 @@
 """
 Template-based views for content browsing and management
 """
+from django.http import Http404
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.core.paginator import Paginator
-from django.db.models import Q, Count
+from django.db.models import Count
+from .detail_cache import get_public_content
 from .models import Content
+from .facets import get_facets
+from .similarity import similar_contents
+from .trending import TRENDING_ORDERING
+from .filters import parse_content_filters, apply_content_filters, price_ordering, BROWSE_FILTER_PARAMS
+from apps.analytics.services import record_unique_view
+from apps.booths.detail_cache import get_booth
 from apps.booths.models import Booth
-from apps.core.constants import CONTENT_STATUS_PUBLIC, CONTENT_STATUS_DELETED
+from apps.core.constants import CONTENT_STATUS_PUBLIC, CONTENT_STATUS_DELETED, GENRE_TAGS
+from apps.core.page_cache import cache_anonymous_page
 
+# Similar contents shown under the content detail page
+SIMILAR_DETAIL_LIMIT = 4
 
+
+@cache_anonymous_page
 def browse_view(request):
     """
     콘텐츠 브라우징 화면 (/browse)
@@ -18,64 +31,51 @@ def browse_view(request):
     - 권한: AllowAny (전체 공개)
     """
     # Get all public contents
-    contents = Content.objects.filter(status=CONTENT_STATUS_PUBLIC).select_related('producer')
-
-    # Search (BRW-002)
-    search_query = request.GET.get('q', '').strip()
-    if search_query:
-        contents = contents.filter(
-            Q(title__icontains=search_query) |
-            Q(description__icontains=search_query) |
-            Q(producer__company_name__icontains=search_query)
-        )
-
-    # Genre filter (BRW-003)
-    genre_filter = request.GET.getlist('genre')
-    if genre_filter:
-        for genre in genre_filter:
-            contents = contents.filter(genre_tags__contains=[genre])
-
-    # Price range filter (BRW-004)
+    contents = Content.objects.filter(
+        status=CONTENT_STATUS_PUBLIC
+    ).select_related('producer').defer('search_vector')
+
+    # Search (BRW-002), genre (BRW-003) and price range (BRW-004) filters;
+    # invalid values are ignored on the browse page
+    filters = parse_content_filters(request.GET, names=BROWSE_FILTER_PARAMS, strict=False)
+    contents = apply_content_filters(contents, filters)
+    search_query = filters['search']
+    genre_filter = filters['genres']
+    genre_mode = filters['genre_mode']
     price_min = request.GET.get('price_min')
     price_max = request.GET.get('price_max')
 
-    if price_min:
-        try:
-            contents = contents.filter(price__gte=float(price_min))
-        except ValueError:
-            pass
-
-    if price_max:
-        try:
-            contents = contents.filter(price__lte=float(price_max))
-        except ValueError:
-            pass
-
     # Sorting
-    ordering = request.GET.get('ordering', '-created_at')
-    if ordering in ['-created_at', 'created_at', 'price', '-price']:
-        contents = contents.order_by(ordering)
+    ordering = request.GET.get('ordering', 'relevance' if search_query else '-created_at')
+    if ordering == 'relevance' and search_query:
+        contents = contents.order_by('-relevance', '-created_at')
+    elif ordering == 'trending':
+        contents = contents.order_by(*TRENDING_ORDERING)
+    elif ordering in ['-created_at', 'created_at', 'price', '-price']:
+        contents = contents.order_by(price_ordering(ordering, filters['currency']))
 
     # Pagination (BRW-005: 20개 단위)
     paginator = Paginator(contents, 20)
     page_number = request.GET.get('page', 1)
     page_obj = paginator.get_page(page_number)
 
-    # Genre choices for filter
-    genre_choices = [
-        'drama', 'comedy', 'romance', 'action', 'thriller',
-        'horror', 'documentary', 'education', 'business',
-        'lifestyle', 'food', 'travel', 'music', 'sports', 'gaming'
+    # Facet counts for the sidebar (one cached grouped query)
+    facets = get_facets(contents, filters)
+    genre_options = [
+        (genre, facets['genres'].get(genre, 0)) for genre in GENRE_TAGS
     ]
 
     context = {
         'page_obj': page_obj,
         'search_query': search_query,
         'genre_filter': genre_filter,
+        'genre_mode': genre_mode,
         'price_min': price_min,
         'price_max': price_max,
         'ordering': ordering,
-        'genre_choices': genre_choices,
+        'genre_choices': GENRE_TAGS,
+        'genre_options': genre_options,
+        'facets': facets,
         'total_count': paginator.count,
     }
 
@@ -88,14 +88,14 @@ def content_detail_view(request, content_id):
     - CNT-001~004: 기본 정보, 제작사 정보, 링크, 오퍼 버튼
     - 권한: AllowAny (전체 공개)
     """
-    content = get_object_or_404(
-        Content.objects.select_related('producer'),
-        pk=content_id,
-        status=CONTENT_STATUS_PUBLIC
-    )
+    # Unknown or non-public ids are answered from the negative cache
+    content = get_public_content(content_id, Content.objects.select_related('producer'))
+    if content is None:
+        raise Http404("No Content matches the given query.")
 
-    # Increment view count (CNT-001)
+    # Increment view count (CNT-001) and record unique viewer
     content.increment_view_count()
+    record_unique_view(content, request)
 
     # Check if user can submit offer (CNT-004)
     can_submit_offer = False
@@ -115,21 +115,34 @@ def content_detail_view(request, content_id):
     context = {
         'content': content,
         'can_submit_offer': can_submit_offer,
+        'similar_contents': similar_contents(content.pk, limit=SIMILAR_DETAIL_LIMIT),
     }
 
     return render(request, 'contents/detail.html', context)
 
 
+def _record_cached_booth_view(request, slug, booth_id):
+    """Count views of booth pages served from the page cache"""
+    booth = Booth(pk=booth_id, slug=slug, view_count=0)
+    booth.increment_view_count()
+    record_unique_view(booth, request)
+
+
+@cache_anonymous_page(on_hit=_record_cached_booth_view)
 def booth_view(request, slug):
     """
     제작사 부스 화면 (/booth/:slug)
     - BTH-001~002: 제작사 정보, 콘텐츠 리스트
     - 권한: AllowAny (전체 공개)
     """
-    booth = get_object_or_404(Booth.objects.select_related('producer'), slug=slug)
+    # Unknown slugs are answered from the negative cache
+    booth = get_booth(slug)
+    if booth is None:
+        raise Http404("No Booth matches the given query.")
 
-    # Increment booth view count
+    # Increment booth view count and record unique viewer
     booth.increment_view_count()
+    record_unique_view(booth, request)
 
     # Get producer's public contents (BTH-002)
     contents = Content.objects.filter(
@@ -149,7 +162,9 @@ def booth_view(request, slug):
         'total_count': paginator.count,
     }
 
-    return render(request, 'booths/detail.html', context)
+    response = render(request, 'booths/detail.html', context)
+    response.page_cache_state = {'booth_id': booth.pk}
+    return response
 
 
 # ========== Studio Views (Producer Content Management) ==========
@@ -295,15 +310,8 @@ def studio_content_create_view(request):
             messages.success(request, f'Content "{content.title}" has been created successfully!')
             return redirect('contents:studio_list')
 
-    # Genre choices
-    genre_choices = [
-        'drama', 'comedy', 'romance', 'action', 'thriller',
-        'horror', 'documentary', 'education', 'business',
-        'lifestyle', 'food', 'travel', 'music', 'sports', 'gaming'
-    ]
-
     context = {
-        'genre_choices': genre_choices,
+        'genre_choices': GENRE_TAGS,
     }
 
     return render(request, 'contents/studio_create.html', context)
@@ -420,16 +428,9 @@ def studio_content_edit_view(request, content_id):
                 messages.success(request, f'Content "{content.title}" has been updated successfully!')
                 return redirect('contents:studio_list')
 
-    # Genre choices
-    genre_choices = [
-        'drama', 'comedy', 'romance', 'action', 'thriller',
-        'horror', 'documentary', 'education', 'business',
-        'lifestyle', 'food', 'travel', 'music', 'sports', 'gaming'
-    ]
-
     context = {
         'content': content,
-        'genre_choices': genre_choices,
+        'genre_choices': GENRE_TAGS,
     }
 
     return render(request, 'contents/studio_edit.html', context)
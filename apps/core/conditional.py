@@ -0,0 +1,69 @@
+"""
+Conditional GET (ETag / Last-Modified) for public read endpoints
+
+Views compute validators with a cheap query (e.g. max(updated_at) and a
+count) before fetching or serializing anything, and return 304 Not
+Modified when the client's copy is still current:
+
+    conditional = ConditionalGet(request, latest_updated_at, count)
+    not_modified = conditional.not_modified()
+    if not_modified:
+        return not_modified
+    ...
+    return conditional.finalize(success_response(...))
+
+The ETag is weak and covers the validators, the request path, the query
+parameters (filters, ordering, page, fields) and the rendered format.
+Responses are marked `Cache-Control: public, max-age=0, must-revalidate`
+so clients always revalidate (and views keep being counted).
+"""
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+
+class ConditionalGet:
+    """Validators for one response; see module docstring"""
+
+    def __init__(self, request, *validators, last_modified=None):
+        """
+        Args:
+            request: DRF request
+            validators: values that change whenever the response body does
+            last_modified: datetime sent as Last-Modified; only pass it when
+                the timestamp alone captures every change (no removals)
+        """
+        self.request = request
+        self.last_modified = last_modified
+        self.etag = self.compute_etag(request, validators)
+
+    @staticmethod
+    def compute_etag(request, validators):
+        renderer = getattr(request, 'accepted_renderer', None)
+        payload = '|'.join([
+            request.path,
+            request.GET.urlencode(),
+            getattr(renderer, 'format', ''),
+            *(str(value) for value in validators),
+        ])
+        return f'W/"{hashlib.md5(payload.encode("utf-8")).hexdigest()}"'
+
+    def not_modified(self):
+        """304 response when If-None-Match / If-Modified-Since match, else None"""
+        timestamp = int(self.last_modified.timestamp()) if self.last_modified else None
+        response = get_conditional_response(
+            self.request, etag=self.etag, last_modified=timestamp
+        )
+        if response is None:
+            return None
+        return self.finalize(response)
+
+    def finalize(self, response):
+        """Add validator and caching headers to a successful (or 304) response"""
+        response['ETag'] = self.etag
+        if self.last_modified:
+            response['Last-Modified'] = http_date(self.last_modified.timestamp())
+        patch_cache_control(response, public=True, max_age=0, must_revalidate=True)
+        patch_vary_headers(response, ('Accept',))
+        return response
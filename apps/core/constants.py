@@ -52,6 +52,13 @@ RATING_CHOICES = [
     (RATING_19, '19+'),
 ]
 
+# Genre tags offered in browse filters and content forms
+GENRE_TAGS = [
+    'drama', 'comedy', 'romance', 'action', 'thriller',
+    'horror', 'documentary', 'education', 'business',
+    'lifestyle', 'food', 'travel', 'music', 'sports', 'gaming'
+]
+
 # File upload limits
 MAX_LOGO_SIZE = 2 * 1024 * 1024  # 2MB
 MAX_POSTER_SIZE = 5 * 1024 * 1024  # 5MB (for vertical posters)
@@ -0,0 +1,158 @@
+"""
+Sparse fieldsets for API responses (?fields= / ?omit=)
+
+- parse_fieldset(request, serializer_class): requested output fields, or None for all
+- defer_unselected(queryset, serializer_class, fields): defer the model columns
+  only needed by fields outside the fieldset, so they are never fetched
+
+Serializers opt in with SparseFieldsetMixin (instance serializers) or
+ValuesSerializer.with_fields() (values-based list serializers).
+"""
+from django.core.exceptions import FieldDoesNotExist
+from drf_spectacular.utils import OpenApiParameter
+
+FIELDS_PARAM = 'fields'
+OMIT_PARAM = 'omit'
+
+FIELDSET_PARAMETERS = [
+    OpenApiParameter(FIELDS_PARAM, str, description='Comma-separated fields to return (default: all)'),
+    OpenApiParameter(OMIT_PARAM, str, description='Comma-separated fields to leave out'),
+]
+
+
+class FieldsetError(ValueError):
+    """Raised for unknown or empty fieldsets"""
+
+
+class SparseFieldsetMixin:
+    """
+    ModelSerializer mixin accepting `fields=(...)` to render only those fields.
+
+    fieldset_dependencies maps non-column fields (properties, methods) to the
+    model fields they read, so those columns stay loaded while selected.
+    """
+    fieldset_dependencies = {}
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+def _split(value):
+    return [name.strip() for name in (value or '').split(',') if name.strip()]
+
+
+def _model_serializer(serializer_class):
+    # ValuesSerializer subclasses render with their ModelSerializer's fields
+    return getattr(serializer_class, 'serializer_class', None) or serializer_class
+
+
+def readable_fields(serializer_class):
+    """Output field names of a serializer, in declaration order"""
+    serializer = _model_serializer(serializer_class)()
+    return [name for name, field in serializer.fields.items() if not field.write_only]
+
+
+def parse_fieldset(request, serializer_class):
+    """
+    Parse ?fields=a,b and ?omit=c into the tuple of fields to render
+    (declaration order), or None when neither parameter is given.
+
+    Raises:
+        FieldsetError: unknown field names, or nothing left to render
+    """
+    fields = _split(request.query_params.get(FIELDS_PARAM))
+    omit = _split(request.query_params.get(OMIT_PARAM))
+    if not fields and not omit:
+        return None
+
+    available = readable_fields(serializer_class)
+    unknown = [name for name in dict.fromkeys(fields + omit) if name not in available]
+    if unknown:
+        raise FieldsetError(f"Unknown fields: {', '.join(unknown)}")
+
+    selected = tuple(
+        name for name in available
+        if (not fields or name in fields) and name not in omit
+    )
+    if not selected:
+        raise FieldsetError("At least one field must be selected")
+    return selected
+
+
+def _column_lookups(model, serializer, name):
+    """Deferrable model lookups (e.g. 'description', 'producer__company_name') behind a field"""
+    field = serializer.fields[name]
+    sources = [field.source_attrs] if field.source != '*' else []
+    sources += [
+        dependency.split('.')
+        for dependency in getattr(serializer, 'fieldset_dependencies', {}).get(name, ())
+    ]
+
+    lookups = set()
+    for source_attrs in sources:
+        current = model
+        for attr in source_attrs:
+            try:
+                model_field = current._meta.get_field(attr)
+            except FieldDoesNotExist:
+                # Property or method: only its declared dependencies are known
+                model_field = None
+                break
+            if model_field.related_model is None:
+                break
+            current = model_field.related_model
+        if model_field is None or model_field.is_relation or model_field.primary_key:
+            # Relation ids and primary keys are needed for joins; never deferred
+            continue
+        lookups.add('__'.join(source_attrs))
+    return lookups
+
+
+def defer_unselected(queryset, serializer_class, fields, keep=()):
+    """
+    Defer columns read only by fields outside `fields`.
+
+    Columns of related models are deferred only when the relation is
+    loaded with select_related. Ordering columns and `keep` stay loaded.
+    """
+    if fields is None:
+        return queryset
+
+    serializer = _model_serializer(serializer_class)()
+    model = queryset.model
+    needed = set(keep)
+    unneeded = set()
+    for name in serializer.fields:
+        if serializer.fields[name].write_only:
+            continue
+        target = needed if name in fields else unneeded
+        target.update(_column_lookups(model, serializer, name))
+
+    needed.update(
+        field.lstrip('-') for field in queryset.query.order_by if isinstance(field, str)
+    )
+
+    select_related = queryset.query.select_related
+    deferred = []
+    for lookup in sorted(unneeded - needed):
+        relation = lookup.rpartition('__')[0]
+        if relation and not _is_select_related(select_related, relation):
+            continue
+        deferred.append(lookup)
+
+    return queryset.defer(*deferred) if deferred else queryset
+
+
+def _is_select_related(select_related, relation):
+    if select_related is True:
+        return True
+    if not select_related:
+        return False
+    for part in relation.split('__'):
+        if part not in select_related:
+            return False
+        select_related = select_related[part]
+    return True
@@ -0,0 +1,18 @@
+"""
+Flush buffered view counters to the database (run on shutdown / periodically)
+"""
+from django.core.management.base import BaseCommand
+
+from apps.core.view_counter import flush_view_counts
+
+
+class Command(BaseCommand):
+    help = 'Write buffered Content/Booth view counts to the database'
+
+    def handle(self, *args, **options):
+        flushed = flush_view_counts()
+        if not flushed:
+            self.stdout.write('No buffered views to flush')
+            return
+        for label, views in flushed.items():
+            self.stdout.write(self.style.SUCCESS(f'{label}: flushed {views} views'))
@@ -0,0 +1,143 @@
+"""
+Two-tier cache for serialized objects (e.g. detail API payloads)
+
+Entries live in the shared cache (Redis in production) and in a small
+per-process LRU in front of it. Each entry records the version stamps it
+was built from, e.g. 'content:12' and 'user:3'; writers bump those stamps
+(bump_stamps) from post_save handlers and every worker treats the entry as
+stale on its next read. A read that hits either tier costs one shared-cache
+round trip for the stamps and no database queries.
+
+    detail_cache = ObjectCache('content-detail')
+    entry = detail_cache.get(pk)
+    if entry is None:
+        tokens = read_stamps([f'content:{pk}'])   # read before querying
+        entry = build_from_database()
+        detail_cache.set(pk, entry, tokens)
+
+Settings:
+    OBJECT_CACHE_TIMEOUT: seconds an entry is kept (default 300, 0 disables)
+    OBJECT_CACHE_LOCAL_SIZE: entries per process and cache name (default 256)
+
+Caches may read their timeout from another setting, e.g. negative caches
+of known-missing ids use NEGATIVE_CACHE_TIMEOUT.
+
+Stamp keys expire after the longest entry timeout of any cache, so stamps
+created for ids that never exist (e.g. enumerated by bots) do not pile up.
+An entry whose stamp expired is simply treated as stale.
+"""
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+
+KEY_PREFIX = 'objcache'
+
+# Every ObjectCache, so stamps can outlive the longest-lived entry
+_caches = weakref.WeakSet()
+
+
+def _stamp_key(stamp):
+    return f'{KEY_PREFIX}:stamp:{stamp}'
+
+
+def _new_token():
+    return time.time_ns()
+
+
+def get_stamp_timeout():
+    """Seconds a stamp is kept: the longest entry timeout of any cache"""
+    return max([c.get_timeout() for c in list(_caches)] + [1])
+
+
+def read_stamps(stamps):
+    """Current {stamp: token}, creating tokens for stamps never bumped (or expired)"""
+    keys = {_stamp_key(stamp): stamp for stamp in stamps}
+    found = cache.get_many(list(keys))
+    tokens = {}
+    for key, stamp in keys.items():
+        if key not in found:
+            cache.add(key, _new_token(), get_stamp_timeout())
+            found[key] = cache.get(key)
+        tokens[stamp] = found[key]
+    return tokens
+
+
+def bump_stamps(*stamps):
+    """Invalidate every entry built from any of the stamps, in all processes"""
+    token = _new_token()
+    cache.set_many({_stamp_key(stamp): token for stamp in stamps}, get_stamp_timeout())
+
+
+class ObjectCache:
+    """Named two-tier cache; see module docstring"""
+
+    def __init__(self, name, local_size=None, timeout_setting='OBJECT_CACHE_TIMEOUT', default_timeout=300):
+        self.name = name
+        self.local_size = local_size or getattr(settings, 'OBJECT_CACHE_LOCAL_SIZE', 256)
+        self.timeout_setting = timeout_setting
+        self.default_timeout = default_timeout
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+        _caches.add(self)
+
+    def get_timeout(self):
+        return getattr(settings, self.timeout_setting, self.default_timeout)
+
+    def _key(self, key):
+        return f'{KEY_PREFIX}:{self.name}:{key}'
+
+    def _local_get(self, key):
+        with self._lock:
+            record = self._local.get(key)
+            if record is not None:
+                self._local.move_to_end(key)
+            return record
+
+    def _local_set(self, key, record):
+        with self._lock:
+            self._local[key] = record
+            self._local.move_to_end(key)
+            while len(self._local) > self.local_size:
+                self._local.popitem(last=False)
+
+    def get(self, key):
+        """Cached value for key, or None when missing or any stamp has moved"""
+        if not self.get_timeout():
+            return None
+
+        record = self._local_get(key)
+        if record is None:
+            record = cache.get(self._key(key))
+            if record is None:
+                return None
+
+        tokens, value = record
+        if cache.get_many([_stamp_key(stamp) for stamp in tokens]) != {
+            _stamp_key(stamp): token for stamp, token in tokens.items()
+        }:
+            with self._lock:
+                self._local.pop(key, None)
+            return None
+
+        self._local_set(key, record)
+        return value
+
+    def set(self, key, value, tokens):
+        """
+        Store value built from the stamp tokens returned by read_stamps(),
+        read *before* the database was queried so concurrent bumps win.
+        """
+        timeout = self.get_timeout()
+        if not timeout:
+            return
+        record = (tokens, value)
+        cache.set(self._key(key), record, timeout)
+        self._local_set(key, record)
+
+    def clear_local(self):
+        with self._lock:
+            self._local.clear()
@@ -0,0 +1,126 @@
+"""
+Full-page cache for anonymous visitors
+
+- cache_anonymous_page(view): serve rendered HTML from the cache for visitors
+  without a session (crawlers, first visits)
+- invalidate_page_cache(): drop every cached page (version bump)
+
+Pages are keyed by path, normalized query string (parameter order does not
+matter) and active language. CSRF tokens are stored as a placeholder and
+filled in per request, so cached forms (e.g. the language switcher) keep
+working and the CSRF cookie is still set.
+
+Requests carrying a session or messages cookie are never cached or served
+from the cache: they may belong to a logged-in user or show flash messages.
+
+Settings:
+    PAGE_CACHE_TIMEOUT: seconds a page is kept (default 120, 0 disables)
+
+Invalidation is immediate with a shared cache backend (Redis); with the
+local-memory cache other worker processes catch up within the timeout.
+"""
+import hashlib
+import re
+from functools import wraps
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.utils import translation
+
+KEY_PREFIX = 'pagecache'
+VERSION_KEY = f'{KEY_PREFIX}:version'
+
+CSRF_PLACEHOLDER = '__PAGE_CACHE_CSRF_TOKEN__'
+CSRF_INPUT_RE = re.compile(r'(name="csrfmiddlewaretoken" value=")[^"]*(")')
+
+
+def get_timeout():
+    return getattr(settings, 'PAGE_CACHE_TIMEOUT', 120)
+
+
+def _get_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, 1, None)
+        version = cache.get(VERSION_KEY, 1)
+    return version
+
+
+def invalidate_page_cache():
+    """Invalidate all cached pages (old entries expire on their own)"""
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.add(VERSION_KEY, 2, None)
+
+
+def normalize_query(query_dict):
+    """Query string with sorted keys and values, so ?b=1&a=2 == ?a=2&b=1"""
+    items = sorted(
+        (key, value)
+        for key, values in query_dict.lists()
+        for value in values
+    )
+    return urlencode(items)
+
+
+def page_cache_key(request):
+    raw = f'{request.path}?{normalize_query(request.GET)}'
+    digest = hashlib.md5(raw.encode('utf-8')).hexdigest()
+    return f'{KEY_PREFIX}:{_get_version()}:{translation.get_language()}:{digest}'
+
+
+def is_cacheable_request(request):
+    """Anonymous GET/HEAD without session or flash-message cookies"""
+    return (
+        request.method in ('GET', 'HEAD')
+        and settings.SESSION_COOKIE_NAME not in request.COOKIES
+        and getattr(settings, 'MESSAGE_COOKIE_NAME', 'messages') not in request.COOKIES
+    )
+
+
+def cache_anonymous_page(view_func=None, *, on_hit=None):
+    """
+    Decorator caching a view's 200 HTML responses for anonymous visitors.
+
+    on_hit(request, *args, **kwargs, **state) runs for responses served from
+    the cache, e.g. to keep counting views. `state` is whatever the view
+    stored in `response.page_cache_state` (a dict) when it was rendered.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(request, *args, **kwargs):
+            timeout = get_timeout()
+            if not timeout or not is_cacheable_request(request):
+                return func(request, *args, **kwargs)
+
+            key = page_cache_key(request)
+            cached = cache.get(key)
+            if cached is not None:
+                if on_hit is not None:
+                    on_hit(request, *args, **kwargs, **cached['state'])
+                content = cached['content'].replace(CSRF_PLACEHOLDER, get_token(request))
+                return HttpResponse(content, content_type=cached['content_type'])
+
+            response = func(request, *args, **kwargs)
+            if hasattr(response, 'render') and not response.is_rendered:
+                response.render()
+            if response.status_code == 200 and not response.streaming and not response.cookies:
+                content = CSRF_INPUT_RE.sub(
+                    rf'\g<1>{CSRF_PLACEHOLDER}\g<2>',
+                    response.content.decode(response.charset)
+                )
+                cache.set(key, {
+                    'content': content,
+                    'content_type': response['Content-Type'],
+                    'state': getattr(response, 'page_cache_state', {}),
+                }, timeout)
+            return response
+        return wrapper
+
+    if view_func is not None:
+        return decorator(view_func)
+    return decorator
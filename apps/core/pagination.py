@@ -0,0 +1,183 @@
+"""
+Keyset (cursor) pagination for list endpoints
+"""
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import F, Q
+from rest_framework import exceptions
+from rest_framework.exceptions import NotFound
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination:
+    """
+    Cursor pagination that seeks past the last row of the previous page
+    instead of using OFFSET, and never runs COUNT(*).
+
+    The queryset's ordering (or the model's Meta.ordering) is used as the
+    seek key, with the primary key appended as a tie-breaker so the key is
+    unique. Each page therefore costs one index range scan regardless of
+    depth. Only forward paging is supported (infinite scroll).
+
+    Nullable ordering columns sort NULLS LAST in both directions, and the
+    seek predicate follows the same rule, so rows with a NULL key are
+    paged after all others instead of breaking the cursor.
+    """
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+    unsupported_ordering_message = 'This ordering does not support cursor pagination'
+
+    def __init__(self, page_size=None):
+        self.page_size = page_size or settings.REST_FRAMEWORK.get('PAGE_SIZE', 20)
+        self.next_cursor = None
+        self.request = None
+
+    def paginate_queryset(self, queryset, request):
+        """Return the page of results following the cursor in request"""
+        self.request = request
+        ordering = self.get_ordering(queryset)
+        nullable = self.get_nullable_fields(queryset.model, ordering)
+        queryset = queryset.order_by(*[
+            self._order_expression(field, descending, field in nullable)
+            for field, descending in ordering
+        ])
+
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded:
+            values = self.decode_cursor(encoded, ordering)
+            try:
+                queryset = queryset.filter(self.seek_filter(ordering, values, nullable))
+            except (ValidationError, ValueError, TypeError):
+                # Tampered cursor values that don't fit the field types
+                raise NotFound(self.invalid_cursor_message)
+
+        results = list(queryset[:self.page_size + 1])
+        if len(results) > self.page_size:
+            results = results[:self.page_size]
+            self.next_cursor = self.encode_cursor(ordering, results[-1])
+
+        return results
+
+    def get_next_link(self):
+        """Absolute URL of the next page, or None on the last page"""
+        if self.next_cursor is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), 'page')
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    @staticmethod
+    def get_ordering(queryset):
+        """
+        Resolve ordering as [(field, descending), ...] ending with a
+        unique primary key tie-breaker.
+        """
+        order_by = list(queryset.query.order_by) or list(queryset.model._meta.ordering)
+        ordering = []
+        for field in order_by:
+            if not isinstance(field, str) or field == '?':
+                # Expressions (e.g. F().desc(nulls_last=True)) and random order have no seekable key
+                raise exceptions.ValidationError({
+                    KeysetPagination.cursor_query_param: KeysetPagination.unsupported_ordering_message
+                })
+            ordering.append((field.lstrip('-'), field.startswith('-')))
+
+        if not any(field in ('pk', 'id') for field, _ in ordering):
+            descending = ordering[-1][1] if ordering else True
+            ordering.append(('pk', descending))
+        return ordering
+
+    @staticmethod
+    def get_nullable_fields(model, ordering):
+        """Ordering fields that are nullable columns of `model`"""
+        nullable = set()
+        for field, _ in ordering:
+            try:
+                if model._meta.get_field(field).null:
+                    nullable.add(field)
+            except FieldDoesNotExist:
+                # pk, annotations and related lookups
+                continue
+        return nullable
+
+    @staticmethod
+    def _order_expression(field, descending, nullable):
+        # Plain names keep the default order (and index scans) of NOT NULL columns
+        if nullable:
+            return F(field).desc(nulls_last=True) if descending else F(field).asc(nulls_last=True)
+        return f'-{field}' if descending else field
+
+    @staticmethod
+    def seek_filter(ordering, values, nullable=()):
+        """
+        Build the keyset predicate: rows strictly after `values` in ordering.
+        (a, b, pk) after (x, y, z) => a > x OR (a = x AND b > y) OR (a = x AND b = y AND pk > z)
+
+        Nullable columns sort NULLS LAST: NULL follows every value, and
+        nothing follows NULL except rows tied on it.
+
+        A non-strict bound on the leading column is added so Postgres can
+        start the index scan at the cursor position.
+        """
+        condition = Q()
+        equal = Q()
+        for (field, descending), value in zip(ordering, values):
+            if value is None:
+                equal &= Q(**{f'{field}__isnull': True})
+                continue
+            after = Q(**{f"{field}__{'lt' if descending else 'gt'}": value})
+            if field in nullable:
+                after |= Q(**{f'{field}__isnull': True})
+            condition |= equal & after
+            equal &= Q(**{field: value})
+
+        first_field, first_desc = ordering[0]
+        if values[0] is None:
+            bound = Q(**{f'{first_field}__isnull': True})
+        else:
+            bound = Q(**{f"{first_field}__{'lte' if first_desc else 'gte'}": values[0]})
+            if first_field in nullable:
+                bound |= Q(**{f'{first_field}__isnull': True})
+        return bound & condition
+
+    def encode_cursor(self, ordering, row):
+        """Encode the ordering key of `row` as an opaque URL-safe token"""
+        values = [self._to_primitive(self._get_value(row, field)) for field, _ in ordering]
+        payload = {'o': [f'-{f}' if d else f for f, d in ordering], 'v': values}
+        raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+    def decode_cursor(self, encoded, ordering):
+        """Decode a cursor token, rejecting tokens minted for another ordering"""
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            values = payload['v']
+            signature = payload['o']
+        except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+        expected = [f'-{f}' if d else f for f, d in ordering]
+        if signature != expected or not isinstance(values, list) or len(values) != len(ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    @staticmethod
+    def _get_value(row, field):
+        """Read an ordering value from a model instance or a .values() dict"""
+        if isinstance(row, dict):
+            return row['id'] if field == 'pk' and 'pk' not in row else row[field]
+        return getattr(row, field)
+
+    @staticmethod
+    def _to_primitive(value):
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, Decimal):
+            return str(value)
+        return value
@@ -0,0 +1,50 @@
+"""
+Fast JSON renderer for the API response envelope
+
+Uses orjson when installed and falls back to DRF's stdlib-based
+JSONRenderer otherwise (or when indented output is requested, e.g. by the
+browsable API). Output matches JSONRenderer: compact UTF-8, U+2028/U+2029
+escaped, and datetime/date/time/Decimal values rendered by DRF's encoder
+so timestamps keep DRF's millisecond/'Z' formatting. File fields render
+as their URL.
+"""
+from django.db.models.fields.files import FieldFile
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class EnvelopeJSONEncoder(JSONEncoder):
+    """DRF encoder that also renders file fields (e.g. ImageField) as URLs"""
+
+    def default(self, obj):
+        if isinstance(obj, FieldFile):
+            return obj.url if obj else None
+        return super().default(obj)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer backed by orjson when available"""
+    encoder_class = EnvelopeJSONEncoder
+
+    _encoder = EnvelopeJSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(
+            data,
+            default=self._encoder.default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+        # Same escaping as JSONRenderer: keep output safe inside <script> / JSONP
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
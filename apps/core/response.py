@@ -48,11 +48,53 @@ def error_response(message="Error occurred", errors=None, error_code=None, statu
     return Response(response_data, status=status_code)
 
 
-def paginated_response(queryset, serializer_class, request, message="Success"):
+def paginated_response(queryset, serializer_class, request, message="Success", fields=None):
     """
     Helper for paginated responses
+
+    Page-number mode by default (?page=N). Passing ?cursor= (empty for the
+    first page) switches to keyset pagination: no COUNT(*), constant-time
+    deep pages, and count/current_page/total_pages are returned as null.
+
+    Values-based serializers (apps.core.serializers.ValuesSerializer) narrow
+    the queryset to the columns they render before it is paginated.
+
+    `fields` is a sparse fieldset from apps.core.fieldsets.parse_fieldset:
+    only those fields are rendered and columns behind the others are not
+    fetched.
     """
+    from functools import partial
     from rest_framework.pagination import PageNumberPagination
+    from .fieldsets import defer_unselected
+    from .pagination import KeysetPagination
+
+    if fields is not None:
+        if hasattr(serializer_class, 'with_fields'):
+            serializer_class = serializer_class.with_fields(fields)
+        else:
+            queryset = defer_unselected(queryset, serializer_class, fields)
+            serializer_class = partial(serializer_class, fields=fields)
+
+    if hasattr(serializer_class, 'prepare_queryset'):
+        queryset = serializer_class.prepare_queryset(queryset)
+
+    if KeysetPagination.cursor_query_param in request.query_params:
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(queryset, request)
+        serializer = serializer_class(page, many=True)
+
+        return success_response(
+            data=serializer.data,
+            message=message,
+            pagination={
+                'count': None,
+                'next': paginator.get_next_link(),
+                'previous': None,
+                'page_size': paginator.page_size,
+                'current_page': None,
+                'total_pages': None,
+            }
+        )
 
     paginator = PageNumberPagination()
     paginated_queryset = paginator.paginate_queryset(queryset, request)
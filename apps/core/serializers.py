@@ -0,0 +1,115 @@
+"""
+Values-based fast path for read-only list serializers
+
+ValuesSerializer mirrors a DRF ModelSerializer over `.values()` rows instead
+of model instances: the queryset fetches only the columns the serializer
+outputs (joined fields included), and each row is rendered with the
+original serializer's own field objects, so the output is identical.
+"""
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models.fields.files import FieldFile, FileField
+from rest_framework import serializers
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+
+class ValuesSerializer:
+    """
+    Read-only serializer over dict rows from `prepare_queryset(queryset)`.
+
+    Subclasses set `serializer_class` to the ModelSerializer whose output
+    they reproduce. Supported fields: model fields, dotted `source` lookups
+    across foreign keys, primary-key related fields and file fields.
+
+    Usage matches DRF serializers: `Serializer(rows, many=True).data`.
+    """
+    serializer_class = None
+
+    _plan = None
+
+    def __init__(self, instance=None, many=False, **kwargs):
+        self.instance = instance
+        self.many = many
+
+    @classmethod
+    def get_plan(cls):
+        """[(output name, values() lookup, representation function)], built once per class"""
+        if cls.__dict__.get('_plan') is None:
+            cls._plan = cls._build_plan()
+        return cls._plan
+
+    @classmethod
+    def _build_plan(cls):
+        serializer = cls.serializer_class()
+        model = serializer.Meta.model
+        plan = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if (
+                isinstance(field, (serializers.SerializerMethodField, serializers.BaseSerializer))
+                or field.source == '*'
+            ):
+                raise ImproperlyConfigured(
+                    f'{cls.__name__}: field {name!r} cannot be served from .values()'
+                )
+            lookup = '__'.join(field.source_attrs)
+            plan.append((name, lookup, cls._representation(model, field, field.source_attrs)))
+        return plan
+
+    @classmethod
+    def with_fields(cls, fields):
+        """Subclass rendering (and fetching) only `fields` (see apps.core.fieldsets)"""
+        if fields is None:
+            return cls
+        plan = [entry for entry in cls.get_plan() if entry[0] in fields]
+        return type(cls.__name__, (cls,), {'_plan': plan})
+
+    @staticmethod
+    def _representation(model, field, source_attrs):
+        """Wrap field.to_representation to accept the raw column value"""
+        if isinstance(field, PrimaryKeyRelatedField):
+            if field.pk_field is not None:
+                return field.pk_field.to_representation
+            return lambda value: value
+
+        model_field = None
+        current = model
+        for attr in source_attrs:
+            model_field = current._meta.get_field(attr)
+            current = model_field.related_model or current
+
+        if isinstance(model_field, FileField):
+            # DRF's FileField expects a FieldFile (uses .url)
+            return lambda value: field.to_representation(FieldFile(None, model_field, value))
+        return field.to_representation
+
+    @classmethod
+    def prepare_queryset(cls, queryset):
+        """
+        Narrow queryset to .values() with the serializer's columns plus the
+        ordering columns (needed by keyset pagination cursors).
+        """
+        lookups = [lookup for _, lookup, _ in cls.get_plan()]
+        for field in queryset.query.order_by:
+            if isinstance(field, str):
+                name = field.lstrip('-')
+                if name not in lookups and name != 'pk':
+                    lookups.append(name)
+        if 'id' not in lookups:
+            lookups.append('id')
+        return queryset.values(*lookups)
+
+    @classmethod
+    def to_representation(cls, row):
+        data = {}
+        for name, lookup, represent in cls.get_plan():
+            value = row[lookup]
+            data[name] = None if value is None else represent(value)
+        return data
+
+    @property
+    def data(self):
+        if self.many:
+            return ReturnList([self.to_representation(row) for row in self.instance], serializer=self)
+        return ReturnDict(self.to_representation(self.instance), serializer=self)
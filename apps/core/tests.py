@@ -0,0 +1,542 @@
+"""
+Tests for core helpers
+"""
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock, skipUnless
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.db.models import F
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from apps.accounts.models import User
+from apps.booths.models import Booth
+from apps.contents.models import Content
+from apps.contents.serializers import ContentPublicSerializer, ContentPublicValuesSerializer
+from apps.offers.models import Offer
+from apps.loi.models import LOI
+from apps.loi.serializers import LOISerializer
+from apps.offers.serializers import OfferProducerSerializer, OfferProducerValuesSerializer
+from . import view_counter
+from .conditional import ConditionalGet
+from . import page_cache
+from .object_cache import ObjectCache, bump_stamps, read_stamps
+from .fieldsets import FieldsetError, defer_unselected, parse_fieldset
+from .pagination import KeysetPagination
+from . import renderers
+from .renderers import FastJSONRenderer
+
+
+class KeysetPaginationTestCase(SimpleTestCase):
+    """Test cursor encoding and seek predicates (no database required)"""
+
+    def test_ordering_appends_pk_tie_breaker(self):
+        """Test pk is appended with the direction of the last ordering field"""
+        queryset = Content.objects.order_by('price')
+        self.assertEqual(
+            KeysetPagination.get_ordering(queryset),
+            [('price', False), ('pk', False)]
+        )
+
+    def test_ordering_falls_back_to_model_meta(self):
+        """Test Meta.ordering is used when the queryset is unordered"""
+        self.assertEqual(
+            KeysetPagination.get_ordering(Content.objects.all()),
+            [('created_at', True), ('pk', True)]
+        )
+
+    def test_cursor_round_trip(self):
+        """Test a cursor decodes to the primitive ordering values of the row"""
+        paginator = KeysetPagination()
+        ordering = [('price', True), ('pk', True)]
+        row = Content(pk=42, price=Decimal('19.90'))
+
+        cursor = paginator.encode_cursor(ordering, row)
+
+        self.assertNotIn('=', cursor)
+        self.assertEqual(paginator.decode_cursor(cursor, ordering), ['19.90', 42])
+
+    def test_cursor_accepts_values_rows(self):
+        """Test cursors can be built from .values() dicts"""
+        paginator = KeysetPagination()
+        ordering = [('created_at', True), ('pk', True)]
+        created_at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=dt_timezone.utc)
+
+        cursor = paginator.encode_cursor(ordering, {'id': 7, 'created_at': created_at})
+
+        self.assertEqual(
+            paginator.decode_cursor(cursor, ordering),
+            ['2025-01-02T03:04:05+00:00', 7]
+        )
+
+    def test_cursor_for_other_ordering_is_rejected(self):
+        """Test a cursor minted for one ordering cannot be replayed on another"""
+        paginator = KeysetPagination()
+        cursor = paginator.encode_cursor([('price', False), ('pk', False)], Content(pk=1, price=1))
+
+        with self.assertRaises(NotFound):
+            paginator.decode_cursor(cursor, [('view_count', False), ('pk', False)])
+
+    def test_garbage_cursor_is_rejected(self):
+        """Test malformed cursors raise NotFound"""
+        with self.assertRaises(NotFound):
+            KeysetPagination().decode_cursor('not-a-cursor!', [('pk', True)])
+
+    def test_seek_filter_descending(self):
+        """Test the seek predicate for a descending key"""
+        where = KeysetPagination.seek_filter(
+            [('price', True), ('pk', True)], ['10.00', 5]
+        )
+        sql = str(Content.objects.filter(where).query)
+
+        self.assertIn('"contents_content"."price" <= 10.00', sql)
+        self.assertIn('"contents_content"."price" < 10.00', sql)
+        self.assertIn('"contents_content"."price" = 10.00 AND "contents_content"."id" < 5', sql)
+
+    def test_expression_ordering_is_rejected(self):
+        """Test orderings without a seekable key raise a 400 ValidationError"""
+        with self.assertRaises(ValidationError):
+            KeysetPagination.get_ordering(Content.objects.order_by(F('price_usd').desc(nulls_last=True)))
+        with self.assertRaises(ValidationError):
+            KeysetPagination.get_ordering(Content.objects.order_by('?'))
+
+    def test_nullable_ordering_sorts_nulls_last(self):
+        """Test nullable ordering columns are ordered NULLS LAST"""
+        ordering = KeysetPagination.get_ordering(Content.objects.order_by('-price_usd'))
+        nullable = KeysetPagination.get_nullable_fields(Content, ordering)
+        queryset = Content.objects.order_by(*[
+            KeysetPagination._order_expression(field, descending, field in nullable)
+            for field, descending in ordering
+        ])
+
+        self.assertEqual(nullable, {'price_usd'})
+        self.assertIn('"contents_content"."price_usd" DESC NULLS LAST', str(queryset.query))
+
+    def test_seek_filter_includes_null_rows_after_values(self):
+        """Test NULL keys follow every value of a nullable column"""
+        where = KeysetPagination.seek_filter(
+            [('price_usd', True), ('pk', True)], ['10.00', 5], {'price_usd'}
+        )
+        sql = str(Content.objects.filter(where).query)
+
+        self.assertIn('"contents_content"."price_usd" < 10.00 OR "contents_content"."price_usd" IS NULL', sql)
+
+    def test_seek_filter_null_cursor_value(self):
+        """Test a NULL cursor value seeks within the NULL rows by tie-breaker"""
+        where = KeysetPagination.seek_filter(
+            [('price_usd', True), ('pk', True)], [None, 5], {'price_usd'}
+        )
+        sql = str(Content.objects.filter(where).query)
+
+        self.assertIn('"contents_content"."price_usd" IS NULL', sql)
+        self.assertIn('"contents_content"."id" < 5', sql)
+        self.assertNotIn('"contents_content"."price_usd" <', sql)
+
+
+@override_settings(VIEW_COUNTER_MODE='buffered', VIEW_COUNTER_FLUSH_INTERVAL=3600)
+class ViewCounterTestCase(SimpleTestCase):
+    """Test buffered view counting (database writes are patched out)"""
+
+    def setUp(self):
+        cache.clear()
+        # Mark a flush as recently done so record_view does not flush
+        cache.set(f'{view_counter.KEY_PREFIX}:flush-due', 1, 3600)
+        # Rollup receivers write to the database
+        patcher = mock.patch.object(view_counter.views_flushed, 'send_robust', return_value=[])
+        self.views_flushed = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_views_are_buffered_and_flushed_in_one_batch(self):
+        """Test repeated views are summed per object and flushed per model"""
+        first, second = Content(pk=1, view_count=5), Content(pk=2, view_count=0)
+        booth = Booth(pk=9, view_count=0)
+
+        for _ in range(3):
+            view_counter.record_view(first)
+        view_counter.record_view(second)
+        view_counter.record_view(booth)
+
+        self.assertEqual(first.view_count, 8)
+
+        with mock.patch.object(view_counter, 'bulk_increment') as bulk_increment:
+            flushed = view_counter.flush_view_counts()
+
+        self.assertEqual(flushed, {'contents.Content': 4, 'booths.Booth': 1})
+        bulk_increment.assert_any_call(Content, {1: 3, 2: 1})
+        bulk_increment.assert_any_call(Booth, {9: 1})
+        self.views_flushed.assert_any_call(sender=Content, deltas={1: 3, 2: 1})
+
+    def test_flush_drains_the_buffer(self):
+        """Test views are written once; later views start a new batch"""
+        content = Content(pk=1, view_count=0)
+        view_counter.record_view(content)
+
+        with mock.patch.object(view_counter, 'bulk_increment') as bulk_increment:
+            view_counter.flush_view_counts()
+            self.assertEqual(view_counter.flush_view_counts(), {})
+            view_counter.record_view(content)
+            view_counter.flush_view_counts()
+
+        self.assertEqual(
+            bulk_increment.call_args_list,
+            [mock.call(Content, {1: 1}), mock.call(Content, {1: 1})]
+        )
+
+    def test_failed_flush_keeps_views(self):
+        """Test views are restored to the buffer when the database write fails"""
+        view_counter.record_view(Content(pk=1, view_count=0))
+
+        with mock.patch.object(view_counter, 'bulk_increment', side_effect=RuntimeError):
+            self.assertEqual(view_counter.flush_view_counts(fail_silently=True), {})
+
+        with mock.patch.object(view_counter, 'bulk_increment') as bulk_increment:
+            view_counter.flush_view_counts()
+        bulk_increment.assert_called_once_with(Content, {1: 1})
+
+    def test_failing_receiver_does_not_fail_flush(self):
+        """Test views_flushed receiver errors are logged once the counts are written"""
+        def rollup(**kwargs):
+            pass
+
+        self.views_flushed.return_value = [(rollup, RuntimeError('rollup failed'))]
+        view_counter.record_view(Content(pk=1, view_count=0))
+
+        with mock.patch.object(view_counter, 'bulk_increment'), \
+                self.assertLogs(view_counter.logger, 'ERROR') as logs:
+            flushed = view_counter.flush_view_counts(fail_silently=True)
+
+        self.assertEqual(flushed, {'contents.Content': 1})
+        self.assertIn('views_flushed receiver', logs.output[0])
+
+
+class ValuesSerializerTestCase(SimpleTestCase):
+    """Test the values-based fast path renders exactly like the ModelSerializer"""
+
+    @staticmethod
+    def as_row(serializer_class, instance):
+        """Build the .values() row the fast path would receive for instance"""
+        row = {}
+        for _, lookup, _ in serializer_class.get_plan():
+            value = instance
+            attrs = lookup.split('__')
+            for attr in attrs[:-1]:
+                value = getattr(value, attr)
+            field = value._meta.get_field(attrs[-1])
+            value = getattr(value, field.attname)
+            row[lookup] = getattr(value, 'name', value)
+        return row
+
+    def assertSameJSON(self, model_serializer, values_serializer, instance):
+        row = self.as_row(values_serializer, instance)
+        self.assertEqual(
+            JSONRenderer().render(values_serializer([row], many=True).data),
+            JSONRenderer().render(model_serializer([instance], many=True).data)
+        )
+
+    def test_content_public_output_matches(self):
+        """Test joined producer fields, decimals, dates, files and arrays render identically"""
+        producer = User(pk=3, username='studio', company_name='Studio', booth_slug='studio')
+        content = Content(
+            pk=1, producer=producer, title='Title', description='Desc',
+            poster='posters/a.jpg', teaser_video='', rating='all',
+            genre_tags=['drama'], price=Decimal('1000'), currency='KRW',
+            duration_seconds=60, release_target=None, view_count=5,
+            created_at=datetime(2025, 1, 2, 3, 4, 5, 123456, tzinfo=dt_timezone.utc),
+        )
+
+        self.assertSameJSON(ContentPublicSerializer, ContentPublicValuesSerializer, content)
+
+    def test_offer_producer_output_matches(self):
+        """Test primary-key related fields render as ids"""
+        buyer = User(pk=8, username='buyer', company_name='Buyer Co', country='JP')
+        producer = User(pk=3, username='studio')
+        content = Content(pk=1, producer=producer, title='Title')
+        created_at = datetime(2025, 1, 2, tzinfo=dt_timezone.utc)
+        offer = Offer(
+            pk=4, content=content, buyer=buyer, offered_price=Decimal('12.5'),
+            currency='USD', message='Hi', validity_days=7, status='pending',
+            expires_at=created_at, created_at=created_at, updated_at=created_at,
+        )
+
+        self.assertSameJSON(OfferProducerSerializer, OfferProducerValuesSerializer, offer)
+
+    def test_prepare_queryset_adds_ordering_columns(self):
+        """Test ordering columns are fetched for keyset cursors"""
+        queryset = ContentPublicValuesSerializer.prepare_queryset(
+            Content.objects.order_by('-trending_score', '-id')
+        )
+
+        self.assertIn('trending_score', queryset.query.values_select)
+        self.assertIn('producer__company_name', queryset.query.values_select)
+
+
+class FieldsetTestCase(SimpleTestCase):
+    """Test sparse fieldsets (?fields= / ?omit=)"""
+
+    @staticmethod
+    def parse(query, serializer_class=ContentPublicSerializer):
+        request = Request(APIRequestFactory().get('/', query))
+        return parse_fieldset(request, serializer_class)
+
+    def test_no_parameters_selects_all(self):
+        """Test the full representation is kept without fields/omit"""
+        self.assertIsNone(self.parse({}))
+
+    def test_fields_and_omit(self):
+        """Test fields keep declaration order and omit is applied after them"""
+        self.assertEqual(self.parse({'fields': 'price,id,title'}), ('id', 'title', 'price'))
+        self.assertEqual(self.parse({'fields': 'id,title', 'omit': 'title'}), ('id',))
+        self.assertNotIn('description', self.parse({'omit': 'description'}))
+
+    def test_invalid_fieldsets_are_rejected(self):
+        """Test unknown names and empty selections raise FieldsetError"""
+        with self.assertRaisesMessage(FieldsetError, 'Unknown fields: video_url'):
+            self.parse({'fields': 'id,video_url'})
+        with self.assertRaises(FieldsetError):
+            self.parse({'fields': 'id', 'omit': 'id'})
+
+    def test_serializer_renders_only_selected_fields(self):
+        """Test SparseFieldsetMixin drops unselected fields (also with many=True)"""
+        content = Content(pk=1, title='Title', description='Desc')
+
+        data = ContentPublicSerializer([content], many=True, fields=('id', 'title')).data
+
+        self.assertEqual(data, [{'id': 1, 'title': 'Title'}])
+
+    def test_values_serializer_fetches_only_selected_columns(self):
+        """Test with_fields narrows both the output and the selected columns"""
+        serializer_class = ContentPublicValuesSerializer.with_fields(('id', 'title', 'producer_name'))
+
+        queryset = serializer_class.prepare_queryset(Content.objects.order_by('-created_at'))
+
+        self.assertEqual(
+            set(queryset.query.values_select),
+            {'id', 'title', 'producer__company_name', 'created_at'}
+        )
+        self.assertEqual(len(ContentPublicValuesSerializer.get_plan()), len(ContentPublicSerializer().fields))
+
+    def test_defer_unselected_columns(self):
+        """Test columns of unselected fields are deferred, ordering and dependencies are kept"""
+        queryset = LOI.objects.select_related('offer').order_by('-created_at')
+
+        deferred, is_defer = defer_unselected(
+            queryset, LOISerializer, ('id', 'is_pdf_ready')
+        ).query.deferred_loading
+
+        self.assertTrue(is_defer)
+        self.assertIn('content_description', deferred)
+        self.assertNotIn('pdf_file', deferred)
+        self.assertNotIn('created_at', deferred)
+        self.assertNotIn('offer', deferred)
+
+
+class ConditionalGetTestCase(SimpleTestCase):
+    """Test ETag / Last-Modified validation"""
+
+    updated_at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=dt_timezone.utc)
+
+    @staticmethod
+    def request(query=None, **headers):
+        return Request(APIRequestFactory().get('/api/v1/contents/', query or {}, **headers))
+
+    def test_etag_covers_validators_and_query(self):
+        """Test the weak ETag changes with validators and query parameters"""
+        etag = ConditionalGet(self.request(), self.updated_at, 3).etag
+
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertEqual(etag, ConditionalGet(self.request(), self.updated_at, 3).etag)
+        self.assertNotEqual(etag, ConditionalGet(self.request(), self.updated_at, 2).etag)
+        self.assertNotEqual(etag, ConditionalGet(self.request({'page': 2}), self.updated_at, 3).etag)
+
+    def test_matching_etag_is_not_modified(self):
+        """Test If-None-Match with the current ETag yields a 304 with validators"""
+        etag = ConditionalGet(self.request(), self.updated_at).etag
+
+        response = ConditionalGet(
+            self.request(HTTP_IF_NONE_MATCH=etag), self.updated_at
+        ).not_modified()
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertIsNone(ConditionalGet(self.request(HTTP_IF_NONE_MATCH='W/"stale"'), self.updated_at).not_modified())
+
+    def test_if_modified_since(self):
+        """Test Last-Modified is honoured only when passed explicitly"""
+        since = 'Thu, 02 Jan 2025 03:04:05 GMT'
+
+        response = ConditionalGet(
+            self.request(HTTP_IF_MODIFIED_SINCE=since), last_modified=self.updated_at
+        ).not_modified()
+
+        self.assertEqual(response.status_code, 304)
+        self.assertIsNone(ConditionalGet(self.request(HTTP_IF_MODIFIED_SINCE=since), self.updated_at).not_modified())
+
+    def test_finalize_sets_caching_headers(self):
+        """Test responses carry validators, Cache-Control and Vary"""
+        response = ConditionalGet(self.request(), last_modified=self.updated_at).finalize(Response({}))
+
+        self.assertEqual(response['Last-Modified'], 'Thu, 02 Jan 2025 03:04:05 GMT')
+        self.assertIn('must-revalidate', response['Cache-Control'])
+        self.assertIn('Accept', response['Vary'])
+
+
+class PageCacheTestCase(SimpleTestCase):
+    """Test the anonymous full-page cache"""
+
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+
+        @page_cache.cache_anonymous_page
+        def view(request):
+            self.calls += 1
+            return HttpResponse(
+                f'<form><input type="hidden" name="csrfmiddlewaretoken" value="secret-{self.calls}"></form>'
+            )
+
+        self.view = view
+
+    def test_second_anonymous_request_is_served_from_cache(self):
+        """Test the view runs once and the CSRF token is filled in per request"""
+        self.view(RequestFactory().get('/browse/', {'b': '1', 'a': '2'}))
+        response = self.view(RequestFactory().get('/browse/', {'a': '2', 'b': '1'}))
+
+        self.assertEqual(self.calls, 1)
+        content = response.content.decode()
+        self.assertNotIn('secret-1', content)
+        self.assertNotIn(page_cache.CSRF_PLACEHOLDER, content)
+        self.assertIn('name="csrfmiddlewaretoken" value="', content)
+
+    def test_requests_with_session_are_not_cached(self):
+        """Test visitors with a session cookie always get a fresh render"""
+        factory = RequestFactory()
+        factory.cookies['sessionid'] = 'abc'
+
+        self.view(factory.get('/browse/'))
+        self.view(factory.get('/browse/'))
+
+        self.assertEqual(self.calls, 2)
+
+    def test_invalidate_drops_cached_pages(self):
+        """Test a version bump forces the next request to render again"""
+        self.view(RequestFactory().get('/browse/'))
+        page_cache.invalidate_page_cache()
+        self.view(RequestFactory().get('/browse/'))
+
+        self.assertEqual(self.calls, 2)
+
+    def test_on_hit_receives_view_state(self):
+        """Test state stored by the view is passed to on_hit for cached responses"""
+        hits = []
+
+        @page_cache.cache_anonymous_page(on_hit=lambda request, slug, booth_id: hits.append((slug, booth_id)))
+        def booth(request, slug):
+            response = HttpResponse('booth')
+            response.page_cache_state = {'booth_id': 5}
+            return response
+
+        booth(RequestFactory().get('/booth/studio/'), slug='studio')
+        booth(RequestFactory().get('/booth/studio/'), slug='studio')
+
+        self.assertEqual(hits, [('studio', 5)])
+
+
+class ObjectCacheTestCase(SimpleTestCase):
+    """Test the two-tier object cache and its version stamps"""
+
+    def setUp(self):
+        cache.clear()
+        self.object_cache = ObjectCache('test', local_size=2)
+
+    def store(self, key, *stamps):
+        self.object_cache.set(key, {'key': key}, read_stamps(stamps))
+
+    def test_get_returns_stored_value(self):
+        """Test values are served while their stamps are unchanged"""
+        self.store(1, 'content:1', 'user:3')
+
+        self.assertEqual(self.object_cache.get(1), {'key': 1})
+        self.assertIsNone(self.object_cache.get(2))
+
+    def test_bumped_stamp_invalidates_both_tiers(self):
+        """Test a bump from another process makes local and shared copies stale"""
+        self.store(1, 'content:1', 'user:3')
+        other_worker = ObjectCache('test')
+        self.assertEqual(other_worker.get(1), {'key': 1})
+
+        bump_stamps('user:3')
+
+        self.assertIsNone(self.object_cache.get(1))
+        self.assertIsNone(other_worker.get(1))
+
+    def test_local_tier_is_a_bounded_lru(self):
+        """Test hot entries are served locally and the least recently used is evicted"""
+        for key in (1, 2, 3):
+            self.store(key, f'content:{key}')
+
+        self.assertEqual(list(self.object_cache._local), [2, 3])
+        with mock.patch.object(cache, 'get', wraps=cache.get) as cache_get:
+            self.assertEqual(self.object_cache.get(3), {'key': 3})
+        self.assertNotIn('objcache:test:3', [call.args[0] for call in cache_get.call_args_list])
+
+    @override_settings(OBJECT_CACHE_TIMEOUT=300, NEGATIVE_CACHE_TIMEOUT=60)
+    def test_stamps_expire_after_the_longest_entry_timeout(self):
+        """Test stamps created for unknown ids are not kept forever"""
+        with mock.patch.object(cache, 'add', wraps=cache.add) as cache_add:
+            read_stamps(['content:999999'])
+
+        self.assertEqual(cache_add.call_args.args[2], 300)
+
+    @override_settings(OBJECT_CACHE_TIMEOUT=0)
+    def test_disabled(self):
+        """Test a zero timeout disables the cache"""
+        self.store(1, 'content:1')
+
+        self.assertIsNone(self.object_cache.get(1))
+
+
+class FastJSONRendererTestCase(SimpleTestCase):
+    """Test the envelope renderer matches DRF's JSONRenderer"""
+
+    @skipUnless(renderers.orjson, 'orjson is not installed')
+    def test_orjson_is_used_when_installed(self):
+        """Test compact output goes through orjson, not the stdlib fallback"""
+        with mock.patch.object(renderers.orjson, 'dumps', wraps=renderers.orjson.dumps) as dumps, \
+                mock.patch.object(JSONRenderer, 'render') as fallback:
+            FastJSONRenderer().render({'success': True})
+
+        dumps.assert_called_once()
+        fallback.assert_not_called()
+
+    @skipUnless(renderers.orjson, 'orjson is not installed')
+    def test_output_matches_json_renderer(self):
+        """Test decimals, datetimes, unicode and separators render identically"""
+        data = {
+            'success': True,
+            'data': [{
+                'price': Decimal('12.50'),
+                'created_at': datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=dt_timezone.utc),
+                'title': '숏딜 \u2028 drama',
+                'tags': ['a', 'b'],
+            }],
+            'message': 'Success',
+        }
+
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_file_fields_render_as_urls(self):
+        """Test ImageField values are rendered as their URL (or null when empty)"""
+        content = Content(poster='posters/a.jpg', teaser_video='')
+
+        rendered = FastJSONRenderer().render({'poster': content.poster, 'teaser': content.teaser_video})
+
+        self.assertEqual(rendered, b'{"poster":"/media/posters/a.jpg","teaser":null}')
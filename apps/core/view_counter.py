@@ -0,0 +1,249 @@
+"""
+Buffered view counters
+
+Page views are accumulated in the cache and written to the database in
+batches, one `UPDATE ... FROM (VALUES ...)` per model, instead of one
+row-locking UPDATE per request.
+
+- record_view(instance): count one view (buffered or synchronous)
+- flush_view_counts(): write buffered views to the database
+
+Settings:
+    VIEW_COUNTER_MODE: 'buffered' (default) or 'sync' (immediate UPDATE per view)
+    VIEW_COUNTER_FLUSH_INTERVAL: seconds between automatic flushes (default 30)
+
+Buffered views are flushed by the first request after each interval, at
+process exit, and by the `flush_view_counts` management command. The
+command can only see other processes' buffers when a shared cache backend
+(e.g. Redis) is configured; with the default local-memory cache each
+process flushes its own buffer.
+
+The `views_flushed` signal is sent with `deltas` ({pk: views}) whenever
+views reach the database, so rollups can follow along.
+"""
+import atexit
+import logging
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import F
+from django.dispatch import Signal
+
+logger = logging.getLogger(__name__)
+
+# Sent after views are written: sender=model class, deltas={pk: views}
+views_flushed = Signal()
+
+VIEW_COUNTER_MODE_BUFFERED = 'buffered'
+VIEW_COUNTER_MODE_SYNC = 'sync'
+
+# Models with a view_count column that may be counted
+VIEW_COUNTER_MODELS = ('contents.Content', 'booths.Booth')
+
+KEY_PREFIX = 'viewcount'
+LOCK_TIMEOUT = 10
+LOCK_ATTEMPTS = 50
+LOCK_WAIT = 0.005
+
+_atexit_registered = False
+
+
+def get_mode():
+    return getattr(settings, 'VIEW_COUNTER_MODE', VIEW_COUNTER_MODE_BUFFERED)
+
+
+def get_flush_interval():
+    return getattr(settings, 'VIEW_COUNTER_FLUSH_INTERVAL', 30)
+
+
+def _counter_key(label, pk):
+    return f'{KEY_PREFIX}:{label}:{pk}'
+
+
+def _dirty_key(label):
+    return f'{KEY_PREFIX}:{label}:dirty'
+
+
+def _lock_key(name):
+    return f'{KEY_PREFIX}:lock:{name}'
+
+
+def _acquire(name):
+    """Spin briefly on a cache lock; returns True when acquired"""
+    for _ in range(LOCK_ATTEMPTS):
+        if cache.add(_lock_key(name), 1, LOCK_TIMEOUT):
+            return True
+        time.sleep(LOCK_WAIT)
+    return False
+
+
+def _release(name):
+    cache.delete(_lock_key(name))
+
+
+def _mark_dirty(label, pk):
+    """Add pk to the model's set of counters awaiting a flush"""
+    if not _acquire(label):
+        return False
+    try:
+        dirty = cache.get(_dirty_key(label)) or set()
+        dirty.add(pk)
+        cache.set(_dirty_key(label), dirty, None)
+    finally:
+        _release(label)
+    return True
+
+
+def _take_dirty(label):
+    """Atomically take (and clear) the set of dirty pks for a model"""
+    if not _acquire(label):
+        return set()
+    try:
+        dirty = cache.get(_dirty_key(label)) or set()
+        cache.delete(_dirty_key(label))
+    finally:
+        _release(label)
+    return dirty
+
+
+def _increment_counter(key, delta=1):
+    """Increment a cache counter, creating it if missing; returns the new value"""
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        if cache.add(key, delta, None):
+            return delta
+        return cache.incr(key, delta)
+
+
+def _notify_flushed(model, deltas):
+    """
+    Send views_flushed; receiver errors (e.g. a failed rollup write) are
+    logged, since the view counts themselves are already written.
+    """
+    for receiver, response in views_flushed.send_robust(sender=model, deltas=deltas):
+        if isinstance(response, Exception):
+            logger.error(
+                'views_flushed receiver %r failed for %s', receiver, model._meta.label,
+                exc_info=response,
+            )
+
+
+def record_view(instance):
+    """
+    Count one view of a Content or Booth.
+
+    The in-memory instance's view_count is bumped so the current response
+    includes this view without re-reading the row.
+    """
+    model = type(instance)
+    label = model._meta.label
+    if label not in VIEW_COUNTER_MODELS:
+        raise ValueError(f'{label} does not support view counting')
+
+    instance.view_count += 1
+
+    if get_mode() == VIEW_COUNTER_MODE_SYNC:
+        model.objects.filter(pk=instance.pk).update(view_count=F('view_count') + 1)
+        _notify_flushed(model, {instance.pk: 1})
+        return
+
+    _register_atexit()
+    key = _counter_key(label, instance.pk)
+    if _increment_counter(key) == 1 and not _mark_dirty(label, instance.pk):
+        # Could not register the counter for flushing; write through instead
+        # of losing the view (decr first so a later flush cannot double count)
+        cache.decr(key)
+        model.objects.filter(pk=instance.pk).update(view_count=F('view_count') + 1)
+        _notify_flushed(model, {instance.pk: 1})
+
+    if cache.add(f'{KEY_PREFIX}:flush-due', 1, get_flush_interval()):
+        # First view after the interval elapsed flushes the buffer
+        flush_view_counts(fail_silently=True)
+
+
+def _collect_deltas(label):
+    """Drain buffered counters for a model into {pk: delta}"""
+    deltas = {}
+    for pk in _take_dirty(label):
+        key = _counter_key(label, pk)
+        value = cache.get(key) or 0
+        if value <= 0:
+            continue
+        # decr keeps views recorded after the get; re-register them
+        if cache.decr(key, value) > 0:
+            _mark_dirty(label, pk)
+        deltas[pk] = value
+    return deltas
+
+
+def _restore_deltas(label, deltas):
+    """Put deltas back into the buffer after a failed database write"""
+    for pk, delta in deltas.items():
+        _increment_counter(_counter_key(label, pk), delta)
+        _mark_dirty(label, pk)
+
+
+def bulk_increment(model, deltas):
+    """
+    Add deltas ({pk: n}) to view_count in a single statement:
+    UPDATE t SET view_count = t.view_count + v.delta FROM (VALUES ...) v(id, delta)
+    """
+    if not deltas:
+        return 0
+    table = connection.ops.quote_name(model._meta.db_table)
+    pk_column = connection.ops.quote_name(model._meta.pk.column)
+    rows = sorted(deltas.items())
+    values = ', '.join(['(%s, %s)'] * len(rows))
+    params = [value for row in rows for value in row]
+    sql = (
+        f'UPDATE {table} AS t SET view_count = t.view_count + v.delta '
+        f'FROM (VALUES {values}) AS v(id, delta) '
+        f'WHERE t.{pk_column} = v.id'
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.rowcount
+
+
+def flush_view_counts(fail_silently=False):
+    """
+    Write all buffered views to the database.
+
+    Returns:
+        dict: {model label: number of views written}
+    """
+    flushed = {}
+    for label in VIEW_COUNTER_MODELS:
+        deltas = _collect_deltas(label)
+        if not deltas:
+            continue
+        model = apps.get_model(label)
+        try:
+            bulk_increment(model, deltas)
+        except Exception:
+            _restore_deltas(label, deltas)
+            if not fail_silently:
+                raise
+            logger.exception('Failed to flush view counts for %s', label)
+            continue
+        flushed[label] = sum(deltas.values())
+        _notify_flushed(model, deltas)
+    return flushed
+
+
+def _flush_at_exit():
+    try:
+        flush_view_counts(fail_silently=True)
+    except Exception:
+        pass
+
+
+def _register_atexit():
+    global _atexit_registered
+    if not _atexit_registered:
+        atexit.register(_flush_at_exit)
+        _atexit_registered = True
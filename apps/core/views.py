@@ -10,6 +10,7 @@ from apps.accounts.models import User
 from apps.contents.models import Content
 from apps.offers.models import Offer
 from apps.loi.models import LOI
+from .page_cache import cache_anonymous_page
 
 
 def is_admin(user):
@@ -74,6 +75,7 @@ def admin_dashboard_view(request):
     })
 
 
+@cache_anonymous_page
 def tutorial_view(request):
     """
     Tutorial page view
@@ -82,6 +84,7 @@ def tutorial_view(request):
     return render(request, 'tutorial.html')
 
 
+@cache_anonymous_page
 def company_intro_view(request):
     """
     Company introduction page view
@@ -2,7 +2,7 @@
 Admin configuration for LOI model
 """
 from django.contrib import admin
-from .models import LOI
+from .models import LOI, LOIPDFJob
 
 
 @admin.register(LOI)
@@ -34,3 +34,26 @@ class LOIAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         """Optimize queries"""
         return super().get_queryset(request).select_related('buyer', 'producer', 'offer')
+
+
+@admin.register(LOIPDFJob)
+class LOIPDFJobAdmin(admin.ModelAdmin):
+    list_display = ('loi', 'status', 'attempts', 'run_after', 'updated_at')
+    list_filter = ('status',)
+    search_fields = ('loi__document_number',)
+    readonly_fields = ('loi', 'attempts', 'last_error', 'created_at', 'updated_at')
+    actions = ['retry_jobs']
+
+    @admin.action(description='Retry selected jobs now')
+    def retry_jobs(self, request, queryset):
+        from django.utils import timezone
+        updated = queryset.exclude(status=LOIPDFJob.Status.DONE).update(
+            status=LOIPDFJob.Status.PENDING,
+            attempts=0,
+            run_after=timezone.now()
+        )
+        self.message_user(request, f'{updated} jobs queued for retry.')
+
+    def get_queryset(self, request):
+        """Optimize queries"""
+        return super().get_queryset(request).select_related('loi')
@@ -6,6 +6,7 @@ from rest_framework import status
 from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 
+from apps.core.fieldsets import FIELDSET_PARAMETERS, FieldsetError, defer_unselected, parse_fieldset
 from apps.core.response import success_response, error_response, paginated_response
 from apps.core.permissions import IsRelatedParty
 from .models import LOI
@@ -17,9 +18,14 @@ class LOIListView(APIView):
     """List LOIs for current user (buyer or producer)"""
     permission_classes = [IsRelatedParty]
 
-    @extend_schema(responses={200: LOISerializer(many=True)})
+    @extend_schema(parameters=FIELDSET_PARAMETERS, responses={200: LOISerializer(many=True)})
     def get(self, request):
         """List all LOIs where user is buyer or producer"""
+        try:
+            fields = parse_fieldset(request, LOISerializer)
+        except FieldsetError as e:
+            return error_response(message=str(e), status_code=status.HTTP_400_BAD_REQUEST)
+
         queryset = LOI.objects.filter(
             buyer=request.user
         ) | LOI.objects.filter(
@@ -31,7 +37,8 @@ class LOIListView(APIView):
             queryset,
             LOISerializer,
             request,
-            message="LOIs retrieved successfully"
+            message="LOIs retrieved successfully",
+            fields=fields
         )
 
 
@@ -40,8 +47,10 @@ class LOIDetailView(APIView):
     """LOI detail view (accessible only by related parties)"""
 
     @extend_schema(
+        parameters=FIELDSET_PARAMETERS,
         responses={
             200: LOISerializer,
+            400: OpenApiResponse(description='Unknown fields'),
             403: OpenApiResponse(description='Not authorized'),
             404: OpenApiResponse(description='Not found')
         }
@@ -49,7 +58,17 @@ class LOIDetailView(APIView):
     def get(self, request, pk):
         """Get LOI detail"""
         try:
-            loi = LOI.objects.select_related('buyer', 'producer', 'offer').get(pk=pk)
+            fields = parse_fieldset(request, LOISerializer)
+        except FieldsetError as e:
+            return error_response(message=str(e), status_code=status.HTTP_400_BAD_REQUEST)
+
+        queryset = defer_unselected(
+            LOI.objects.select_related('buyer', 'producer', 'offer'),
+            LOISerializer,
+            fields
+        )
+        try:
+            loi = queryset.get(pk=pk)
         except LOI.DoesNotExist:
             return error_response(message="LOI not found", status_code=status.HTTP_404_NOT_FOUND)
 
@@ -61,7 +80,7 @@ class LOIDetailView(APIView):
             )
 
         return success_response(
-            data=LOISerializer(loi).data,
+            data=LOISerializer(loi, fields=fields).data,
             message="LOI retrieved successfully"
         )
 
@@ -0,0 +1,158 @@
+"""
+Background LOI PDF rendering backed by the LOIPDFJob table
+
+- enqueue_pdf(loi): queue rendering (or render now with LOI_PDF_MODE='sync')
+- claim_jobs(limit): lease runnable jobs with SELECT ... FOR UPDATE SKIP LOCKED
+- run_job(job): renew the job's lease, render the PDF and record success,
+  retry or failure
+- process_jobs(limit): claim and run one batch (used by the worker command)
+
+Settings:
+    LOI_PDF_MODE: 'queue' (default) or 'sync' (render inside the request)
+    LOI_PDF_JOB_LEASE_SECONDS: lease per attempt; expired leases are reclaimed (default 300)
+    LOI_PDF_JOB_MAX_ATTEMPTS: attempts before a job is marked failed (default 5)
+    LOI_PDF_JOB_BACKOFF_SECONDS: first retry delay, doubled per attempt (default 30)
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import LOIPDFJob
+
+logger = logging.getLogger(__name__)
+
+LOI_PDF_MODE_QUEUE = 'queue'
+LOI_PDF_MODE_SYNC = 'sync'
+
+# Retry delays are capped at one hour
+MAX_BACKOFF_SECONDS = 3600
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def get_backoff(attempts):
+    """Delay before retrying after `attempts` failed attempts (exponential, capped)"""
+    base = _setting('LOI_PDF_JOB_BACKOFF_SECONDS', 30)
+    return timedelta(seconds=min(base * 2 ** max(attempts - 1, 0), MAX_BACKOFF_SECONDS))
+
+
+def _lease_expiry():
+    return timezone.now() + timedelta(seconds=_setting('LOI_PDF_JOB_LEASE_SECONDS', 300))
+
+
+def enqueue_pdf(loi):
+    """Queue PDF rendering for an LOI (idempotent per LOI)"""
+    if _setting('LOI_PDF_MODE', LOI_PDF_MODE_QUEUE) == LOI_PDF_MODE_SYNC:
+        loi.generate_pdf()
+        return None
+
+    job, _ = LOIPDFJob.objects.update_or_create(
+        loi=loi,
+        defaults={
+            'status': LOIPDFJob.Status.PENDING,
+            'attempts': 0,
+            'run_after': timezone.now(),
+            'last_error': '',
+        }
+    )
+    return job
+
+
+def claim_jobs(limit=10):
+    """
+    Lease up to `limit` runnable jobs: pending jobs whose retry time has
+    come and running jobs whose lease expired. Rows locked by another
+    worker are skipped, so concurrent workers never claim the same job.
+    """
+    now = timezone.now()
+    expiry = _lease_expiry()
+
+    with transaction.atomic():
+        jobs = list(
+            LOIPDFJob.objects.select_related('loi').select_for_update(
+                skip_locked=True, of=('self',)
+            ).filter(
+                status__in=[LOIPDFJob.Status.PENDING, LOIPDFJob.Status.RUNNING],
+                run_after__lte=now,
+            ).order_by('run_after')[:limit]
+        )
+        for job in jobs:
+            job.status = LOIPDFJob.Status.RUNNING
+            job.attempts += 1
+            job.run_after = expiry
+        LOIPDFJob.objects.bulk_update(jobs, ['status', 'attempts', 'run_after'])
+    return jobs
+
+
+def _renew_lease(job):
+    """
+    Extend the lease of a claimed job right before it is rendered, so jobs
+    late in a slow batch are not re-claimed and rendered twice. Returns
+    False when the lease already expired and another worker re-claimed it.
+    """
+    return LOIPDFJob.objects.filter(
+        pk=job.pk,
+        status=LOIPDFJob.Status.RUNNING,
+        attempts=job.attempts,
+    ).update(run_after=_lease_expiry(), updated_at=timezone.now()) == 1
+
+
+def _finish(job, **fields):
+    """Record the outcome unless the lease expired and another worker re-claimed the job"""
+    fields['updated_at'] = timezone.now()
+    return LOIPDFJob.objects.filter(
+        pk=job.pk,
+        status=LOIPDFJob.Status.RUNNING,
+        attempts=job.attempts,
+    ).update(**fields)
+
+
+def run_job(job):
+    """
+    Render one leased job; returns True on success and None when the job
+    was re-claimed by another worker before it started
+    """
+    if not _renew_lease(job):
+        logger.info('LOI PDF job %s was re-claimed by another worker; skipping', job.pk)
+        return None
+    try:
+        job.loi.generate_pdf()
+    except Exception as e:
+        max_attempts = _setting('LOI_PDF_JOB_MAX_ATTEMPTS', 5)
+        if job.attempts >= max_attempts:
+            logger.error('LOI PDF job %s failed permanently: %s', job.pk, e, exc_info=True)
+            _finish(job, status=LOIPDFJob.Status.FAILED, last_error=str(e))
+        else:
+            logger.warning('LOI PDF job %s failed (attempt %s): %s', job.pk, job.attempts, e)
+            _finish(
+                job,
+                status=LOIPDFJob.Status.PENDING,
+                run_after=timezone.now() + get_backoff(job.attempts),
+                last_error=str(e),
+            )
+        return False
+
+    _finish(job, status=LOIPDFJob.Status.DONE, last_error='')
+    return True
+
+
+def process_jobs(limit=10):
+    """
+    Claim and run one batch of jobs.
+
+    Returns:
+        tuple: (succeeded, failed)
+    """
+    succeeded = failed = 0
+    for job in claim_jobs(limit):
+        result = run_job(job)
+        if result:
+            succeeded += 1
+        elif result is not None:
+            failed += 1
+    return succeeded, failed
@@ -0,0 +1,39 @@
+"""
+Worker for queued LOI PDF rendering (see apps.loi.jobs)
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.loi.jobs import process_jobs
+
+
+class Command(BaseCommand):
+    help = 'Render queued LOI PDFs; runs until interrupted unless --once is given'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drain runnable jobs and exit')
+        parser.add_argument('--batch-size', type=int, default=10, help='Jobs claimed per batch (default 10)')
+        parser.add_argument('--poll-interval', type=float, default=2.0, help='Seconds to wait when idle (default 2)')
+
+    def handle(self, *args, **options):
+        total_succeeded = total_failed = 0
+        try:
+            while True:
+                close_old_connections()
+                succeeded, failed = process_jobs(limit=options['batch_size'])
+                total_succeeded += succeeded
+                total_failed += failed
+                if succeeded or failed:
+                    self.stdout.write(f'Rendered {succeeded} PDFs, {failed} failed')
+                elif options['once']:
+                    break
+                else:
+                    time.sleep(options['poll_interval'])
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Done: {total_succeeded} PDFs rendered, {total_failed} failed attempts'
+        ))
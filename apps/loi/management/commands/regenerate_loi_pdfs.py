@@ -0,0 +1,146 @@
+"""
+Re-render LOI PDFs in parallel (e.g. after changing apps/loi/pdf_generator.py)
+
+LOIs are streamed in id order and rendered by a process pool; each file is
+written to a temporary file and renamed over the old PDF, so readers never
+see a partial document. Only LOIs whose PDF predates --stale-before are
+rendered, so an interrupted run resumes by passing the same value again.
+"""
+import multiprocessing
+import os
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.loi.models import LOI
+from apps.loi.pdf_generator import generate_loi_pdf
+
+# Fields read by generate_loi_pdf (plus the current file name)
+RENDER_FIELDS = (
+    'id', 'document_number', 'created_at', 'pdf_file',
+    'buyer_company', 'buyer_country', 'producer_company', 'producer_country',
+    'content_title', 'content_description', 'agreed_price', 'currency',
+)
+
+
+def _init_worker():
+    # Needed for spawn/forkserver start methods; a no-op for forked workers
+    import django
+    django.setup()
+
+
+def write_atomically(path, data):
+    """Write bytes to path via a temporary file in the same directory and a rename"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def render_to_file(task):
+    """Worker: render one LOI to its file; returns (pk, error message or None)"""
+    loi, path = task
+    try:
+        write_atomically(path, generate_loi_pdf(loi))
+    except Exception as e:
+        return loi.pk, f'{type(e).__name__}: {e}'
+    return loi.pk, None
+
+
+class Command(BaseCommand):
+    help = 'Re-render LOI PDFs in parallel; resumable with --stale-before'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers', type=int, default=os.cpu_count() or 1,
+            help='Render processes (default: CPU count)'
+        )
+        parser.add_argument('--chunk-size', type=int, default=200, help='LOIs fetched per query (default 200)')
+        parser.add_argument(
+            '--stale-before',
+            help='Only render PDFs generated before this ISO timestamp (default: now). '
+                 'Pass the value printed by an interrupted run to resume it.'
+        )
+
+    def handle(self, *args, **options):
+        stale_before = self.parse_stale_before(options['stale_before'])
+        storage = LOI._meta.get_field('pdf_file').storage
+        try:
+            storage.path('loi_pdfs/')
+        except NotImplementedError:
+            raise CommandError('regenerate_loi_pdfs requires a local filesystem storage for LOI PDFs')
+
+        queryset = LOI.objects.filter(
+            Q(pdf_generated_at__isnull=True) | Q(pdf_generated_at__lt=stale_before)
+        ).only(*RENDER_FIELDS).order_by('id')
+
+        self.stdout.write(
+            f'Regenerating LOI PDFs older than {stale_before.isoformat()} '
+            f'with {options["workers"]} workers (resume with --stale-before {stale_before.isoformat()})'
+        )
+
+        # Workers never use the database; don't let them inherit open connections
+        connections.close_all()
+        rendered = failed = 0
+        started = time.monotonic()
+        last_id = 0
+        with multiprocessing.Pool(options['workers'], initializer=_init_worker) as pool:
+            while True:
+                chunk = list(queryset.filter(id__gt=last_id)[:options['chunk_size']])
+                if not chunk:
+                    break
+                last_id = chunk[-1].pk
+
+                names = {loi.pk: loi.pdf_file.name or f'loi_pdfs/{loi.document_number}.pdf' for loi in chunk}
+                tasks = [(loi, storage.path(names[loi.pk])) for loi in chunk]
+
+                done = []
+                for pk, error in pool.imap_unordered(render_to_file, tasks):
+                    if error:
+                        failed += 1
+                        self.stderr.write(f'LOI {pk}: {error}')
+                    else:
+                        done.append(pk)
+
+                now = timezone.now()
+                LOI.objects.bulk_update(
+                    [LOI(pk=pk, pdf_file=names[pk], pdf_generated_at=now) for pk in done],
+                    ['pdf_file', 'pdf_generated_at']
+                )
+                rendered += len(done)
+
+                elapsed = time.monotonic() - started
+                self.stdout.write(
+                    f'{rendered} rendered, {failed} failed, up to id {last_id} '
+                    f'({rendered / elapsed:.1f} PDFs/s)'
+                )
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Regenerated {rendered} LOI PDFs in {elapsed:.1f}s '
+            f'({rendered / elapsed if elapsed else 0:.1f} PDFs/s), {failed} failed'
+        ))
+
+    @staticmethod
+    def parse_stale_before(value):
+        if not value:
+            return timezone.now()
+        parsed = parse_datetime(value)
+        if parsed is None:
+            raise CommandError(f'Invalid --stale-before timestamp: {value}')
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def queue_missing_pdfs(apps, schema_editor):
+    """Queue rendering for LOIs whose PDF was never generated"""
+    LOI = apps.get_model('loi', 'LOI')
+    LOIPDFJob = apps.get_model('loi', 'LOIPDFJob')
+    now = timezone.now()
+    LOIPDFJob.objects.bulk_create([
+        LOIPDFJob(loi_id=loi_id, run_after=now)
+        for loi_id in LOI.objects.filter(pdf_file__in=['', None]).values_list('id', flat=True)
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('loi', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LOIPDFJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=10, verbose_name='Status')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='Attempts')),
+                ('run_after', models.DateTimeField(verbose_name='Run after')),
+                ('last_error', models.TextField(blank=True, verbose_name='Last error')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated at')),
+                ('loi', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='pdf_job', to='loi.loi', verbose_name='LOI')),
+            ],
+            options={
+                'verbose_name': 'LOI PDF job',
+                'verbose_name_plural': 'LOI PDF jobs',
+                'ordering': ['run_after'],
+                'indexes': [models.Index(fields=['status', 'run_after'], name='loi_pdfjob_claim_idx')],
+            },
+        ),
+        migrations.RunPython(queue_missing_pdfs, migrations.RunPython.noop),
+    ]
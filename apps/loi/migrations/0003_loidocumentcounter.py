@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:30
+
+from django.db import migrations, models
+
+
+def seed_counters(apps, schema_editor):
+    """Start each year's counter after the highest existing document number"""
+    LOI = apps.get_model('loi', 'LOI')
+    LOIDocumentCounter = apps.get_model('loi', 'LOIDocumentCounter')
+    last_numbers = {}
+    for document_number in LOI.objects.values_list('document_number', flat=True).iterator():
+        _, year, number = document_number.split('-')
+        year, number = int(year), int(number)
+        last_numbers[year] = max(last_numbers.get(year, 0), number)
+    LOIDocumentCounter.objects.bulk_create([
+        LOIDocumentCounter(year=year, last_number=number)
+        for year, number in last_numbers.items()
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('loi', '0002_loipdfjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LOIDocumentCounter',
+            fields=[
+                ('year', models.PositiveSmallIntegerField(primary_key=True, serialize=False, verbose_name='Year')),
+                ('last_number', models.PositiveIntegerField(default=0, verbose_name='Last number')),
+            ],
+            options={
+                'verbose_name': 'LOI document counter',
+                'verbose_name_plural': 'LOI document counters',
+            },
+        ),
+        migrations.RunPython(seed_counters, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,7 @@
 """
 LOI (Letter of Intent) model for accepted offers
 """
-from django.db import models
+from django.db import connection, models, transaction
 from django.conf import settings
 
 
@@ -15,7 +15,7 @@ class LOI(models.Model):
         verbose_name='Offer'
     )
 
-    # LOI document number (LOI-YYYY-NNNN)
+    # LOI document number (LOI-YYYY-NNNN, more digits past 9999 a year)
     document_number = models.CharField(
         max_length=20,
         unique=True,
@@ -91,22 +91,20 @@ class LOI(models.Model):
 
     @classmethod
     def generate_document_number(cls):
-        """Generate unique LOI document number (LOI-YYYY-NNNN)"""
+        """
+        Allocate the next LOI document number (LOI-YYYY-NNNN) for this year.
+
+        The per-year counter row stays locked until the surrounding
+        transaction ends, so concurrent acceptances get distinct numbers
+        and a rolled-back LOI gives its number back.
+        """
         from django.utils import timezone
         year = timezone.now().year
+        return cls.format_document_number(year, LOIDocumentCounter.allocate(year))
 
-        # Get last LOI number for this year
-        last_loi = cls.objects.filter(
-            document_number__startswith=f'LOI-{year}-'
-        ).order_by('-document_number').first()
-
-        if last_loi:
-            last_num = int(last_loi.document_number.split('-')[-1])
-            next_num = last_num + 1
-        else:
-            next_num = 1
-
-        return f'LOI-{year}-{next_num:04d}'
+    @staticmethod
+    def format_document_number(year, number):
+        return f'LOI-{year}-{number:04d}'
 
     def generate_pdf(self):
         """Generate PDF file for this LOI"""
@@ -133,26 +131,104 @@ class LOI(models.Model):
     @classmethod
     def create_from_offer(cls, offer):
         """Create LOI from accepted offer"""
-        # Generate document number
-        doc_number = cls.generate_document_number()
-
-        # Create LOI with snapshot data
-        loi = cls.objects.create(
-            offer=offer,
-            document_number=doc_number,
-            buyer=offer.buyer,
-            producer=offer.content.producer,
-            content_title=offer.content.title,
-            content_description=offer.content.description,
-            agreed_price=offer.offered_price,
-            currency=offer.currency,
-            buyer_company=offer.buyer.company_name or offer.buyer.username,
-            buyer_country=offer.buyer.country or 'Unknown',
-            producer_company=offer.content.producer.company_name or offer.content.producer.username,
-            producer_country=offer.content.producer.country or 'Unknown'
+        # Allocate the number and insert the LOI in one transaction, so the
+        # counter row is locked only briefly and never skips on failure
+        with transaction.atomic():
+            doc_number = cls.generate_document_number()
+
+            # Create LOI with snapshot data
+            loi = cls.objects.create(
+                offer=offer,
+                document_number=doc_number,
+                buyer=offer.buyer,
+                producer=offer.content.producer,
+                content_title=offer.content.title,
+                content_description=offer.content.description,
+                agreed_price=offer.offered_price,
+                currency=offer.currency,
+                buyer_company=offer.buyer.company_name or offer.buyer.username,
+                buyer_country=offer.buyer.country or 'Unknown',
+                producer_company=offer.content.producer.company_name or offer.content.producer.username,
+                producer_country=offer.content.producer.country or 'Unknown'
+            )
+
+        # Render the PDF in the background worker (apps.loi.jobs)
+        from .jobs import enqueue_pdf
+        enqueue_pdf(loi)
+
+        return loi
+
+
+class LOIDocumentCounter(models.Model):
+    """Last LOI document number allocated per year"""
+
+    year = models.PositiveSmallIntegerField(primary_key=True, verbose_name='Year')
+    last_number = models.PositiveIntegerField(default=0, verbose_name='Last number')
+
+    class Meta:
+        verbose_name = 'LOI document counter'
+        verbose_name_plural = 'LOI document counters'
+
+    def __str__(self):
+        return f"{self.year}: {self.last_number}"
+
+    @classmethod
+    def allocate(cls, year):
+        """
+        Increment and return the year's counter in one statement:
+        INSERT ... ON CONFLICT (year) DO UPDATE ... RETURNING last_number
+        """
+        table = connection.ops.quote_name(cls._meta.db_table)
+        sql = (
+            f'INSERT INTO {table} AS c (year, last_number) VALUES (%s, 1) '
+            f'ON CONFLICT (year) DO UPDATE SET last_number = c.last_number + 1 '
+            f'RETURNING last_number'
         )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [year])
+            return cursor.fetchone()[0]
 
-        # Generate PDF immediately (for now; can be async later)
-        loi.generate_pdf()
 
-        return loi
+class LOIPDFJob(models.Model):
+    """
+    Durable queue entry for rendering an LOI PDF (see apps.loi.jobs).
+    Workers lease jobs with SELECT ... FOR UPDATE SKIP LOCKED.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        RUNNING = 'running', 'Running'
+        DONE = 'done', 'Done'
+        FAILED = 'failed', 'Failed'
+
+    loi = models.OneToOneField(
+        LOI,
+        on_delete=models.CASCADE,
+        related_name='pdf_job',
+        verbose_name='LOI'
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name='Status'
+    )
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name='Attempts')
+    # Earliest time the job may be claimed: retry time while pending,
+    # lease expiry while running (a crashed worker's job is reclaimed)
+    run_after = models.DateTimeField(verbose_name='Run after')
+    last_error = models.TextField(blank=True, verbose_name='Last error')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='Created at')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='Updated at')
+
+    class Meta:
+        verbose_name = 'LOI PDF job'
+        verbose_name_plural = 'LOI PDF jobs'
+        ordering = ['run_after']
+        indexes = [
+            # Claim query: status IN (pending, running) AND run_after <= now
+            models.Index(fields=['status', 'run_after'], name='loi_pdfjob_claim_idx'),
+        ]
+
+    def __str__(self):
+        return f"PDF job for LOI {self.loi_id} ({self.status})"
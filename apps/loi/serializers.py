@@ -2,11 +2,13 @@
 Serializers for LOI model
 """
 from rest_framework import serializers
+from apps.core.fieldsets import SparseFieldsetMixin
 from .models import LOI
 
 
-class LOISerializer(serializers.ModelSerializer):
+class LOISerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer for LOI documents"""
+    fieldset_dependencies = {'is_pdf_ready': ('pdf_file',)}
 
     offer_id = serializers.IntegerField(source='offer.id', read_only=True)
     is_pdf_ready = serializers.BooleanField(read_only=True)
@@ -0,0 +1,189 @@
+"""
+Tests for LOI PDF rendering and job helpers
+"""
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from reportlab import rl_config
+
+from apps.accounts.models import User
+from apps.contents.models import Content
+from apps.offers.models import Offer
+
+from .jobs import LOI_PDF_MODE_SYNC, MAX_BACKOFF_SECONDS, enqueue_pdf, get_backoff, run_job
+from .models import LOI
+from .pdf_generator import generate_loi_pdf
+
+
+class LOIPDFJobTestCase(SimpleTestCase):
+    """Test retry scheduling and enqueue modes (no database required)"""
+
+    @override_settings(LOI_PDF_JOB_BACKOFF_SECONDS=30)
+    def test_backoff_doubles_and_is_capped(self):
+        """Test retry delays grow exponentially up to the cap"""
+        self.assertEqual(get_backoff(1), timedelta(seconds=30))
+        self.assertEqual(get_backoff(2), timedelta(seconds=60))
+        self.assertEqual(get_backoff(4), timedelta(seconds=240))
+        self.assertEqual(get_backoff(20), timedelta(seconds=MAX_BACKOFF_SECONDS))
+
+    @override_settings(LOI_PDF_MODE=LOI_PDF_MODE_SYNC)
+    def test_sync_mode_renders_immediately(self):
+        """Test sync mode renders in the caller instead of queueing a job"""
+        loi = mock.Mock()
+
+        self.assertIsNone(enqueue_pdf(loi))
+        loi.generate_pdf.assert_called_once_with()
+
+    def test_reclaimed_job_is_not_rendered(self):
+        """Test a job whose lease was lost to another worker is skipped"""
+        job = mock.Mock()
+
+        with mock.patch('apps.loi.jobs._renew_lease', return_value=False), \
+                mock.patch('apps.loi.jobs._finish') as finish:
+            self.assertIsNone(run_job(job))
+
+        job.loi.generate_pdf.assert_not_called()
+        finish.assert_not_called()
+
+    def test_lease_is_renewed_before_rendering(self):
+        """Test the lease is extended right before the PDF is rendered"""
+        job = mock.Mock()
+        calls = mock.Mock()
+        job.loi.generate_pdf.side_effect = lambda: calls.render()
+
+        with mock.patch('apps.loi.jobs._renew_lease', side_effect=lambda job: calls.renew() or True), \
+                mock.patch('apps.loi.jobs._finish'):
+            self.assertTrue(run_job(job))
+
+        self.assertEqual(calls.mock_calls, [mock.call.renew(), mock.call.render()])
+
+
+class LOIPDFGeneratorTestCase(SimpleTestCase):
+    """Test rendering with precompiled styles and cached boilerplate layout"""
+
+    def build_loi(self, **kwargs):
+        values = {
+            'document_number': 'LOI-2025-0001',
+            'buyer_company': 'Acme', 'buyer_country': 'US',
+            'producer_company': 'Studio', 'producer_country': 'KR',
+            'content_title': 'Pilot', 'content_description': 'Line one\nLine two',
+            'agreed_price': Decimal('1000.00'), 'currency': 'USD',
+            'created_at': datetime(2025, 6, 1, tzinfo=dt_timezone.utc),
+        }
+        values.update(kwargs)
+        return LOI(**values)
+
+    def test_repeated_renders_are_identical(self):
+        """Test reusing cached boilerplate does not change later documents"""
+        generated_at = datetime(2025, 6, 1, 12, 0, tzinfo=dt_timezone.utc)
+        with mock.patch.object(rl_config, 'invariant', 1):
+            first = generate_loi_pdf(self.build_loi(), generated_at=generated_at)
+            generate_loi_pdf(self.build_loi(content_description='Long text ' * 500), generated_at=generated_at)
+            again = generate_loi_pdf(self.build_loi(), generated_at=generated_at)
+
+        self.assertTrue(first.startswith(b'%PDF'))
+        self.assertEqual(first, again)
+
+
+class LOIDocumentNumberTestCase(SimpleTestCase):
+    """Test document number formatting"""
+
+    def test_numbers_past_9999_keep_all_digits(self):
+        """Test numbers are zero-padded to four digits but never truncated"""
+        self.assertEqual(LOI.format_document_number(2026, 7), 'LOI-2026-0007')
+        self.assertEqual(LOI.format_document_number(2026, 10000), 'LOI-2026-10000')
+
+
+class RegenerateLOIPDFsCommandTestCase(TransactionTestCase):
+    """
+    Test the parallel re-render command. TransactionTestCase: the command
+    closes database connections before forking its workers.
+    """
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        producer = User.objects.create_user(
+            username='studio', email='studio@example.com', password='password123', role=User.Role.CREATOR,
+        )
+        content = Content.objects.create(
+            producer=producer, title='Pilot', description='Pilot description',
+            genre_tags=['drama'], price=Decimal('1000.00'), duration_seconds=60, status='public',
+        )
+        self.cutoff = timezone.now() - timedelta(days=1)
+        generated = {
+            'never': None,
+            'stale': self.cutoff - timedelta(days=1),
+            'fresh': self.cutoff + timedelta(hours=1),
+        }
+        self.lois = {}
+        for number, (name, generated_at) in enumerate(generated.items(), start=1):
+            buyer = User.objects.create_user(
+                username=f'buyer-{name}', email=f'{name}@example.com', password='password123',
+                role=User.Role.BUYER,
+            )
+            offer = Offer.objects.create(content=content, buyer=buyer, offered_price=Decimal('900.00'))
+            self.lois[name] = LOI.objects.create(
+                offer=offer, document_number=f'LOI-2025-000{number}', buyer=buyer, producer=producer,
+                content_title='Pilot', content_description='Pilot description',
+                agreed_price=Decimal('900.00'), currency='USD',
+                buyer_company=name, buyer_country='US', producer_company='Studio', producer_country='KR',
+                pdf_generated_at=generated_at,
+            )
+
+    def regenerate(self, *args):
+        stdout = StringIO()
+        call_command(
+            'regenerate_loi_pdfs', '--workers', '1', '--chunk-size', '1',
+            '--stale-before', self.cutoff.isoformat(), *args, stdout=stdout, stderr=StringIO()
+        )
+        return stdout.getvalue()
+
+    def test_only_stale_pdfs_are_rendered_and_recorded_per_chunk(self):
+        """Test missing/stale PDFs are rendered; each chunk records its files and timestamps"""
+        output = self.regenerate()
+
+        self.assertIn('1 rendered, 0 failed', output)
+        self.assertIn('2 rendered, 0 failed', output)
+        self.assertIn('Regenerated 2 LOI PDFs', output)
+        for name in ('never', 'stale'):
+            loi = LOI.objects.get(pk=self.lois[name].pk)
+            self.assertGreater(loi.pdf_generated_at, self.cutoff)
+            self.assertEqual(loi.pdf_file.name, f'loi_pdfs/{loi.document_number}.pdf')
+            with open(os.path.join(self.media_root, loi.pdf_file.name), 'rb') as f:
+                self.assertTrue(f.read().startswith(b'%PDF'))
+        fresh = LOI.objects.get(pk=self.lois['fresh'].pk)
+        self.assertEqual(fresh.pdf_generated_at, self.lois['fresh'].pdf_generated_at)
+        self.assertFalse(fresh.pdf_file)
+
+    def test_rerun_with_same_stale_before_resumes(self):
+        """Test a second run with the same cutoff skips PDFs already regenerated"""
+        self.regenerate()
+
+        self.assertIn('Regenerated 0 LOI PDFs', self.regenerate())
+
+    def test_non_local_storage_is_rejected(self):
+        """Test storages without filesystem paths raise CommandError"""
+        storage = mock.Mock()
+        storage.path.side_effect = NotImplementedError
+
+        with mock.patch.object(LOI._meta.get_field('pdf_file'), 'storage', storage):
+            with self.assertRaises(CommandError):
+                self.regenerate()
+
+    def test_invalid_stale_before_is_rejected(self):
+        """Test an unparseable --stale-before raises CommandError"""
+        with self.assertRaises(CommandError):
+            call_command('regenerate_loi_pdfs', '--workers', '1', '--stale-before', 'yesterday')
@@ -1,3 +1,22 @@
 from django.contrib import admin
+from django.utils import timezone
 
-# 추후 구현
+from .models import OutboxEmail
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = ('subject', 'status', 'attempts', 'run_after', 'sent_at', 'created_at')
+    list_filter = ('status',)
+    search_fields = ('subject', 'recipients')
+    readonly_fields = ('attempts', 'last_error', 'sent_at', 'created_at', 'updated_at')
+    actions = ['retry_emails']
+
+    @admin.action(description='Retry selected emails now')
+    def retry_emails(self, request, queryset):
+        updated = queryset.exclude(status=OutboxEmail.Status.SENT).update(
+            status=OutboxEmail.Status.PENDING,
+            attempts=0,
+            run_after=timezone.now()
+        )
+        self.message_user(request, f'{updated} emails queued for retry.')
@@ -1,10 +1,16 @@
 """
 Email notification utilities
+
+Notifications are queued in the outbox (apps.notifications.outbox) and
+delivered by the send_queued_emails worker; password reset emails are sent
+immediately since the user is waiting for them.
 """
 from django.core.mail import send_mail
 from django.conf import settings
 from django.template.loader import render_to_string
 
+from .outbox import queue_email
+
 
 def send_new_offer_notification(offer):
     """
@@ -40,12 +46,10 @@ Best regards,
 ShortDeal Team
 """
 
-    send_mail(
+    queue_email(
         subject=subject,
         message=message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
         recipient_list=[producer.email],
-        fail_silently=False,
     )
 
 
@@ -80,12 +84,10 @@ Best regards,
 ShortDeal Team
 """
 
-    send_mail(
+    queue_email(
         subject=subject,
         message=message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
         recipient_list=[buyer.email],
-        fail_silently=False,
     )
 
 
@@ -117,12 +119,10 @@ Best regards,
 ShortDeal Team
 """
 
-    send_mail(
+    queue_email(
         subject=subject,
         message=message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
         recipient_list=[buyer.email],
-        fail_silently=False,
     )
 
 
@@ -151,12 +151,10 @@ Best regards,
 ShortDeal Team
 """
 
-    send_mail(
+    queue_email(
         subject=subject,
         message=buyer_message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
         recipient_list=[buyer.email],
-        fail_silently=False,
     )
 
     # Email to producer
@@ -175,12 +173,42 @@ Best regards,
 ShortDeal Team
 """
 
-    send_mail(
+    queue_email(
         subject=subject,
         message=producer_message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
         recipient_list=[producer.email],
-        fail_silently=False,
+    )
+
+
+def send_saved_search_alert(buyer, matches):
+    """
+    Send a buyer one email listing new contents matching their saved searches
+    """
+    subject = f"{len(matches)} New Content Match{'es' if len(matches) != 1 else ''} Your Saved Searches"
+
+    lines = '\n'.join(
+        f"- {match.content.title} ({match.content.currency} {match.content.price:,.2f})"
+        f" - matched '{match.saved_search}'"
+        for match in matches
+    )
+
+    message = f"""
+Hello {buyer.company_name or buyer.username},
+
+New content matching your saved searches has been published:
+
+{lines}
+
+Please log in to browse the new content.
+
+Best regards,
+ShortDeal Team
+"""
+
+    queue_email(
+        subject=subject,
+        message=message,
+        recipient_list=[buyer.email],
     )
 
 
@@ -0,0 +1,39 @@
+"""
+Worker delivering queued notification emails (see apps.notifications.outbox)
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.notifications.outbox import process_outbox
+
+
+class Command(BaseCommand):
+    help = 'Send queued emails in batches; runs until interrupted unless --once is given'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drain due emails and exit')
+        parser.add_argument('--batch-size', type=int, default=50, help='Emails sent per connection (default 50)')
+        parser.add_argument('--poll-interval', type=float, default=5.0, help='Seconds to wait when idle (default 5)')
+
+    def handle(self, *args, **options):
+        total_sent = total_failed = 0
+        try:
+            while True:
+                close_old_connections()
+                sent, failed = process_outbox(limit=options['batch_size'])
+                total_sent += sent
+                total_failed += failed
+                if sent or failed:
+                    self.stdout.write(f'Sent {sent} emails, {failed} failed')
+                elif options['once']:
+                    break
+                else:
+                    time.sleep(options['poll_interval'])
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Done: {total_sent} emails sent, {total_failed} failed attempts'
+        ))
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(max_length=255, verbose_name='Subject')),
+                ('body', models.TextField(verbose_name='Body')),
+                ('from_email', models.CharField(max_length=254, verbose_name='From')),
+                ('recipients', models.JSONField(default=list, verbose_name='Recipients')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('sent', 'Sent'), ('dead', 'Dead')], default='pending', max_length=10, verbose_name='Status')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='Attempts')),
+                ('run_after', models.DateTimeField(verbose_name='Run after')),
+                ('last_error', models.TextField(blank=True, verbose_name='Last error')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='Sent at')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated at')),
+            ],
+            options={
+                'verbose_name': 'Outbox email',
+                'verbose_name_plural': 'Outbox emails',
+                'ordering': ['run_after'],
+                'indexes': [models.Index(fields=['status', 'run_after'], name='outbox_email_claim_idx')],
+            },
+        ),
+    ]
@@ -1,4 +1,48 @@
+"""
+Outbox for notification emails (see apps.notifications.outbox)
+"""
 from django.db import models
 
 
-# 추후 구현
+class OutboxEmail(models.Model):
+    """
+    Email queued in the caller's transaction and delivered by the
+    send_queued_emails worker over one reused SMTP connection.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        SENDING = 'sending', 'Sending'
+        SENT = 'sent', 'Sent'
+        DEAD = 'dead', 'Dead'
+
+    subject = models.CharField(max_length=255, verbose_name='Subject')
+    body = models.TextField(verbose_name='Body')
+    from_email = models.CharField(max_length=254, verbose_name='From')
+    recipients = models.JSONField(default=list, verbose_name='Recipients')
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name='Status'
+    )
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name='Attempts')
+    # Earliest time the email may be claimed: retry time while pending,
+    # lease expiry while sending (a crashed worker's batch is reclaimed)
+    run_after = models.DateTimeField(verbose_name='Run after')
+    last_error = models.TextField(blank=True, verbose_name='Last error')
+    sent_at = models.DateTimeField(null=True, blank=True, verbose_name='Sent at')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='Created at')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='Updated at')
+
+    class Meta:
+        verbose_name = 'Outbox email'
+        verbose_name_plural = 'Outbox emails'
+        ordering = ['run_after']
+        indexes = [
+            # Claim query: status IN (pending, sending) AND run_after <= now
+            models.Index(fields=['status', 'run_after'], name='outbox_email_claim_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.recipients)} ({self.status})"
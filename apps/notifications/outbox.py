@@ -0,0 +1,187 @@
+"""
+Durable email outbox backed by the OutboxEmail table
+
+- queue_email(...): record an email in the caller's transaction (or send it
+  now with EMAIL_OUTBOX_MODE='sync')
+- claim_emails(limit): lease due emails with SELECT ... FOR UPDATE SKIP LOCKED
+- send_emails(emails): deliver a batch over one connection, renewing each
+  email's lease just before sending it and recording success, retry or
+  dead letter per email
+- process_outbox(limit): claim and send one batch (used by the worker command)
+
+Settings:
+    EMAIL_OUTBOX_MODE: 'queue' (default) or 'sync' (send inside the request)
+    EMAIL_OUTBOX_LEASE_SECONDS: lease per email; expired leases are reclaimed (default 300)
+    EMAIL_OUTBOX_MAX_ATTEMPTS: attempts before an email is marked dead (default 5)
+    EMAIL_OUTBOX_BACKOFF_SECONDS: first retry delay, doubled per attempt (default 60)
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection, send_mail
+from django.db import transaction
+from django.utils import timezone
+
+from .models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+EMAIL_OUTBOX_MODE_QUEUE = 'queue'
+EMAIL_OUTBOX_MODE_SYNC = 'sync'
+
+# Retry delays are capped at six hours
+MAX_BACKOFF_SECONDS = 6 * 3600
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def get_backoff(attempts):
+    """Delay before retrying after `attempts` failed attempts (exponential, capped)"""
+    base = _setting('EMAIL_OUTBOX_BACKOFF_SECONDS', 60)
+    return timedelta(seconds=min(base * 2 ** max(attempts - 1, 0), MAX_BACKOFF_SECONDS))
+
+
+def _lease_expiry():
+    return timezone.now() + timedelta(seconds=_setting('EMAIL_OUTBOX_LEASE_SECONDS', 300))
+
+
+def queue_email(subject, message, recipient_list, from_email=None):
+    """
+    Queue a plain-text email; it is sent only if the surrounding
+    transaction commits.
+    """
+    from_email = from_email or settings.DEFAULT_FROM_EMAIL
+    if _setting('EMAIL_OUTBOX_MODE', EMAIL_OUTBOX_MODE_QUEUE) == EMAIL_OUTBOX_MODE_SYNC:
+        send_mail(subject, message, from_email, recipient_list, fail_silently=False)
+        return None
+
+    # Savepoint, so a failed insert can be caught without breaking the caller's transaction
+    with transaction.atomic():
+        return OutboxEmail.objects.create(
+            subject=subject,
+            body=message,
+            from_email=from_email,
+            recipients=list(recipient_list),
+            run_after=timezone.now(),
+        )
+
+
+def claim_emails(limit=50):
+    """
+    Lease up to `limit` due emails: pending emails whose retry time has
+    come and sending emails whose lease expired. Rows locked by another
+    worker are skipped, so concurrent workers never send the same email.
+    """
+    now = timezone.now()
+    expiry = _lease_expiry()
+
+    with transaction.atomic():
+        emails = list(
+            OutboxEmail.objects.select_for_update(skip_locked=True).filter(
+                status__in=[OutboxEmail.Status.PENDING, OutboxEmail.Status.SENDING],
+                run_after__lte=now,
+            ).order_by('run_after')[:limit]
+        )
+        for email in emails:
+            email.status = OutboxEmail.Status.SENDING
+            email.attempts += 1
+            email.run_after = expiry
+        OutboxEmail.objects.bulk_update(emails, ['status', 'attempts', 'run_after'])
+    return emails
+
+
+def _renew_lease(email):
+    """
+    Extend the lease of a claimed email right before it is sent, so a slow
+    batch cannot outlive the leases of its later emails. Returns False when
+    the lease already expired and another worker re-claimed the email.
+    """
+    return OutboxEmail.objects.filter(
+        pk=email.pk,
+        status=OutboxEmail.Status.SENDING,
+        attempts=email.attempts,
+    ).update(run_after=_lease_expiry(), updated_at=timezone.now()) == 1
+
+
+def _finish(email, **fields):
+    """Record the outcome unless the lease expired and another worker re-claimed the email"""
+    fields['updated_at'] = timezone.now()
+    return OutboxEmail.objects.filter(
+        pk=email.pk,
+        status=OutboxEmail.Status.SENDING,
+        attempts=email.attempts,
+    ).update(**fields)
+
+
+def _record_failure(email, error):
+    max_attempts = _setting('EMAIL_OUTBOX_MAX_ATTEMPTS', 5)
+    if email.attempts >= max_attempts:
+        logger.error('Outbox email %s is dead after %s attempts: %s', email.pk, email.attempts, error)
+        _finish(email, status=OutboxEmail.Status.DEAD, last_error=str(error))
+    else:
+        logger.warning('Outbox email %s failed (attempt %s): %s', email.pk, email.attempts, error)
+        _finish(
+            email,
+            status=OutboxEmail.Status.PENDING,
+            run_after=timezone.now() + get_backoff(email.attempts),
+            last_error=str(error),
+        )
+
+
+def send_emails(emails):
+    """
+    Deliver leased emails over one connection; each email is sent and
+    recorded on its own, so one bad address does not fail the batch.
+    Emails whose lease was lost to another worker are skipped.
+
+    Returns:
+        tuple: (sent, failed)
+    """
+    if not emails:
+        return 0, 0
+
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as e:
+        for email in emails:
+            _record_failure(email, e)
+        return 0, len(emails)
+
+    sent = failed = 0
+    try:
+        for email in emails:
+            if not _renew_lease(email):
+                logger.info('Outbox email %s was re-claimed by another worker; skipping', email.pk)
+                continue
+            message = EmailMessage(
+                subject=email.subject,
+                body=email.body,
+                from_email=email.from_email,
+                to=email.recipients,
+                connection=connection,
+            )
+            try:
+                connection.send_messages([message])
+            except Exception as e:
+                _record_failure(email, e)
+                failed += 1
+            else:
+                _finish(email, status=OutboxEmail.Status.SENT, sent_at=timezone.now(), last_error='')
+                sent += 1
+    finally:
+        connection.close()
+    return sent, failed
+
+
+def process_outbox(limit=50):
+    """
+    Claim and send one batch of emails.
+
+    Returns:
+        tuple: (sent, failed)
+    """
+    return send_emails(claim_emails(limit))
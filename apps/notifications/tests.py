@@ -0,0 +1,92 @@
+"""
+Tests for the notification email outbox
+"""
+from datetime import timedelta
+from unittest import mock
+
+from django.core import mail
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from .models import OutboxEmail
+from .outbox import (
+    EMAIL_OUTBOX_MODE_SYNC, MAX_BACKOFF_SECONDS, claim_emails, get_backoff, queue_email, send_emails,
+)
+
+
+class OutboxTestCase(SimpleTestCase):
+    """Test retry scheduling, sync mode and batch delivery (no database required)"""
+
+    def build_email(self, pk, attempts=1):
+        return OutboxEmail(
+            pk=pk, subject=f'Subject {pk}', body='Body', from_email='noreply@example.com',
+            recipients=[f'user{pk}@example.com'], attempts=attempts,
+        )
+
+    @override_settings(EMAIL_OUTBOX_BACKOFF_SECONDS=60)
+    def test_backoff_doubles_and_is_capped(self):
+        """Test retry delays grow exponentially up to the cap"""
+        self.assertEqual(get_backoff(1), timedelta(seconds=60))
+        self.assertEqual(get_backoff(3), timedelta(seconds=240))
+        self.assertEqual(get_backoff(30), timedelta(seconds=MAX_BACKOFF_SECONDS))
+
+    @override_settings(EMAIL_OUTBOX_MODE=EMAIL_OUTBOX_MODE_SYNC)
+    def test_sync_mode_sends_immediately(self):
+        """Test sync mode sends in the caller instead of queueing"""
+        self.assertIsNone(queue_email('Hello', 'Body', ['user@example.com']))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['user@example.com'])
+
+    @override_settings(EMAIL_OUTBOX_MAX_ATTEMPTS=2)
+    def test_batch_uses_one_connection_and_records_each_outcome(self):
+        """Test one connection per batch; failures are retried or dead-lettered per email"""
+        connection = mock.Mock()
+        connection.send_messages.side_effect = [1, OSError('refused'), OSError('refused')]
+        emails = [self.build_email(1), self.build_email(2, attempts=1), self.build_email(3, attempts=2)]
+
+        with mock.patch('apps.notifications.outbox.get_connection', return_value=connection) as get_connection, \
+                mock.patch('apps.notifications.outbox._renew_lease', return_value=True), \
+                mock.patch('apps.notifications.outbox._finish') as finish:
+            self.assertEqual(send_emails(emails), (1, 2))
+
+        get_connection.assert_called_once()
+        connection.open.assert_called_once_with()
+        connection.close.assert_called_once_with()
+        statuses = [call.kwargs['status'] for call in finish.call_args_list]
+        self.assertEqual(statuses, [OutboxEmail.Status.SENT, OutboxEmail.Status.PENDING, OutboxEmail.Status.DEAD])
+
+
+class OutboxLeaseTestCase(TestCase):
+    """Test emails are renewed one by one and never sent under a lost lease"""
+
+    def setUp(self):
+        for i in range(2):
+            queue_email(f'Subject {i}', 'Body', [f'user{i}@example.com'])
+
+    def test_emails_reclaimed_by_another_worker_are_skipped(self):
+        """Test a slow worker does not resend emails re-claimed after their lease expired"""
+        slow_batch = claim_emails()
+        # The lease of the second email runs out while the first is being sent
+        OutboxEmail.objects.filter(pk=slow_batch[1].pk).update(run_after=timezone.now())
+        reclaimed = claim_emails()
+
+        self.assertEqual([email.pk for email in reclaimed], [slow_batch[1].pk])
+        self.assertEqual(send_emails(slow_batch), (1, 0))
+        self.assertEqual(send_emails(reclaimed), (1, 0))
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), ['user0@example.com', 'user1@example.com'])
+        self.assertEqual(
+            OutboxEmail.objects.filter(status=OutboxEmail.Status.SENT).count(), 2
+        )
+
+    @override_settings(EMAIL_OUTBOX_LEASE_SECONDS=600)
+    def test_lease_is_renewed_before_each_send(self):
+        """Test an email's lease starts when it is sent, not when the batch was claimed"""
+        batch = claim_emails()
+        OutboxEmail.objects.update(run_after=timezone.now())
+        sent_at = timezone.now()
+
+        with mock.patch('apps.notifications.outbox._finish'):
+            send_emails(batch)
+
+        for run_after in OutboxEmail.objects.values_list('run_after', flat=True):
+            self.assertGreaterEqual(run_after, sent_at + timedelta(seconds=600))
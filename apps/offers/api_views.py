@@ -1,15 +1,23 @@
 """
 API views for Offer management
 """
+from django.db import transaction
 from rest_framework import status
 from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 
+from apps.core.fieldsets import FIELDSET_PARAMETERS, FieldsetError, defer_unselected, parse_fieldset
 from apps.core.response import success_response, error_response, paginated_response
 from apps.core.permissions import IsBuyer, IsOnboarded
 from apps.core.constants import OFFER_STATUS_PENDING
 from .models import Offer
-from .serializers import OfferBuyerSerializer, OfferProducerSerializer, OfferResponseSerializer
+from .serializers import (
+    OfferBuyerSerializer,
+    OfferBuyerValuesSerializer,
+    OfferProducerSerializer,
+    OfferProducerValuesSerializer,
+    OfferResponseSerializer
+)
 
 
 @extend_schema(tags=['Offers - Buyer'])
@@ -17,9 +25,14 @@ class BuyerOfferListCreateView(APIView):
     """Buyer's offer list and create"""
     permission_classes = [IsBuyer, IsOnboarded]
 
-    @extend_schema(responses={200: OfferBuyerSerializer(many=True)})
+    @extend_schema(parameters=FIELDSET_PARAMETERS, responses={200: OfferBuyerSerializer(many=True)})
     def get(self, request):
         """List all offers from current buyer"""
+        try:
+            fields = parse_fieldset(request, OfferBuyerSerializer)
+        except FieldsetError as e:
+            return error_response(message=str(e), status_code=status.HTTP_400_BAD_REQUEST)
+
         queryset = Offer.objects.filter(buyer=request.user).select_related(
             'content', 'content__producer'
         ).order_by('-created_at')
@@ -31,9 +44,10 @@ class BuyerOfferListCreateView(APIView):
 
         return paginated_response(
             queryset,
-            OfferBuyerSerializer,
+            OfferBuyerValuesSerializer,
             request,
-            message="Offers retrieved successfully"
+            message="Offers retrieved successfully",
+            fields=fields
         )
 
     @extend_schema(
@@ -45,7 +59,9 @@ class BuyerOfferListCreateView(APIView):
         serializer = OfferBuyerSerializer(data=request.data, context={'request': request})
 
         if serializer.is_valid():
-            offer = serializer.save(buyer=request.user)
+            # The new-offer email (NTF-001) is queued in the same transaction
+            with transaction.atomic():
+                offer = serializer.save(buyer=request.user)
             return success_response(
                 data=OfferBuyerSerializer(offer).data,
                 message="Offer created successfully",
@@ -64,16 +80,33 @@ class BuyerOfferDetailView(APIView):
     """Buyer's offer detail"""
     permission_classes = [IsBuyer, IsOnboarded]
 
-    @extend_schema(responses={200: OfferBuyerSerializer, 404: OpenApiResponse(description='Not found')})
+    @extend_schema(
+        parameters=FIELDSET_PARAMETERS,
+        responses={
+            200: OfferBuyerSerializer,
+            400: OpenApiResponse(description='Unknown fields'),
+            404: OpenApiResponse(description='Not found')
+        }
+    )
     def get(self, request, pk):
         """Get offer detail"""
         try:
-            offer = Offer.objects.select_related('content', 'content__producer').get(pk=pk, buyer=request.user)
+            fields = parse_fieldset(request, OfferBuyerSerializer)
+        except FieldsetError as e:
+            return error_response(message=str(e), status_code=status.HTTP_400_BAD_REQUEST)
+
+        queryset = defer_unselected(
+            Offer.objects.select_related('content', 'content__producer'),
+            OfferBuyerSerializer,
+            fields
+        )
+        try:
+            offer = queryset.get(pk=pk, buyer=request.user)
         except Offer.DoesNotExist:
             return error_response(message="Offer not found", status_code=status.HTTP_404_NOT_FOUND)
 
         return success_response(
-            data=OfferBuyerSerializer(offer).data,
+            data=OfferBuyerSerializer(offer, fields=fields).data,
             message="Offer retrieved successfully"
         )
 
@@ -83,9 +116,14 @@ class ProducerOfferListView(APIView):
     """Producer's offer list"""
     permission_classes = [IsOnboarded]
 
-    @extend_schema(responses={200: OfferProducerSerializer(many=True)})
+    @extend_schema(parameters=FIELDSET_PARAMETERS, responses={200: OfferProducerSerializer(many=True)})
     def get(self, request):
         """List all offers for producer's contents"""
+        try:
+            fields = parse_fieldset(request, OfferProducerSerializer)
+        except FieldsetError as e:
+            return error_response(message=str(e), status_code=status.HTTP_400_BAD_REQUEST)
+
         queryset = Offer.objects.filter(
             content__producer=request.user
         ).select_related('buyer', 'content').order_by('-created_at')
@@ -97,9 +135,10 @@ class ProducerOfferListView(APIView):
 
         return paginated_response(
             queryset,
-            OfferProducerSerializer,
+            OfferProducerValuesSerializer,
             request,
-            message="Offers retrieved successfully"
+            message="Offers retrieved successfully",
+            fields=fields
         )
 
 
@@ -108,16 +147,33 @@ class ProducerOfferDetailView(APIView):
     """Producer's offer detail"""
     permission_classes = [IsOnboarded]
 
-    @extend_schema(responses={200: OfferProducerSerializer, 404: OpenApiResponse(description='Not found')})
+    @extend_schema(
+        parameters=FIELDSET_PARAMETERS,
+        responses={
+            200: OfferProducerSerializer,
+            400: OpenApiResponse(description='Unknown fields'),
+            404: OpenApiResponse(description='Not found')
+        }
+    )
     def get(self, request, pk):
         """Get offer detail"""
         try:
-            offer = Offer.objects.select_related('buyer', 'content').get(pk=pk, content__producer=request.user)
+            fields = parse_fieldset(request, OfferProducerSerializer)
+        except FieldsetError as e:
+            return error_response(message=str(e), status_code=status.HTTP_400_BAD_REQUEST)
+
+        queryset = defer_unselected(
+            Offer.objects.select_related('buyer', 'content'),
+            OfferProducerSerializer,
+            fields
+        )
+        try:
+            offer = queryset.get(pk=pk, content__producer=request.user)
         except Offer.DoesNotExist:
             return error_response(message="Offer not found", status_code=status.HTTP_404_NOT_FOUND)
 
         return success_response(
-            data=OfferProducerSerializer(offer).data,
+            data=OfferProducerSerializer(offer, fields=fields).data,
             message="Offer retrieved successfully"
         )
 
@@ -1,7 +1,7 @@
 """
 Offer model for buyer-producer negotiations
 """
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta
@@ -145,14 +145,16 @@ class Offer(models.Model):
         self.status = OFFER_STATUS_ACCEPTED
         self.responded_at = timezone.now()
         self.producer_response = producer_response
-        self.save(update_fields=['status', 'responded_at', 'producer_response', 'updated_at'])
-
-        # Send email notification (NTF-002)
         from apps.notifications.emails import send_offer_accepted_notification
-        try:
-            send_offer_accepted_notification(self)
-        except Exception:
-            pass  # Don't fail offer acceptance if email fails
+        # The email is queued in the outbox only if the status change commits
+        with transaction.atomic():
+            self.save(update_fields=['status', 'responded_at', 'producer_response', 'updated_at'])
+
+            # Send email notification (NTF-002)
+            try:
+                send_offer_accepted_notification(self)
+            except Exception:
+                pass  # Don't fail offer acceptance if email fails
 
     def reject(self, producer_response=''):
         """Reject this offer"""
@@ -162,14 +164,16 @@ class Offer(models.Model):
         self.status = OFFER_STATUS_REJECTED
         self.responded_at = timezone.now()
         self.producer_response = producer_response
-        self.save(update_fields=['status', 'responded_at', 'producer_response', 'updated_at'])
-
-        # Send email notification (NTF-003)
         from apps.notifications.emails import send_offer_rejected_notification
-        try:
-            send_offer_rejected_notification(self)
-        except Exception:
-            pass  # Don't fail offer rejection if email fails
+        # The email is queued in the outbox only if the status change commits
+        with transaction.atomic():
+            self.save(update_fields=['status', 'responded_at', 'producer_response', 'updated_at'])
+
+            # Send email notification (NTF-003)
+            try:
+                send_offer_rejected_notification(self)
+            except Exception:
+                pass  # Don't fail offer rejection if email fails
 
     def mark_as_expired(self):
         """Mark offer as expired (called by scheduled task)"""
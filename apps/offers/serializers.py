@@ -4,9 +4,11 @@ Serializers for Offer model
 from rest_framework import serializers
 from .models import Offer
 from apps.contents.serializers import ContentPublicSerializer
+from apps.core.fieldsets import SparseFieldsetMixin
+from apps.core.serializers import ValuesSerializer
 
 
-class OfferBuyerSerializer(serializers.ModelSerializer):
+class OfferBuyerSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer for buyer's offer operations"""
 
     content_title = serializers.CharField(source='content.title', read_only=True)
@@ -42,7 +44,7 @@ class OfferBuyerSerializer(serializers.ModelSerializer):
         return attrs
 
 
-class OfferProducerSerializer(serializers.ModelSerializer):
+class OfferProducerSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer for producer's offer view"""
 
     buyer_name = serializers.CharField(source='buyer.company_name', read_only=True)
@@ -62,6 +64,16 @@ class OfferProducerSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+class OfferBuyerValuesSerializer(ValuesSerializer):
+    """Fast read-only list path with the same output as OfferBuyerSerializer"""
+    serializer_class = OfferBuyerSerializer
+
+
+class OfferProducerValuesSerializer(ValuesSerializer):
+    """Fast read-only list path with the same output as OfferProducerSerializer"""
+    serializer_class = OfferProducerSerializer
+
+
 class OfferResponseSerializer(serializers.Serializer):
     """Serializer for producer's accept/reject response"""
 
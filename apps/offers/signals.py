@@ -1,8 +1,10 @@
 """
-Signal handlers for Offer notifications
+Signal handlers for Offer notifications and page cache invalidation
 """
 from django.db.models.signals import post_save
 from django.dispatch import receiver
+from apps.core.constants import OFFER_STATUS_ACCEPTED
+from apps.core.page_cache import invalidate_page_cache
 from .models import Offer
 
 
@@ -17,3 +19,13 @@ def send_new_offer_notification(sender, instance, created, **kwargs):
             send_email(instance)
         except Exception:
             pass  # Don't fail offer creation if email fails
+
+
+@receiver(post_save, sender=Offer)
+def invalidate_pages_on_acceptance(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Accepted offers change what anonymous content pages show"""
+    if raw or instance.status != OFFER_STATUS_ACCEPTED:
+        return
+    if update_fields is not None and 'status' not in update_fields:
+        return
+    invalidate_page_cache()
@@ -5,7 +5,7 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.core.paginator import Paginator
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from .models import Offer
 from apps.contents.models import Content
 from apps.core.constants import CONTENT_STATUS_PUBLIC, OFFER_STATUS_PENDING
@@ -91,14 +91,16 @@ def offer_create_view(request, content_id):
         else:
             # Create offer
             try:
-                offer = Offer.objects.create(
-                    content=content,
-                    buyer=request.user,
-                    offered_price=offered_price,
-                    currency=content.currency,  # Match content currency
-                    message=message_text,
-                    validity_days=validity_days
-                )
+                # The new-offer email (NTF-001) is queued in the same transaction
+                with transaction.atomic():
+                    offer = Offer.objects.create(
+                        content=content,
+                        buyer=request.user,
+                        offered_price=offered_price,
+                        currency=content.currency,  # Match content currency
+                        message=message_text,
+                        validity_days=validity_days
+                    )
 
                 messages.success(
                     request,
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+"""
+Benchmark: LOI PDF rendering, per-call styles vs precompiled styles/boilerplate
+
+Renders the same unsaved LOI with a copy of the previous generate_loi_pdf
+(styles, table style and fixed paragraphs rebuilt on every call) and with
+apps.loi.pdf_generator, and reports PDFs per second. No database is needed.
+Also checks that both render byte-identical PDFs (ReportLab invariant mode).
+
+Usage:
+    python scripts/benchmark_loi_pdf.py [--iterations N]
+"""
+import argparse
+import os
+import sys
+import timeit
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from io import BytesIO
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'shortdeal.settings.local')
+
+import django  # noqa: E402
+
+django.setup()
+
+from reportlab import rl_config  # noqa: E402
+from reportlab.lib import colors  # noqa: E402
+from reportlab.lib.enums import TA_CENTER, TA_LEFT  # noqa: E402
+from reportlab.lib.pagesizes import A4  # noqa: E402
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle  # noqa: E402
+from reportlab.lib.units import inch  # noqa: E402
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle  # noqa: E402
+
+from apps.loi.models import LOI  # noqa: E402
+from apps.loi.pdf_generator import generate_loi_pdf  # noqa: E402
+
+GENERATED_AT = datetime(2025, 6, 1, 12, 30, tzinfo=dt_timezone.utc)
+
+
+def legacy_generate_loi_pdf(loi, generated_at):
+    """generate_loi_pdf before styles and boilerplate were precompiled"""
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=0.5*inch, bottomMargin=0.5*inch)
+    elements = []
+
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle', parent=styles['Heading1'], fontSize=24, textColor=colors.HexColor('#1a1a1a'),
+        spaceAfter=30, alignment=TA_CENTER, fontName='Helvetica-Bold'
+    )
+    heading_style = ParagraphStyle(
+        'CustomHeading', parent=styles['Heading2'], fontSize=14, textColor=colors.HexColor('#333333'),
+        spaceAfter=12, fontName='Helvetica-Bold'
+    )
+    normal_style = ParagraphStyle(
+        'CustomNormal', parent=styles['Normal'], fontSize=10, textColor=colors.HexColor('#333333'),
+        spaceAfter=6, alignment=TA_LEFT
+    )
+
+    elements.append(Paragraph("LETTER OF INTENT", title_style))
+    elements.append(Spacer(1, 0.3*inch))
+    elements.append(Paragraph(f"<b>Document Number:</b> {loi.document_number}", normal_style))
+    elements.append(Spacer(1, 0.2*inch))
+    elements.append(Paragraph(f"<b>Date:</b> {loi.created_at.strftime('%B %d, %Y')}", normal_style))
+    elements.append(Spacer(1, 0.3*inch))
+
+    elements.append(Paragraph("PARTIES", heading_style))
+    parties_table = Table([
+        ['Party', 'Company', 'Country'],
+        ['Buyer', loi.buyer_company, loi.buyer_country],
+        ['Producer', loi.producer_company, loi.producer_country],
+    ], colWidths=[1.5*inch, 3*inch, 2*inch])
+    parties_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f0f0f0')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#333333')),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 11),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('TOPPADDING', (0, 1), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ]))
+    elements.append(parties_table)
+    elements.append(Spacer(1, 0.3*inch))
+
+    elements.append(Paragraph("CONTENT DETAILS", heading_style))
+    elements.append(Paragraph(f"<b>Title:</b> {loi.content_title}", normal_style))
+    elements.append(Spacer(1, 0.1*inch))
+    elements.append(Paragraph("<b>Description:</b>", normal_style))
+    elements.append(Paragraph(loi.content_description.replace('\n', '<br/>'), normal_style))
+    elements.append(Spacer(1, 0.3*inch))
+
+    elements.append(Paragraph("DEAL TERMS", heading_style))
+    elements.append(Paragraph(f"<b>Agreed Price:</b> {loi.currency} {loi.agreed_price:,.2f}", normal_style))
+    elements.append(Spacer(1, 0.4*inch))
+
+    agreement_text = """
+    This Letter of Intent confirms the mutual interest of the above parties to proceed with
+    the proposed content licensing agreement under the terms outlined above. This document
+    represents a preliminary understanding and is subject to the execution of a formal agreement.
+    """
+    elements.append(Paragraph(agreement_text, normal_style))
+    elements.append(Spacer(1, 0.5*inch))
+
+    footer_style = ParagraphStyle(
+        'Footer', parent=styles['Normal'], fontSize=8, textColor=colors.grey, alignment=TA_CENTER
+    )
+    footer_text = f"Generated on {generated_at.strftime('%B %d, %Y at %I:%M %p')}"
+    elements.append(Paragraph(footer_text, footer_style))
+
+    doc.build(elements)
+    pdf_data = buffer.getvalue()
+    buffer.close()
+    return pdf_data
+
+
+def build_loi():
+    return LOI(
+        document_number='LOI-2025-0001',
+        buyer_company='Acme Distribution', buyer_country='US',
+        producer_company='Studio Seoul', producer_country='KR',
+        content_title='Short drama pilot',
+        content_description='A short description of the content.\n' * 8,
+        agreed_price=Decimal('12500.00'), currency='USD',
+        created_at=GENERATED_AT,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    # Fixed document ids and dates, so outputs can be compared byte for byte
+    rl_config.invariant = 1
+    loi = build_loi()
+
+    def before():
+        return legacy_generate_loi_pdf(loi, GENERATED_AT)
+
+    def after():
+        return generate_loi_pdf(loi, generated_at=GENERATED_AT)
+
+    if before() != after():
+        sys.exit('Output mismatch between legacy and current renderer')
+
+    slow = timeit.timeit(before, number=args.iterations)
+    fast = timeit.timeit(after, number=args.iterations)
+    print(f"{'renderer':>10} {'ms/PDF':>8} {'PDFs/s':>8}")
+    print(f"{'before':>10} {slow / args.iterations * 1000:>8.3f} {args.iterations / slow:>8.1f}")
+    print(f"{'after':>10} {fast / args.iterations * 1000:>8.3f} {args.iterations / fast:>8.1f}")
+    print(f'speedup: {slow / fast:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
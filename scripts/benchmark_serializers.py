@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+"""
+Benchmark: ModelSerializer vs values-based fast path for list pages
+
+Emulates what the ORM does per row for each path (model instances via
+Model.from_db with a select_related producer, vs dicts as built by
+.values()) and times serialization of 20- and 100-item pages. No database
+is needed. Also checks that both paths render byte-identical JSON.
+
+Usage:
+    python scripts/benchmark_serializers.py [--iterations N]
+"""
+import argparse
+import os
+import sys
+import timeit
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'shortdeal.settings.local')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db.models.fields.files import FieldFile  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from apps.accounts.models import User  # noqa: E402
+from apps.contents.models import Content  # noqa: E402
+from apps.contents.serializers import ContentPublicSerializer, ContentPublicValuesSerializer  # noqa: E402
+
+PAGE_SIZES = (20, 100)
+CREATED_AT = datetime(2025, 6, 1, 12, 30, tzinfo=dt_timezone.utc)
+
+
+def producer_row(i):
+    """Column values for a producer, in concrete field order"""
+    values = {
+        'id': 1000 + i, 'password': '', 'last_login': None, 'is_superuser': False,
+        'username': f'producer{i}', 'first_name': '', 'last_name': '', 'email': f'p{i}@example.com',
+        'is_staff': False, 'is_active': True, 'date_joined': CREATED_AT,
+        'role': 'creator', 'company_name': f'Studio {i}', 'country': 'KR',
+        'booth_slug': f'studio-{i}',
+    }
+    return [values.get(f.attname, f.get_default()) for f in User._meta.concrete_fields]
+
+
+def content_row(i):
+    """Column values for a content, in concrete field order"""
+    values = {
+        'id': i, 'producer_id': 1000 + i, 'title': f'Content title {i}',
+        'description': 'A short description ' * 5, 'poster': f'posters/{i}.jpg',
+        'teaser_video': '', 'rating': 'all', 'genre_tags': ['drama', 'romance'],
+        'price': Decimal('1234.50'), 'currency': 'USD', 'price_usd': Decimal('1234.50'),
+        'duration_seconds': 90, 'release_target': date(2025, 12, 1), 'status': 'public',
+        'view_count': i * 3, 'created_at': CREATED_AT - timedelta(hours=i),
+        'updated_at': CREATED_AT,
+    }
+    return [values.get(f.attname, f.get_default()) for f in Content._meta.concrete_fields]
+
+
+def build_instances(size):
+    """Model instances as built by Content.objects.select_related('producer')"""
+    content_fields = [f.attname for f in Content._meta.concrete_fields]
+    user_fields = [f.attname for f in User._meta.concrete_fields]
+    contents = []
+    for i in range(size):
+        content = Content.from_db('default', content_fields, content_row(i))
+        content._state.fields_cache['producer'] = User.from_db('default', user_fields, producer_row(i))
+        contents.append(content)
+    return contents
+
+
+def build_rows(size):
+    """Dicts as built by ContentPublicValuesSerializer.prepare_queryset(...).values()"""
+    rows = []
+    for content in build_instances(size):
+        row = {}
+        for _, lookup, _ in ContentPublicValuesSerializer.get_plan():
+            value = content
+            for attr in lookup.split('__'):
+                value = getattr(value, attr)
+            row[lookup] = value.name if isinstance(value, FieldFile) else value
+        rows.append(tuple(row.items()))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    renderer = JSONRenderer()
+    print(f"{'page':>6} {'serializer (ms)':>16} {'values (ms)':>12} {'speedup':>8}")
+    for size in PAGE_SIZES:
+        content_fields = [f.attname for f in Content._meta.concrete_fields]
+        user_fields = [f.attname for f in User._meta.concrete_fields]
+        raw_contents = [content_row(i) for i in range(size)]
+        raw_producers = [producer_row(i) for i in range(size)]
+        raw_values = build_rows(size)
+
+        def model_path():
+            page = []
+            for content_values, producer_values in zip(raw_contents, raw_producers):
+                content = Content.from_db('default', content_fields, content_values)
+                content._state.fields_cache['producer'] = User.from_db('default', user_fields, producer_values)
+                page.append(content)
+            return renderer.render(ContentPublicSerializer(page, many=True).data)
+
+        def values_path():
+            page = [dict(row) for row in raw_values]
+            return renderer.render(ContentPublicValuesSerializer(page, many=True).data)
+
+        if model_path() != values_path():
+            sys.exit(f'Output mismatch for page size {size}')
+
+        slow = timeit.timeit(model_path, number=args.iterations) / args.iterations * 1000
+        fast = timeit.timeit(values_path, number=args.iterations) / args.iterations * 1000
+        print(f'{size:>6} {slow:>16.3f} {fast:>12.3f} {slow / fast:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -22,6 +22,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     # Third party
     'rest_framework',
@@ -39,6 +40,7 @@ INSTALLED_APPS = [
     'apps.offers',
     'apps.loi',
     'apps.notifications',
+    'apps.analytics',
 ]
 
 MIDDLEWARE = [
@@ -119,6 +121,53 @@ LOGOUT_REDIRECT_URL = 'home'
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 DEFAULT_FROM_EMAIL = 'noreply@shortdeal.com'
 
+# Cache (Redis when REDIS_URL is set; per-process local memory otherwise)
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Anonymous full-page cache (apps.core.page_cache); 0 disables
+PAGE_CACHE_TIMEOUT = int(os.getenv('PAGE_CACHE_TIMEOUT', 120))
+
+# Serialized detail payloads (apps.core.object_cache); 0 disables
+OBJECT_CACHE_TIMEOUT = int(os.getenv('OBJECT_CACHE_TIMEOUT', 300))
+OBJECT_CACHE_LOCAL_SIZE = int(os.getenv('OBJECT_CACHE_LOCAL_SIZE', 256))
+# Known-missing content ids / booth slugs (404s) are remembered this long
+NEGATIVE_CACHE_TIMEOUT = int(os.getenv('NEGATIVE_CACHE_TIMEOUT', 60))
+
+# View counters (apps.core.view_counter)
+# 'buffered' batches view_count updates; 'sync' writes one UPDATE per view
+VIEW_COUNTER_MODE = os.getenv('VIEW_COUNTER_MODE', 'buffered')
+VIEW_COUNTER_FLUSH_INTERVAL = int(os.getenv('VIEW_COUNTER_FLUSH_INTERVAL', 30))
+
+# Reverse proxies in front of the app that append to X-Forwarded-For
+# (apps.analytics unique viewers); 0 identifies clients by REMOTE_ADDR
+TRUSTED_PROXY_COUNT = int(os.getenv('TRUSTED_PROXY_COUNT', 0))
+
+# LOI PDF rendering (apps.loi.jobs)
+# 'queue' renders in the process_loi_pdf_jobs worker; 'sync' renders inside the request
+LOI_PDF_MODE = os.getenv('LOI_PDF_MODE', 'queue')
+LOI_PDF_JOB_LEASE_SECONDS = int(os.getenv('LOI_PDF_JOB_LEASE_SECONDS', 300))
+LOI_PDF_JOB_MAX_ATTEMPTS = int(os.getenv('LOI_PDF_JOB_MAX_ATTEMPTS', 5))
+LOI_PDF_JOB_BACKOFF_SECONDS = int(os.getenv('LOI_PDF_JOB_BACKOFF_SECONDS', 30))
+
+# Notification email outbox (apps.notifications.outbox)
+# 'queue' sends from the send_queued_emails worker; 'sync' sends inside the request
+EMAIL_OUTBOX_MODE = os.getenv('EMAIL_OUTBOX_MODE', 'queue')
+EMAIL_OUTBOX_LEASE_SECONDS = int(os.getenv('EMAIL_OUTBOX_LEASE_SECONDS', 300))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv('EMAIL_OUTBOX_MAX_ATTEMPTS', 5))
+EMAIL_OUTBOX_BACKOFF_SECONDS = int(os.getenv('EMAIL_OUTBOX_BACKOFF_SECONDS', 60))
+
 # Django REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
@@ -128,6 +177,10 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'apps.core.renderers.FastJSONRenderer',  # orjson with stdlib fallback
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'EXCEPTION_HANDLER': 'apps.core.exceptions.custom_exception_handler',
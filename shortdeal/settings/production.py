@@ -43,6 +43,8 @@ DATABASES = {
 SECURE_SSL_REDIRECT = False
 # Trust Railway's proxy headers
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
+# Railway's edge proxy appends the client address to X-Forwarded-For
+TRUSTED_PROXY_COUNT = int(os.getenv('TRUSTED_PROXY_COUNT', 1))
 
 SESSION_COOKIE_SECURE = True
 CSRF_COOKIE_SECURE = True
@@ -6,10 +6,12 @@ from django.views.generic import TemplateView
 from django.views.static import serve
 from django.views.i18n import set_language
 
+from apps.core.page_cache import cache_anonymous_page
+
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('', TemplateView.as_view(template_name='home.html'), name='home'),
+    path('', cache_anonymous_page(TemplateView.as_view(template_name='home.html')), name='home'),
 
     # Language switcher
     path('i18n/setlang/', set_language, name='set_language'),